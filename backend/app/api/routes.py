@@ -1,17 +1,23 @@
 """API route definitions for the backend service."""
 
+from collections.abc import AsyncIterator
+import json
 from typing import Annotated
 
-from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.responses import Response
 
-from app.api.schemas import AdminRequest
+from app.api.schemas import AdminRequest, CatalogResponse, ScheduleRequest
+from app.catalog.service import get_catalog_index
 from app.core.errors import AppError
 from app.core.constants import RequestType
+from app.core.settings import get_settings
 from app.services.admin_auth import verify_admin_secret
 from app.services.admin_handler import handle_admin_action
+from app.core.progress import ProgressEvent, get_progress_bus
 from app.services.request_handler import handle_request
+from app.schedule.service import CourseRequest, ScheduleQuery, find_schedules
 
 router = APIRouter()
 
@@ -37,6 +43,165 @@ def run_musts() -> Response:
     return JSONResponse(content=model.model_dump(mode="json"), status_code=status_code)
 
 
+def _catalog_response(data: object, *, found: bool = True, what: str = "Result") -> Response:
+    """Build a catalog JSON response, mapping missing results to 404 and load errors to 503."""
+    if not found:
+        model = CatalogResponse(status="NOT_FOUND", message=f"{what} not found")
+        return JSONResponse(content=model.model_dump(mode="json"), status_code=404)
+    model = CatalogResponse(status="SUCCESS", message="OK", data=data)
+    return JSONResponse(content=model.model_dump(mode="json"), status_code=200)
+
+
+def _catalog_unavailable(err: AppError) -> Response:
+    """Map catalog index load failures to HTTP 503."""
+    model = CatalogResponse(status="UNAVAILABLE", message=err.message)
+    return JSONResponse(content=model.model_dump(mode="json"), status_code=503)
+
+
+@router.get("/catalog/courses/{code}")
+def catalog_course(code: str) -> Response:
+    """Return one course with sections by numeric (5710140) or prefixed (CENG140) code."""
+    try:
+        course = get_catalog_index().course(code)
+    except AppError as err:
+        return _catalog_unavailable(err)
+    return _catalog_response(course, found=course is not None, what="Course")
+
+
+@router.get("/catalog/departments/{dept}/courses")
+def catalog_department_courses(dept: str) -> Response:
+    """Return course summaries for a numeric department code or prefix."""
+    try:
+        courses = get_catalog_index().department_courses(dept)
+    except AppError as err:
+        return _catalog_unavailable(err)
+    return _catalog_response(courses, found=bool(courses), what="Department")
+
+
+@router.get("/catalog/instructors")
+def catalog_instructor_sections(name: Annotated[str, Query(min_length=1)]) -> Response:
+    """Return sections taught by an instructor."""
+    try:
+        sections = get_catalog_index().instructor_sections(name)
+    except AppError as err:
+        return _catalog_unavailable(err)
+    return _catalog_response(sections)
+
+
+@router.get("/catalog/search")
+def catalog_search(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1)] = 20,
+) -> Response:
+    """Free-text course search over names and prefixed codes (token prefix match)."""
+    try:
+        results = get_catalog_index().search(q, limit=min(limit, get_settings().CATALOG_SEARCH_MAX_RESULTS))
+    except AppError as err:
+        return _catalog_unavailable(err)
+    return _catalog_response(results)
+
+
+@router.get("/catalog/musts/{prefix}")
+def catalog_musts(prefix: str) -> Response:
+    """Return must courses per semester for a department prefix."""
+    try:
+        musts = get_catalog_index().musts_for(prefix)
+    except AppError as err:
+        return _catalog_unavailable(err)
+    return _catalog_response(musts, found=musts is not None, what="Department")
+
+
+@router.post("/catalog/schedules")
+def catalog_schedules(body: ScheduleRequest) -> Response:
+    """Generate clash-free section combinations for the requested courses."""
+    settings = get_settings()
+    if len(body.courses) > settings.SCHEDULE_MAX_COURSES:
+        model = CatalogResponse(status="INVALID", message=f"At most {settings.SCHEDULE_MAX_COURSES} courses are allowed")
+        return JSONResponse(content=model.model_dump(mode="json"), status_code=400)
+    query = ScheduleQuery(
+        courses=tuple(
+            CourseRequest(
+                code=course.code,
+                sections=tuple(course.sections) if course.sections is not None else None,
+                check_collision=course.check_collision,
+                check_department=course.check_department,
+                check_surname=course.check_surname,
+            )
+            for course in body.courses
+        ),
+        blocks=tuple((block.d, block.s, block.e) for block in body.dont_fill),
+        surname=body.surname or None,
+        department=body.department or None,
+        limit=body.limit,
+    )
+    try:
+        result = find_schedules(query)
+    except AppError as err:
+        if err.code == "SCHEDULE_UNKNOWN_COURSE":
+            return _catalog_response(None, found=False, what="Course")
+        if err.code == "SCHEDULE_INVALID_BLOCK":
+            model = CatalogResponse(status="INVALID", message=err.message)
+            return JSONResponse(content=model.model_dump(mode="json"), status_code=400)
+        return _catalog_unavailable(err)
+    return _catalog_response(
+        {
+            "schedules": [[{"code": code, "section": section} for code, section in schedule] for schedule in result.schedules],
+            "exhausted": result.exhausted,
+            "timed_out": result.timed_out,
+        }
+    )
+
+
+def _format_sse(event: ProgressEvent) -> str:
+    """Render a progress event as a Server-Sent Events frame."""
+    return f"id: {event.seq}\nevent: progress\ndata: {json.dumps(event.to_dict(), separators=(',', ':'))}\n\n"
+
+
+@router.get("/progress")
+async def progress(
+    after: Annotated[int, Query(ge=0)] = 0,
+    timeout: Annotated[float, Query(ge=0)] = 0.0,
+) -> Response:
+    """Return progress events newer than `after`, long-polling up to `timeout` seconds."""
+    bus = get_progress_bus()
+    if after > bus.last_seq:
+        # Cursor from before a restart; sequence numbers start over.
+        after = 0
+    wait = min(timeout, float(get_settings().PROGRESS_MAX_WAIT_SECONDS))
+    events = await bus.wait_for_events_async(after, wait) if wait > 0 else bus.events_since(after)
+    last_seq = events[-1].seq if events else max(after, 0)
+    return JSONResponse(content={"last_seq": last_seq, "events": [event.to_dict() for event in events]})
+
+
+@router.get("/progress/stream")
+async def progress_stream(
+    after: Annotated[int, Query(ge=0)] = 0,
+    last_event_id: Annotated[int | None, Header(alias="Last-Event-ID")] = None,
+) -> Response:
+    """Stream progress events as Server-Sent Events, resuming after Last-Event-ID when given."""
+    bus = get_progress_bus()
+    keepalive = float(get_settings().PROGRESS_MAX_WAIT_SECONDS)
+
+    async def _events() -> AsyncIterator[str]:
+        cursor = last_event_id if last_event_id is not None else after
+        if cursor > bus.last_seq:
+            cursor = 0
+        while True:
+            events = await bus.wait_for_events_async(cursor, keepalive)
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                yield _format_sse(event)
+            cursor = events[-1].seq
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/admin")
 def run_admin_action(
     body: AdminRequest,
@@ -29,6 +29,14 @@ def _build_root_payload() -> dict:
                 "path": "/run-musts",
                 "description": "Endpoint to trigger the musts processing workflow",
             },
+            "progress": {
+                "path": "/progress",
+                "description": "Pipeline progress events (long-poll; SSE at /progress/stream)",
+            },
+            "catalog": {
+                "path": "/catalog",
+                "description": "Read-only course catalog queries (courses, departments, instructors, search, musts)",
+            },
             "admin": {
                 "path": "/admin",
                 "description": "Admin control endpoint for lock/context/settings actions",
@@ -51,6 +59,44 @@ class ResponseModel(BaseModel):
     message: str
     extra: dict[str, Any] | None = None
 
+
+class CatalogResponse(BaseModel):
+    """Response envelope for read-only catalog queries."""
+
+    status: str
+    message: str
+    data: Any = None
+
+
+class ScheduleCourse(BaseModel):
+    """One course to place in the schedule search."""
+
+    code: str = Field(min_length=1)
+    sections: list[str] | None = None
+    check_collision: bool = True
+    check_department: bool = True
+    check_surname: bool = True
+
+
+class ScheduleBlock(BaseModel):
+    """A weekly time range that must stay free (day 0 = Monday)."""
+
+    d: int = Field(ge=0, le=6)
+    s: str
+    e: str
+
+
+class ScheduleRequest(BaseModel):
+    """Request model for schedule generation."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    courses: list[ScheduleCourse] = Field(min_length=1)
+    dont_fill: list[ScheduleBlock] = Field(default_factory=list)
+    surname: str | None = None
+    department: str | None = None
+    limit: int = Field(default=100, ge=1)
+
 # Admin endpoint schemas
 
 class AdminRequest(BaseModel):
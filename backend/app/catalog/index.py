@@ -0,0 +1,156 @@
+"""In-memory lookup index over the published course catalog artifacts."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import re
+from typing import Any
+
+from app.core.constants import NO_PREFIX_VARIANTS
+from app.core.errors import AppError
+from app.scrape.parse import deptify
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-zÇĞİÖŞÜçğıöşü]+")
+
+
+def normalize_code(code: str) -> str:
+    """Normalize a course code for lookup (upper-case, no whitespace)."""
+    return "".join(str(code).split()).upper()
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an instructor name for lookup (upper-case, single spaces)."""
+    return " ".join(str(name).split()).upper()
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into upper-case search tokens."""
+    return [token.upper() for token in _TOKEN_PATTERN.findall(text)]
+
+
+class CatalogIndex:
+    """Lookup structures built once from data.json, departments.json and musts.json.
+
+    Course keys are numeric course codes as strings. Prefixed codes (for example
+    ``CENG140``) are derived with ``deptify`` from the department prefix.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any] | None,
+        departments: dict[str, Any] | None = None,
+        musts: dict[str, Any] | None = None,
+    ):
+        try:
+            self.courses: dict[str, dict[str, Any]] = {}
+            self.prefixed: dict[str, str] = {}
+            self.numeric_to_prefixed: dict[str, str] = {}
+            self.by_department: dict[str, list[str]] = {}
+            self.by_instructor: dict[str, list[tuple[str, str]]] = {}
+            self.departments: dict[str, Any] = dict(departments or {})
+            self.musts: dict[str, Any] = dict(musts or {})
+            token_index: dict[str, set[str]] = {}
+
+            for raw_code in sorted(data or {}, key=lambda code: int(code)):
+                course_node = (data or {})[raw_code]
+                if not isinstance(course_node, dict):
+                    continue
+                code = str(raw_code)
+                dept_code = code[:3]
+                self.courses[code] = course_node
+                self.by_department.setdefault(dept_code, []).append(code)
+
+                dept_meta = self.departments.get(dept_code, {})
+                prefix = dept_meta.get("p", "") if isinstance(dept_meta, dict) else ""
+                if prefix and prefix not in NO_PREFIX_VARIANTS:
+                    prefixed_code = normalize_code(deptify(prefix, code))
+                    self.prefixed[prefixed_code] = code
+                    self.numeric_to_prefixed[code] = prefixed_code
+
+                for token in _tokens(str(course_node.get("Course Name", ""))):
+                    token_index.setdefault(token, set()).add(code)
+                if code in self.numeric_to_prefixed:
+                    token_index.setdefault(self.numeric_to_prefixed[code], set()).add(code)
+
+                sections = course_node.get("Sections", {})
+                for section_id, section in (sections if isinstance(sections, dict) else {}).items():
+                    for instructor in section.get("i", []) if isinstance(section, dict) else []:
+                        name = normalize_name(instructor)
+                        if name:
+                            self.by_instructor.setdefault(name, []).append((code, str(section_id)))
+
+            self._token_index = token_index
+            self._sorted_tokens = sorted(token_index)
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError("Failed to build catalog index", "CATALOG_INDEX_BUILD_FAILED", cause=e)
+            raise err
+
+    def resolve_code(self, code: str) -> str | None:
+        """Return numeric course code for a numeric or prefixed code."""
+        normalized = normalize_code(code)
+        if normalized in self.courses:
+            return normalized
+        return self.prefixed.get(normalized)
+
+    def course(self, code: str) -> dict[str, Any] | None:
+        """Return course node with its codes, or None when unknown."""
+        numeric = self.resolve_code(code)
+        if numeric is None:
+            return None
+        return self._course_summary(numeric, include_sections=True)
+
+    def department_courses(self, dept_code: str) -> list[dict[str, Any]]:
+        """Return course summaries for a numeric department code or prefix."""
+        key = str(dept_code).strip()
+        if key not in self.by_department:
+            upper = key.upper()
+            key = next(
+                (code for code, meta in self.departments.items() if isinstance(meta, dict) and str(meta.get("p", "")).upper() == upper),
+                key,
+            )
+        return [self._course_summary(code) for code in self.by_department.get(key, [])]
+
+    def instructor_sections(self, name: str) -> list[dict[str, Any]]:
+        """Return sections taught by an instructor (exact normalized name match)."""
+        return [
+            {**self._course_summary(code), "section": section_id}
+            for code, section_id in self.by_instructor.get(normalize_name(name), [])
+        ]
+
+    def search(self, text: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Return courses whose name/code tokens start with every query token."""
+        query_tokens = _tokens(text)
+        if not query_tokens:
+            return []
+        matches: set[str] | None = None
+        for query_token in query_tokens:
+            token_matches: set[str] = set()
+            position = bisect_left(self._sorted_tokens, query_token)
+            while position < len(self._sorted_tokens) and self._sorted_tokens[position].startswith(query_token):
+                token_matches |= self._token_index[self._sorted_tokens[position]]
+                position += 1
+            matches = token_matches if matches is None else matches & token_matches
+            if not matches:
+                return []
+        ordered = sorted(matches or (), key=int)[: max(0, limit)]
+        return [self._course_summary(code) for code in ordered]
+
+    def musts_for(self, prefix: str) -> dict[str, Any] | None:
+        """Return must courses per semester for a department prefix."""
+        upper = str(prefix).strip().upper()
+        for key, node in self.musts.items():
+            if str(key).upper() == upper:
+                return node
+        return None
+
+    def _course_summary(self, code: str, *, include_sections: bool = False) -> dict[str, Any]:
+        """Build API representation of a course."""
+        node = self.courses[code]
+        summary: dict[str, Any] = {
+            "code": code,
+            "prefixed_code": self.numeric_to_prefixed.get(code),
+            "name": node.get("Course Name", ""),
+        }
+        if include_sections:
+            summary["sections"] = node.get("Sections", {})
+        return summary
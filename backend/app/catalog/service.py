@@ -0,0 +1,125 @@
+"""Catalog index lifecycle: build from published artifacts and hot-reload on change."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any
+
+from app.catalog.index import CatalogIndex
+from app.core.constants import DATA_FILE, DEPARTMENTS_FILE, LOGGER_APP, MUSTS_FILE
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.settings import get_settings
+from app.storage.s3.store import read_json_if_changed
+
+_CATALOG_SOURCES: tuple[str, ...] = (DATA_FILE, DEPARTMENTS_FILE, MUSTS_FILE)
+
+
+@dataclass
+class _CatalogState:
+    """Current index with the source ETags it was built from.
+
+    ``generation`` increases on every rebuild or reset so derived caches can
+    tell indexes apart without relying on object identity.
+    """
+
+    index: CatalogIndex | None = None
+    etags: tuple[str | None, ...] = ()
+    checked_at: float = 0.0
+    generation: int = 0
+
+
+_STATE = _CatalogState()
+_LOCK = threading.Lock()
+
+
+def _refresh(now: float) -> CatalogIndex:
+    """Revalidate source artifacts and rebuild the index when any ETag changed.
+
+    Payloads are decoded only for a rebuild and are not kept once the index is
+    built; unchanged sources are re-read in full only when another one changed.
+    A source that was missing at the last build and is still missing counts as
+    unchanged, so an absent optional artifact does not force periodic rebuilds.
+    """
+    known = _STATE.etags if _STATE.index is not None else (None,) * len(_CATALOG_SOURCES)
+    checks: list[tuple[bool, dict[str, Any] | None, str | None]] = []
+    for key, etag in zip(_CATALOG_SOURCES, known):
+        modified, payload, new_etag = read_json_if_changed(key, etag)
+        if _STATE.index is not None and etag is None and new_etag is None:
+            modified = False
+        checks.append((modified, payload, new_etag))
+    if _STATE.index is None or any(modified for modified, _, _ in checks):
+        reads = [
+            check if check[0] else read_json_if_changed(key, None)
+            for key, check in zip(_CATALOG_SOURCES, checks)
+        ]
+        data, departments, musts = (payload for _, payload, _ in reads)
+        started = time.perf_counter()
+        _STATE.index = CatalogIndex(data, departments, musts)
+        _STATE.etags = tuple(etag for _, _, etag in reads)
+        _STATE.generation += 1
+        log_item(
+            LOGGER_APP,
+            logging.INFO,
+            f"Catalog index built: {len(_STATE.index.courses)} courses in {time.perf_counter() - started:.3f}s",
+        )
+    _STATE.checked_at = now
+    return _STATE.index
+
+
+def get_catalog_index() -> CatalogIndex:
+    """Return the current catalog index, revalidating sources at most every CATALOG_REFRESH_SECONDS.
+
+    Revalidation uses conditional reads, so unchanged artifacts cost one 304 each
+    and no rebuild. If revalidation fails, the previous index keeps serving.
+    """
+    now = time.monotonic()
+    index = _STATE.index
+    if index is not None and now - _STATE.checked_at < float(get_settings().CATALOG_REFRESH_SECONDS):
+        return index
+    with _LOCK:
+        if _STATE.index is not None and now - _STATE.checked_at < float(get_settings().CATALOG_REFRESH_SECONDS):
+            return _STATE.index
+        try:
+            return _refresh(now)
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Failed to refresh catalog index",
+                "CATALOG_REFRESH_FAILED",
+                cause=e,
+            )
+            if _STATE.index is None:
+                raise err
+            log_item(LOGGER_APP, logging.WARNING, err)
+            _STATE.checked_at = now
+            return _STATE.index
+
+
+def catalog_generation() -> int:
+    """Return the generation of the current index; read it before fetching the index."""
+    return _STATE.generation
+
+
+def warm_catalog_index() -> None:
+    """Build the index eagerly (startup hook); failures are logged and retried lazily."""
+    try:
+        get_catalog_index()
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Failed to build catalog index on startup",
+            "CATALOG_WARMUP_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_APP, logging.WARNING, err)
+
+
+def reset_catalog_index() -> None:
+    """Drop the cached index so the next lookup rebuilds it."""
+    with _LOCK:
+        _STATE.index = None
+        _STATE.etags = ()
+        _STATE.checked_at = 0.0
+        _STATE.generation += 1
@@ -1,8 +1,10 @@
 """Context schema models for app-level queue and state tracking."""
 
-from pydantic import BaseModel, Field
+from collections import deque
 
-from app.core.constants import RequestType
+from pydantic import BaseModel, Field, field_serializer, model_validator
+
+from app.core.constants import REQUEST_PRIORITIES, RequestType
 
 
 def _in_queue_factory() -> dict[str, bool]:
@@ -10,22 +12,60 @@ def _in_queue_factory() -> dict[str, bool]:
     return {req_type.value: False for req_type in RequestType}
 
 
+def _priority(key: str) -> int:
+    """Return queue priority for a request type value."""
+    return REQUEST_PRIORITIES.get(key, 0)
+
+
 class AppContext(BaseModel):
-    """Persistent app context state shared across request handling runs."""
+    """Persistent app context state shared across request handling runs.
 
-    queue: list[str] = Field(default_factory=list)
+    ``queue`` is kept in dequeue order (priority descending, FIFO within a
+    priority) so that taking the next job is an O(1) ``popleft``. Duplicates
+    are rejected through ``in_queue``, which bounds the queue to one entry per
+    request type.
+    """
+
+    queue: deque[str] = Field(default_factory=deque)
     in_queue: dict[str, bool] = Field(default_factory=_in_queue_factory)
     error_count: int = 0
     suspended: bool = False
 
+    @model_validator(mode="after")
+    def _normalize_queue(self) -> "AppContext":
+        """Drop duplicates, order by priority, and rebuild lookup flags after load."""
+        seen: set[str] = set()
+        ordered: list[str] = []
+        for key in self.queue:
+            if key in seen:
+                continue
+            seen.add(key)
+            ordered.append(key)
+        ordered.sort(key=lambda key: -_priority(key))
+        self.queue = deque(ordered)
+        self.in_queue = {key: key in seen for key in set(self.in_queue) | set(_in_queue_factory())}
+        return self
+
+    @field_serializer("queue")
+    def _serialize_queue(self, queue: deque[str]) -> list[str]:
+        """Persist queue as a plain list."""
+        return list(queue)
+
     def enqueue(self, request_type: RequestType) -> bool:
-        """Add a request to queue if it is queueable and not already queued."""
-        if request_type == RequestType.SCRAPE:
+        """Add a request in priority order unless it is ROOT or already queued."""
+        if request_type == RequestType.ROOT:
             return False
         key = request_type.value
         if self.in_queue.get(key, False):
             return False
-        self.queue.append(key)
+        priority = _priority(key)
+        position = len(self.queue)
+        while position > 0 and _priority(self.queue[position - 1]) < priority:
+            position -= 1
+        if position == len(self.queue):
+            self.queue.append(key)
+        else:
+            self.queue.insert(position, key)
         self.in_queue[key] = True
         return True
 
@@ -33,7 +73,7 @@ class AppContext(BaseModel):
         """Remove and return the next queued request, or None when queue is empty."""
         if not self.queue:
             return None
-        next_request = self.queue.pop(0)
+        next_request = self.queue.popleft()
         self.in_queue[next_request] = False
         try:
             return RequestType(next_request)
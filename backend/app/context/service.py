@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
 
 from app.context.schema import AppContext
 from app.core.constants import CONTEXT_KEY, LOGGER_APP, RequestType
 from app.core.errors import AppError
 from app.core.logging import log_item
-from app.core.paths import downloaded_path, published_path, staged_path
 from app.core.settings import get_settings
-from app.storage.local import move_file, read_json, write_json
-from app.storage.s3 import download_file, s3_file_exists, upload_file
+from app.storage.s3 import download_json, upload_json
 
 
 @dataclass
@@ -26,6 +25,8 @@ class _ContextStore:
 
 _RUN_STORE = _ContextStore()
 _ADMIN_STORE = _ContextStore()
+# Guards queue mutations: requests handled on other threads may enqueue while a run drains the queue.
+_QUEUE_LOCK = threading.RLock()
 
 
 def _store(admin: bool) -> _ContextStore:
@@ -34,20 +35,18 @@ def _store(admin: bool) -> _ContextStore:
 
 
 def load_context_state(*, admin: bool = False) -> None:
-    """Load context from storage once and keep original/working snapshots."""
+    """Load context from storage once and keep original/working snapshots.
+
+    The read goes through the ETag-validated payload cache, so an unchanged
+    context costs a single conditional request and no local file I/O.
+    """
     store = _store(admin)
     try:
         if store.loaded:
             return
-        if s3_file_exists(CONTEXT_KEY):
-            local_path = downloaded_path(CONTEXT_KEY)
-            download_file(CONTEXT_KEY, local_path)
-            data = read_json(local_path)
-            store.original = AppContext(**data)
-            store.working = store.original.model_copy(deep=True)
-        else:
-            store.original = AppContext()
-            store.working = store.original.model_copy(deep=True)
+        data = download_json(CONTEXT_KEY)
+        store.original = AppContext(**data) if data else AppContext()
+        store.working = store.original.model_copy(deep=True)
         store.loaded = True
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
@@ -58,18 +57,22 @@ def load_context_state(*, admin: bool = False) -> None:
         raise err
 
 
-def publish_context_state(*, admin: bool = False) -> None:
-    """Persist current context copy and publish it locally and in S3."""
+def publish_context_state(*, admin: bool = False) -> bool:
+    """Persist working context to storage when it differs from the loaded copy.
+
+    Returns whether an upload happened. The selected store is detached either way.
+    """
     store = _store(admin)
     try:
         if not store.loaded or store.working is None:
-            return
+            return False
+        if store.original is not None and store.working == store.original:
+            detach_context(admin=admin)
+            return False
         store.original = store.working.model_copy(deep=True)
-        local_staged_path = staged_path(CONTEXT_KEY)
-        write_json(local_staged_path, store.original.model_dump())
-        upload_file(local_staged_path, CONTEXT_KEY, _admin=admin)
-        move_file(local_staged_path, published_path(CONTEXT_KEY))
+        upload_json(store.original.model_dump(mode="json"), CONTEXT_KEY, _admin=admin)
         detach_context(admin=admin)
+        return True
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
             "Failed to publish context",
@@ -107,7 +110,7 @@ def _ensure_not_suspended(*, admin: bool = False) -> None:
 def get_context_snapshot(*, admin: bool = False) -> dict[str, object]:
     """Return current in-memory context snapshot for selected store."""
     store = _ensure_context_loaded(admin=admin)
-    return store.working.model_dump() if store.working is not None else AppContext().model_dump()
+    return store.working.model_dump(mode="json") if store.working is not None else AppContext().model_dump(mode="json")
 
 
 def enqueue_request(request_type: RequestType, *, admin: bool = False) -> bool:
@@ -115,7 +118,8 @@ def enqueue_request(request_type: RequestType, *, admin: bool = False) -> bool:
     try:
         store = _ensure_context_loaded(admin=admin)
         _ensure_not_suspended(admin=admin)
-        return store.working.enqueue(request_type)
+        with _QUEUE_LOCK:
+            return store.working.enqueue(request_type)
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
             "Failed to queue request",
@@ -130,7 +134,8 @@ def resolve_request(request_type: RequestType, *, admin: bool = False) -> tuple[
     try:
         store = _ensure_context_loaded(admin=admin)
         _ensure_not_suspended(admin=admin)
-        next_request = store.working.dequeue()
+        with _QUEUE_LOCK:
+            next_request = store.working.dequeue()
         if next_request is None:
             return False, request_type
         return True, next_request
@@ -143,6 +148,22 @@ def resolve_request(request_type: RequestType, *, admin: bool = False) -> tuple[
         raise err
 
 
+def next_queued_request(*, admin: bool = False) -> RequestType | None:
+    """Pop the highest-priority queued request, or None when queue is empty."""
+    try:
+        store = _ensure_context_loaded(admin=admin)
+        _ensure_not_suspended(admin=admin)
+        with _QUEUE_LOCK:
+            return store.working.dequeue()
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Failed to get next queued request",
+            "REQUEST_GET_FAILED",
+            cause=e,
+        )
+        raise err
+
+
 def record_failure(*, admin: bool = False) -> None:
     """Increment error count and suspend context at configured threshold."""
     try:
@@ -187,7 +208,8 @@ def clear_queue(*, admin: bool = False) -> None:
         store = _ensure_context_loaded(admin=admin)
         if not admin:
             _ensure_not_suspended(admin=admin)
-        store.working.clear_queue()
+        with _QUEUE_LOCK:
+            store.working.clear_queue()
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
             "Failed to clear request queue",
@@ -11,6 +11,13 @@ class RequestType(str, Enum):
     MUSTS = "musts"
 
 
+# Queue priorities (higher runs first; equal priorities keep FIFO order)
+REQUEST_PRIORITIES: dict[str, int] = {
+    RequestType.SCRAPE.value: 10,
+    RequestType.MUSTS.value: 5,
+}
+
+
 class AdminAction(str, Enum):
     """Supported actions for the single /admin endpoint."""
 
@@ -23,6 +30,9 @@ class AdminAction(str, Enum):
     CONTEXT_UNSUSPEND = "context_unsuspend"
     SETTINGS_GET = "settings_get"
     SETTINGS_SET = "settings_set"
+    PROFILE_ARM = "profile_arm"
+    PROFILE_DISARM = "profile_disarm"
+    PROFILE_STATUS = "profile_status"
 
 
 # Scrape process constants
@@ -48,6 +58,8 @@ DATA_SUBDIR_STAGED = "staged"
 DATA_SUBDIR_PUBLISHED = "published"
 DATA_SUBDIR_DOWNLOADED = "downloaded"
 DATA_SUBDIR_CACHE = "cache"
+# Persistent storage mirror (under the cache directory)
+S3_MIRROR_DIR = "s3Mirror"
 
 # Shared file keys / names
 CONTEXT_KEY = "context.json"
@@ -57,6 +69,13 @@ DEPARTMENTS_FILE = "departments.json"
 DEPARTMENTS_NO_PREFIX_FILE = "departmentsNoPrefix.json"
 DEPARTMENTS_OVERRIDES_FILE = "departmentsOverrides.json"
 DATA_FILE = "data.json"
+DATA_INDEX_FILE = "dataIndex.json"
+DATA_COMPACT_FILE = "dataCompact.json"
+DATA_SHARDS_DIR = "dataShards"
+SECTION_MASKS_FILE = "sectionMasks.json"
+SECTION_CONFLICTS_FILE = "sectionConflicts.json"
+SCHEDULE_BUNDLES_DIR = "scheduleBundles"
+SCHEDULE_BUNDLES_INDEX_FILE = "scheduleBundlesIndex.json"
 LAST_UPDATED_FILE = "lastUpdated.json"
 
 MUSTS_CACHE_FILE = "mustsCache.json"
@@ -71,6 +90,11 @@ STATUS_FILE = "status.json"
 # S3 keys that must be publicly readable for frontend clients
 PUBLIC_S3_FILES: tuple[str, ...] = (
     DATA_FILE,
+    DATA_INDEX_FILE,
+    DATA_COMPACT_FILE,
+    SECTION_MASKS_FILE,
+    SECTION_CONFLICTS_FILE,
+    SCHEDULE_BUNDLES_INDEX_FILE,
     LAST_UPDATED_FILE,
     MUSTS_FILE,
     DEPARTMENTS_FILE,
@@ -79,6 +103,11 @@ PUBLIC_S3_FILES: tuple[str, ...] = (
     NTE_AVAILABLE_FILE,
     STATUS_FILE,
 )
+# S3 key prefixes whose objects must be publicly readable
+PUBLIC_S3_PREFIXES: tuple[str, ...] = (
+    DATA_SHARDS_DIR + "/",
+    SCHEDULE_BUNDLES_DIR + "/",
+)
 
 # Mock S3 filesystem names
 S3_MOCK_DIR_NAME = "s3-mock"
@@ -93,6 +122,7 @@ LOGGER_MUSTS = "musts"
 LOGGER_NTE_LIST = "nteList"
 LOGGER_NTE_AVAILABLE = "nteAvailable"
 LOGGER_ERROR = "error"
+LOGGER_TRACE = "trace"
 
 # Log file names
 LOG_FILE_APP = "app.log"
@@ -101,3 +131,5 @@ LOG_FILE_MUSTS = "musts.log"
 LOG_FILE_NTE_LIST = "nteList.log"
 LOG_FILE_NTE_AVAILABLE = "nteAvailable.log"
 LOG_FILE_ERROR = "error.log"
+LOG_FILE_TRACE = "trace.jsonl"
+PROFILE_DIR = "profiles"
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 import logging
+import sys
 import traceback
 from typing import Any
 
@@ -20,9 +21,23 @@ class AppError(Exception):
     call_stack: str | None = None
 
     def __post_init__(self) -> None:
-        """Capture call stack when the error object is created."""
+        """Record the creation site cheaply; the stack text is formatted only when needed."""
+        self._frames: list[tuple[Any, int]] = []
         if self.call_stack is None:
-            self.call_stack = "".join(traceback.format_stack()[:-1])
+            frame = sys._getframe(2)
+            while frame is not None:
+                self._frames.append((frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+
+    def stack_text(self) -> str | None:
+        """Return the creation call stack, formatting (and caching) it on first use."""
+        if self.call_stack is None and self._frames:
+            summary = traceback.StackSummary.from_list(
+                [(code.co_filename, lineno, code.co_name, None) for code, lineno in reversed(self._frames)]
+            )
+            self.call_stack = "".join(summary.format())
+            self._frames = []
+        return self.call_stack
 
     def __str__(self) -> str:
         return self.message
@@ -44,8 +59,10 @@ class AppError(Exception):
             payload["context"] = self.context
         if self.cause:
             payload["cause"] = str(self.cause)
-        if include_stack and self.call_stack:
-            payload["stack"] = self.call_stack
+        if include_stack:
+            stack = self.stack_text()
+            if stack:
+                payload["stack"] = stack
         return payload
 
     def log(self, logger: logging.Logger, level: int) -> None:
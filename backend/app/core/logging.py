@@ -1,9 +1,18 @@
 """Centralized logging setup and helper utilities for the application."""
 
+import atexit
+import email.utils
+from email.message import EmailMessage
 import json
 import logging
-from logging.handlers import TimedRotatingFileHandler, SMTPHandler
+from logging.handlers import QueueHandler, QueueListener, SMTPHandler, TimedRotatingFileHandler
 from pathlib import Path
+import queue
+import smtplib
+import sys
+import threading
+import time
+import traceback
 from typing import Any
 
 from app.core.constants import (
@@ -12,11 +21,13 @@ from app.core.constants import (
     LOG_FILE_MUSTS,
     LOG_FILE_NTE_LIST,
     LOG_FILE_SCRAPE,
+    LOG_FILE_TRACE,
     LOGGER_APP,
     LOGGER_ERROR,
     LOGGER_MUSTS,
     LOGGER_NTE_LIST,
     LOGGER_SCRAPE,
+    LOGGER_TRACE,
 )
 from app.core.errors import AppError
 from app.core.paths import log_dir
@@ -30,6 +41,10 @@ _LOGGER_NAMES: tuple[str, ...] = (
     LOGGER_ERROR,
 )
 
+_LISTENERS: "list[_Listener]" = []
+# Attributes every LogRecord has; anything else came from ``extra``.
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName"}
+
 
 def _build_formatter() -> logging.Formatter:
     """Build the configured formatter (plain text or JSON)."""
@@ -64,7 +79,13 @@ def log_item(
 
 
 def setup_logging() -> None:
-    """Configure app, scrape, and error loggers with file/console/mail handlers."""
+    """Configure app, scrape, and error loggers with file/console/mail handlers.
+
+    Loggers only enqueue records (bounded; overflow is dropped and counted);
+    background listeners format them and run the file, console and batched
+    mail handlers. Trace spans get their own queue so a burst of spans can
+    never crowd out error records.
+    """
     settings = get_settings()
 
     log_dir_path = log_dir()
@@ -72,46 +93,75 @@ def setup_logging() -> None:
 
     level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
-    app_logger = logging.getLogger(LOGGER_APP)
-    scrape_logger = logging.getLogger(LOGGER_SCRAPE)
-    musts_logger = logging.getLogger(LOGGER_MUSTS)
-    nte_list_logger = logging.getLogger(LOGGER_NTE_LIST)
-    error_logger = logging.getLogger(LOGGER_ERROR)
-
-    for lg in (app_logger, scrape_logger, musts_logger, nte_list_logger, error_logger):
-        lg.setLevel(level)
-        lg.handlers.clear()
-        lg.propagate = False
+    shutdown_logging()
 
     formatter = _build_formatter()
-
-    app_file = log_dir_path / LOG_FILE_APP
-    scrape_file = log_dir_path / LOG_FILE_SCRAPE
-    musts_file = log_dir_path / LOG_FILE_MUSTS
-    nte_list_file = log_dir_path / LOG_FILE_NTE_LIST
-    err_file = log_dir_path / LOG_FILE_ERROR
-
-    _add_handler(app_logger, app_file, formatter, level)
-    _add_handler(scrape_logger, scrape_file, formatter, level)
-    _add_handler(musts_logger, musts_file, formatter, level)
-    _add_handler(nte_list_logger, nte_list_file, formatter, level)
-    _add_handler(error_logger, err_file, formatter, logging.ERROR)
+    routes: dict[str, list[logging.Handler]] = {
+        LOGGER_APP: [_build_file_handler(log_dir_path / LOG_FILE_APP, formatter, level)],
+        LOGGER_SCRAPE: [_build_file_handler(log_dir_path / LOG_FILE_SCRAPE, formatter, level)],
+        LOGGER_MUSTS: [_build_file_handler(log_dir_path / LOG_FILE_MUSTS, formatter, level)],
+        LOGGER_NTE_LIST: [_build_file_handler(log_dir_path / LOG_FILE_NTE_LIST, formatter, level)],
+        LOGGER_ERROR: [_build_file_handler(log_dir_path / LOG_FILE_ERROR, formatter, logging.ERROR)],
+    }
 
     if settings.LOG_CONSOLE:
         console = logging.StreamHandler()
         console.setLevel(level)
         console.setFormatter(formatter)
-        app_logger.addHandler(console)
-        scrape_logger.addHandler(console)
-        musts_logger.addHandler(console)
-        nte_list_logger.addHandler(console)
-        error_logger.addHandler(console)
+        for handlers in routes.values():
+            handlers.append(console)
+
+    email_handler = _build_email_handler()
+    if email_handler is not None:
+        routes[LOGGER_ERROR].append(email_handler)
+
+    # Trace drop notices are reported through the app log handlers.
+    trace_routes: dict[str, list[logging.Handler]] = {
+        LOGGER_TRACE: [_build_file_handler(log_dir_path / LOG_FILE_TRACE, logging.Formatter("%(message)s"), logging.INFO)],
+        LOGGER_APP: routes[LOGGER_APP],
+    }
+
+    for names, lg_routes in ((_LOGGER_NAMES, routes), ((LOGGER_TRACE,), trace_routes)):
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=max(1, settings.LOG_QUEUE_SIZE))
+        queue_handler = _DroppingQueueHandler(log_queue)
+        for name in names:
+            lg = logging.getLogger(name)
+            lg.setLevel(logging.INFO if name == LOGGER_TRACE else level)
+            lg.handlers.clear()
+            lg.propagate = False
+            lg.addHandler(queue_handler)
+        listener = _Listener(log_queue, _RoutingHandler(lg_routes, queue_handler))
+        listener.start()
+        _LISTENERS.append(listener)
+
+
+def shutdown_logging() -> None:
+    """Detach the queue handlers, drain queued records, stop the listeners and close their handlers.
 
-    _add_email_handler(error_logger)
+    Records logged afterwards no longer go into an undrained queue; with no
+    handler attached, warnings and errors fall back to ``logging.lastResort``
+    (stderr). No-op when not started.
+    """
+    listeners = list(_LISTENERS)
+    _LISTENERS.clear()
+    for listener in listeners:
+        for handler in listener.handlers:
+            if isinstance(handler, _RoutingHandler):
+                for name in (*_LOGGER_NAMES, LOGGER_TRACE):
+                    logging.getLogger(name).removeHandler(handler.source)
+    for listener in listeners:
+        listener.stop()
+    closed: set[int] = set()
+    for listener in listeners:
+        for handler in listener.handlers:
+            handler.close(closed)
 
 
-def _add_handler(logger: logging.Logger, path: Path, formatter: logging.Formatter, level: int) -> None:
-    """Add a timed rotating file handler to a logger."""
+atexit.register(shutdown_logging)
+
+
+def _build_file_handler(path: Path, formatter: logging.Formatter, level: int) -> logging.Handler:
+    """Build a timed rotating file handler."""
     handler = TimedRotatingFileHandler(
         path,
         when="midnight",
@@ -121,32 +171,186 @@ def _add_handler(logger: logging.Logger, path: Path, formatter: logging.Formatte
     )
     handler.setLevel(level)
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    return handler
 
 
-def _add_email_handler(error_logger: logging.Logger) -> None:
+def _build_email_handler() -> logging.Handler | None:
+    """Build the batched error mail handler, or None when mail is not configured."""
     settings = get_settings()
     if not settings.MAIL_ENABLED:
-        return
+        return None
     if not settings.MAIL_SERVER or not settings.MAIL_USERNAME or not settings.MAIL_PASSWORD:
-        return
+        return None
     if not settings.MAIL_RECIPIENT:
-        return
+        return None
 
     sender = settings.MAIL_SENDER or settings.MAIL_USERNAME
     subject = f"{settings.MAIL_SUBJECT_PREFIX} error"
 
-    handler = SMTPHandler(
+    handler = _BatchingSMTPHandler(
         mailhost=(settings.MAIL_SERVER, settings.MAIL_PORT),
         fromaddr=sender,
         toaddrs=[settings.MAIL_RECIPIENT],
         subject=subject,
         credentials=(settings.MAIL_USERNAME, settings.MAIL_PASSWORD),
         secure=(),
+        batch_seconds=settings.MAIL_BATCH_SECONDS,
+        min_interval_seconds=settings.MAIL_MIN_INTERVAL_SECONDS,
+        max_records=settings.MAIL_BATCH_MAX_RECORDS,
     )
     handler.setLevel(logging.ERROR)
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
-    error_logger.addHandler(handler)
+    return handler
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks: records are dropped and counted when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]):
+        super().__init__(log_queue)
+        self._lock_dropped = threading.Lock()
+        self._dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self._dropped += 1
+
+    def take_dropped(self) -> int:
+        """Return and reset the number of records dropped since the last call."""
+        with self._lock_dropped:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class _Listener(QueueListener):
+    """Queue listener whose stop sentinel waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _RoutingHandler(logging.Handler):
+    """Listener-side handler that dispatches records to the handlers of their logger."""
+
+    def __init__(self, routes: dict[str, list[logging.Handler]], source: _DroppingQueueHandler):
+        super().__init__()
+        self.routes = routes
+        self.source = source
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        dropped = self.source.take_dropped()
+        if dropped:
+            self._dispatch(logging.makeLogRecord({
+                "name": LOGGER_APP,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full; dropped {dropped} record(s).",
+            }))
+        self._dispatch(record)
+        return True
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+    def close(self, closed: set[int] | None = None) -> None:
+        """Close routed handlers once, skipping ids in ``closed`` (shared across listeners)."""
+        closed = set() if closed is None else closed
+        for handlers in self.routes.values():
+            for handler in handlers:
+                if id(handler) not in closed:
+                    closed.add(id(handler))
+                    handler.close()
+        super().close()
+
+
+class _BatchingSMTPHandler(SMTPHandler):
+    """SMTP handler that batches records into one mail and rate-limits sends.
+
+    The first buffered record opens a batch window; the batch is sent when the
+    window closes, but never sooner than min_interval_seconds after the
+    previous mail. Records beyond max_records are counted, not mailed.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        batch_seconds: float,
+        min_interval_seconds: float,
+        max_records: int,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.batch_seconds = max(0.0, batch_seconds)
+        self.min_interval_seconds = max(0.0, min_interval_seconds)
+        self.max_records = max(1, max_records)
+        self._buffer: list[str] = []
+        self._omitted = 0
+        self._last_sent = float("-inf")
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            with self.lock:
+                if len(self._buffer) < self.max_records:
+                    self._buffer.append(self.format(record))
+                else:
+                    self._omitted += 1
+                if self._timer is None:
+                    delay = max(self.batch_seconds, self._last_sent + self.min_interval_seconds - time.monotonic())
+                    self._timer = threading.Timer(delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Send buffered records as a single mail."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            lines, omitted = self._buffer, self._omitted
+            self._buffer, self._omitted = [], 0
+            if not lines:
+                return
+            self._last_sent = time.monotonic()
+        body = "\n\n".join(lines)
+        if omitted:
+            body += f"\n\n... {omitted} more error record(s) omitted."
+        try:
+            self._send(f"{self.subject} ({len(lines) + omitted})", body)
+        except Exception:
+            if logging.raiseExceptions:
+                traceback.print_exc(file=sys.stderr)
+
+    def _send(self, subject: str, body: str) -> None:
+        """Deliver one mail using SMTPHandler's connection settings."""
+        msg = EmailMessage()
+        msg["From"] = self.fromaddr
+        msg["To"] = ",".join(self.toaddrs)
+        msg["Subject"] = subject
+        msg["Date"] = email.utils.localtime()
+        msg.set_content(body)
+        with smtplib.SMTP(self.mailhost, self.mailport or smtplib.SMTP_PORT, timeout=self.timeout) as smtp:
+            if self.username:
+                if self.secure is not None:
+                    smtp.ehlo()
+                    smtp.starttls(*self.secure)
+                    smtp.ehlo()
+                smtp.login(self.username, self.password)
+            smtp.send_message(msg)
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
 
 
 class _JsonFormatter(logging.Formatter):
@@ -159,4 +363,7 @@ class _JsonFormatter(logging.Formatter):
             "logger": record.name,
             "msg": record.getMessage(),
         }
-        return json.dumps(payload, ensure_ascii=False)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in payload:
+                payload[key] = value
+        return json.dumps(payload, ensure_ascii=False, default=str)
@@ -0,0 +1,210 @@
+"""Opt-in profiling of pipeline runs, armed at runtime through an admin action."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+import cProfile
+from datetime import datetime
+from functools import wraps
+import logging
+from pathlib import Path
+import sys
+import threading
+from typing import Any, TypeVar
+
+from app.core.constants import LOGGER_APP, PROFILE_DIR
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.paths import log_dir
+from app.core.settings import get_settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PROFILE_PIPELINES: tuple[str, ...] = ("scrape", "musts", "nte_list", "nte_available")
+PROFILE_MODES: tuple[str, ...] = ("sampling", "cprofile")
+PROFILE_MAX_RUNS = 10
+
+_LOCK = threading.Lock()
+# pipeline -> {"mode": str, "runs": int remaining}
+_ARMED: dict[str, dict[str, Any]] = {}
+_PROFILING_THREADS: set[int] = set()
+
+
+def profile_dir() -> Path:
+    """Return the directory profiles are written to."""
+    return log_dir() / PROFILE_DIR
+
+
+def arm_profiling(pipelines: list[str], *, mode: str = "sampling", runs: int = 1) -> dict[str, dict[str, Any]]:
+    """Profile the next ``runs`` runs of each pipeline; returns the armed state."""
+    unknown = [name for name in pipelines if name not in PROFILE_PIPELINES]
+    if not pipelines or unknown:
+        raise AppError("Unknown pipeline to profile.", "PROFILE_INVALID_PIPELINE", context={"pipelines": pipelines})
+    if mode not in PROFILE_MODES:
+        raise AppError("Unknown profiling mode.", "PROFILE_INVALID_MODE", context={"mode": mode})
+    if not 1 <= runs <= PROFILE_MAX_RUNS:
+        raise AppError("Profiled run count out of range.", "PROFILE_INVALID_RUNS", context={"runs": runs})
+    with _LOCK:
+        for name in pipelines:
+            _ARMED[name] = {"mode": mode, "runs": runs}
+        return {name: dict(plan) for name, plan in _ARMED.items()}
+
+
+def disarm_profiling() -> None:
+    """Cancel all pending profiled runs."""
+    with _LOCK:
+        _ARMED.clear()
+
+
+def profiling_status(limit: int = 20) -> dict[str, Any]:
+    """Return armed pipelines and the most recent profile files."""
+    with _LOCK:
+        armed = {name: dict(plan) for name, plan in _ARMED.items()}
+    directory = profile_dir()
+    files = sorted(directory.iterdir(), key=lambda path: path.stat().st_mtime, reverse=True) if directory.is_dir() else []
+    return {
+        "armed": armed,
+        "directory": str(directory),
+        "recent": [{"file": path.name, "bytes": path.stat().st_size} for path in files[:limit]],
+    }
+
+
+def profiled(pipeline: str) -> Callable[[F], F]:
+    """Decorate a pipeline entrypoint so armed runs execute under the profiler.
+
+    Unarmed runs pay only a dictionary lookup. A pipeline started from inside
+    an already profiled run (e.g. nte_available after scrape) is covered by the
+    outer profile and does not consume its own armed run.
+    """
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mode = _claim(pipeline)
+            if mode is None:
+                return fn(*args, **kwargs)
+            thread_id = threading.get_ident()
+            try:
+                if mode == "cprofile":
+                    return _run_cprofile(pipeline, fn, args, kwargs)
+                return _run_sampling(pipeline, fn, args, kwargs)
+            finally:
+                with _LOCK:
+                    _PROFILING_THREADS.discard(thread_id)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _claim(pipeline: str) -> str | None:
+    """Consume one armed run for pipeline; None when it should run unprofiled."""
+    if pipeline not in _ARMED:
+        return None
+    with _LOCK:
+        plan = _ARMED.get(pipeline)
+        thread_id = threading.get_ident()
+        if plan is None or thread_id in _PROFILING_THREADS:
+            return None
+        plan["runs"] -= 1
+        if plan["runs"] <= 0:
+            del _ARMED[pipeline]
+        _PROFILING_THREADS.add(thread_id)
+        return plan["mode"]
+
+
+def _output_path(pipeline: str, suffix: str) -> Path:
+    """Return a timestamped profile output path."""
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{pipeline}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{suffix}"
+
+
+def _run_cprofile(pipeline: str, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Run fn under cProfile and dump pstats (view with snakeviz, or flameprof for a flamegraph)."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        _write_output(pipeline, ".prof", lambda path: profiler.dump_stats(str(path)))
+
+
+def _run_sampling(pipeline: str, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Run fn while a sampler thread records folded stacks (flamegraph.pl / speedscope input)."""
+    sampler = _StackSampler(threading.get_ident(), get_settings().PROFILE_SAMPLE_INTERVAL_SECONDS)
+    sampler.start()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        sampler.finish()
+        _write_output(pipeline, ".folded", sampler.write)
+
+
+def _write_output(pipeline: str, suffix: str, write: Callable[[Path], None]) -> None:
+    """Write a profile; failures are logged and never fail the pipeline."""
+    try:
+        path = _output_path(pipeline, suffix)
+        write(path)
+        log_item(LOGGER_APP, logging.INFO, f"Profile for {pipeline} written to {path}")
+    except Exception as e:
+        log_item(
+            LOGGER_APP,
+            logging.WARNING,
+            e if isinstance(e, AppError) else AppError(
+                "Failed to write profile.",
+                "PROFILE_WRITE_FAILED",
+                context={"pipeline": pipeline},
+                cause=e,
+            ),
+        )
+
+
+class _StackSampler(threading.Thread):
+    """Periodically sample the pipeline thread and its fetch workers into folded stack counts."""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name="profiler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = max(0.001, interval)
+        self.counts: Counter[str] = Counter()
+        self._done = threading.Event()
+        self._labels: dict[Any, str] = {}
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.target_thread_id:
+                    root = "pipeline"
+                elif names.get(thread_id, "").startswith("fetch"):
+                    root = "fetch-worker"
+                else:
+                    continue
+                stack: list[str] = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(root)
+                self.counts[";".join(reversed(stack))] += 1
+
+    def _label(self, code: Any) -> str:
+        """Return a cached ``function (file:line)`` label for a code object."""
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def finish(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._done.set()
+        self.join()
+
+    def write(self, path: Path) -> None:
+        """Write folded stacks, one ``frame;frame;... count`` line per distinct stack."""
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
@@ -0,0 +1,143 @@
+"""Bounded in-memory progress event bus for running pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import Any
+
+from app.core.settings import get_settings
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Single structured progress update emitted by a pipeline."""
+
+    seq: int
+    ts: float
+    pipeline: str
+    stage: str
+    index: int | None = None
+    total: int | None = None
+    done: int | None = None
+    rate: float | None = None
+    eta_seconds: float | None = None
+    message: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict without unset fields."""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+class ProgressBus:
+    """Ring buffer of progress events that readers can poll or block on.
+
+    Sequence numbers increase monotonically across the process lifetime, so a
+    reader resumes with ``events_since(last_seq)``. Readers that fall behind the
+    buffer simply skip the evicted events. Async readers await an
+    ``asyncio.Event`` that publishers set on the reader's loop, so waiting does
+    not occupy a worker thread.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._events: deque[ProgressEvent] = deque(maxlen=max(1, capacity))
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def last_seq(self) -> int:
+        """Return sequence number of the newest published event (0 when none)."""
+        with self._cond:
+            return self._seq
+
+    def publish(self, pipeline: str, stage: str, **fields: Any) -> ProgressEvent:
+        """Append a new event and wake blocked and awaiting readers."""
+        with self._cond:
+            self._seq += 1
+            event = ProgressEvent(seq=self._seq, ts=time.time(), pipeline=pipeline, stage=stage, **fields)
+            self._events.append(event)
+            self._cond.notify_all()
+            waiters = list(self._waiters)
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # The reader's loop is closed; its waiter is discarded on exit.
+                continue
+        return event
+
+    def events_since(self, after: int) -> list[ProgressEvent]:
+        """Return buffered events with seq greater than after."""
+        with self._cond:
+            return [event for event in self._events if event.seq > after]
+
+    def wait_for_events(self, after: int, timeout: float) -> list[ProgressEvent]:
+        """Block up to timeout seconds for events newer than after."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > after, timeout=max(0.0, timeout))
+            return [event for event in self._events if event.seq > after]
+
+    async def wait_for_events_async(self, after: int, timeout: float) -> list[ProgressEvent]:
+        """Await up to timeout seconds for events newer than after without blocking a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._seq > after:
+                return [event for event in self._events if event.seq > after]
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                self._waiters.discard(waiter)
+        return self.events_since(after)
+
+
+class ProgressTracker:
+    """Per-run helper that derives fetch rate and ETA for a pipeline loop."""
+
+    def __init__(self, pipeline: str, *, bus: ProgressBus | None = None):
+        self.pipeline = pipeline
+        self._bus = bus
+        self._stage_started = time.monotonic()
+
+    def _publish(self, stage: str, **fields: Any) -> None:
+        """Send an event to the configured or shared bus."""
+        (self._bus or get_progress_bus()).publish(self.pipeline, stage, **fields)
+
+    def stage(self, stage: str, message: str | None = None) -> None:
+        """Mark the start of a new stage and reset rate timing."""
+        self._stage_started = time.monotonic()
+        self._publish(stage, message=message)
+
+    def advance(self, stage: str, index: int, total: int, *, done: int | None = None) -> None:
+        """Report loop position; rate counts done items (or index) per second."""
+        elapsed = max(time.monotonic() - self._stage_started, 1e-6)
+        count = index if done is None else done
+        eta = (elapsed / index) * (total - index) if index > 0 else None
+        self._publish(
+            stage,
+            index=index,
+            total=total,
+            done=done,
+            rate=round(count / elapsed, 3),
+            eta_seconds=round(eta, 1) if eta is not None else None,
+        )
+
+
+_BUS: ProgressBus | None = None
+_BUS_LOCK = threading.Lock()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Return the process-wide progress bus, created on first use."""
+    global _BUS
+    with _BUS_LOCK:
+        if _BUS is None:
+            _BUS = ProgressBus(capacity=get_settings().PROGRESS_BUFFER_SIZE)
+        return _BUS
@@ -1,7 +1,10 @@
 """Application settings and helper accessors."""
 
-from functools import lru_cache
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+import threading
 import uuid
 from typing import Any
 
@@ -22,6 +25,21 @@ def _default_headers_factory() -> dict[str, str]:
     }
 
 
+def _default_scheduler_cron_factory() -> dict[str, str]:
+    """Build default cron expressions per request type for the in-process scheduler."""
+    return {
+        "scrape": "0 */6 * * *",
+        "musts": "30 4 * * 1",
+    }
+
+
+def _default_registration_cron_factory() -> dict[str, str]:
+    """Build faster cron overrides used during registration windows."""
+    return {
+        "scrape": "*/20 * * * *",
+    }
+
+
 class Settings(BaseSettings):
     """Typed settings model loaded from environment variables."""
 
@@ -29,6 +47,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # Application settings
@@ -42,8 +61,12 @@ class Settings(BaseSettings):
     S3_ACCESS_KEY_ID: str = ""
     S3_SECRET_ACCESS_KEY: str = ""
     S3_LOCK_OWNER_ID: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    S3_LOCK_TIMEOUT_SECONDS: int = 3 * 60 * 60  # 3 hours
+    S3_LOCK_TIMEOUT_SECONDS: int = 10 * 60  # 10 minutes, extended by heartbeat while a run is active
+    S3_LOCK_HEARTBEAT_SECONDS: int = 60
     ADMIN_LOCK_TIMEOUT_SECONDS: int = 3 * 60 * 60  # 3 hours
+    S3_LOCK_CACHE_SECONDS: float = 2.0
+    STATUS_PUBLISH_COALESCE_SECONDS: float = 0.25
+    STATUS_REFRESH_SECONDS: float = 300.0  # rewrite an unchanged status once updated_at is this old
     # HTTP settings
     HTTP_TIMEOUT: int = 15
     GLOBAL_RETRIES: int = 5
@@ -56,6 +79,9 @@ class Settings(BaseSettings):
     LOG_JSON: bool = False
     LOG_CONSOLE: bool = True
     LOG_RETENTION_DAYS: int = 7
+    LOG_QUEUE_SIZE: int = 10000
+    TRACE_ENABLED: bool = True
+    PROFILE_SAMPLE_INTERVAL_SECONDS: float = 0.01
     TIMEZONE: str = "Europe/Istanbul"
     # Mail logging settings
     MAIL_ENABLED: bool = False
@@ -66,28 +92,107 @@ class Settings(BaseSettings):
     MAIL_SENDER: str = ""
     MAIL_RECIPIENT: str = ""
     MAIL_SUBJECT_PREFIX: str = "[robotdegilim]"
+    MAIL_BATCH_SECONDS: float = 60.0
+    MAIL_MIN_INTERVAL_SECONDS: float = 300.0
+    MAIL_BATCH_MAX_RECORDS: int = 50
     # Paths
     DATA_DIR: str = "data"
     LOG_DIR: str = "data/logs"
     # Scrape process settings
     SCRAPE_PARSER_VERSION: str = "1.0.0"
+    SCRAPE_COMPACT_OUTPUT_ENABLED: bool = True
     # Musts process settings
     MUSTS_PARSER_VERSION: str = "1.0.0"
+    MUSTS_FETCH_WORKERS: int = 8
     # NTE List process settings
     NTE_LIST_PARSER_VERSION: str = "1.0.0"
+    NTE_LIST_FETCH_WORKERS: int = 8
+    NTE_LIST_MAX_PER_HOST: int = 4
+    NTE_LIST_MAX_FAILED_RATIO: float = 0.1  # above this share of failed pages the previous nteList.json is kept
     # AppContext settings
     CONTEXT_MAX_ERRORS: int = 5
+    QUEUE_DRAIN_MAX_JOBS: int = 5
+    QUEUE_DRAIN_SHUTDOWN_TIMEOUT_SECONDS: float = 120.0  # shutdown waits this long for a running drain
+    # Catalog query API settings
+    CATALOG_REFRESH_SECONDS: float = 60.0
+    CATALOG_SEARCH_MAX_RESULTS: int = 50
+    # Schedule engine settings
+    SCHEDULE_MAX_RESULTS: int = 500
+    SCHEDULE_MAX_COURSES: int = 12
+    SCHEDULE_TIMEOUT_SECONDS: float = 2.0
+    SCHEDULE_CACHE_SIZE: int = 256
+    SCHEDULE_BUNDLE_MAX_RESULTS: int = 50
+    SCHEDULE_BUNDLE_SEARCH_LIMIT: int = 2000
+    SCHEDULE_BUNDLE_TIMEOUT_SECONDS: float = 1.0
+    # Progress stream settings
+    PROGRESS_BUFFER_SIZE: int = 256
+    PROGRESS_MAX_WAIT_SECONDS: float = 25.0
+    # Scheduler settings
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_CRON: dict[str, str] = Field(default_factory=_default_scheduler_cron_factory)
+    SCHEDULER_REGISTRATION_CRON: dict[str, str] = Field(default_factory=_default_registration_cron_factory)
+    SCHEDULER_REGISTRATION_WINDOWS: list[str] = Field(default_factory=list)
+    SCHEDULER_JITTER_SECONDS: int = 120
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Return cached Settings instance."""
+_SNAPSHOT: Settings | None = None
+_SNAPSHOT_LOCK = threading.Lock()
+_PINNED: ContextVar[Settings | None] = ContextVar("pinned_settings", default=None)
+
+
+def _build_settings(previous: Settings | None = None) -> Settings:
+    """Load Settings from env/.env and fill derived defaults."""
     settings = Settings()
+    updates: dict[str, Any] = {}
     if not settings.MAIL_SENDER:
-        settings.MAIL_SENDER = settings.MAIL_USERNAME
+        updates["MAIL_SENDER"] = settings.MAIL_USERNAME
     if not settings.MAIL_RECIPIENT:
-        settings.MAIL_RECIPIENT = settings.ADMIN_EMAIL
-    return settings
+        updates["MAIL_RECIPIENT"] = settings.ADMIN_EMAIL
+    if previous is not None and "S3_LOCK_OWNER_ID" not in settings.model_fields_set:
+        # A generated lock owner id must survive reloads, or held locks would look foreign.
+        updates["S3_LOCK_OWNER_ID"] = previous.S3_LOCK_OWNER_ID
+    return settings.model_copy(update=updates) if updates else settings
+
+
+def get_settings() -> Settings:
+    """Return the settings snapshot pinned for the current run, else the latest published one."""
+    global _SNAPSHOT
+    pinned = _PINNED.get()
+    if pinned is not None:
+        return pinned
+    snapshot = _SNAPSHOT
+    if snapshot is None:
+        with _SNAPSHOT_LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = _build_settings()
+            snapshot = _SNAPSHOT
+    return snapshot
+
+
+def reload_settings() -> Settings:
+    """Rebuild settings from env/.env and publish them as the new snapshot.
+
+    Readers keep the snapshot they already hold; runs pinned with
+    `pinned_settings` see the new values from their next run on.
+    """
+    global _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = _build_settings(_SNAPSHOT)
+        return _SNAPSHOT
+
+
+@contextmanager
+def pinned_settings() -> Iterator[Settings]:
+    """Pin the current snapshot so every `get_settings` call in this context returns it.
+
+    The pin is a context variable: asyncio tasks and `fetch_ordered` workers
+    started inside the block inherit it.
+    """
+    token = _PINNED.set(get_settings())
+    try:
+        yield _PINNED.get()
+    finally:
+        _PINNED.reset(token)
 
 
 def get_setting(name: str, default: Any = None) -> Any:
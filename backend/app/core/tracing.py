@@ -0,0 +1,119 @@
+"""Lightweight trace spans exported as JSON lines through the trace logger."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, TypeVar
+
+from app.core.constants import LOGGER_TRACE
+from app.core.errors import AppError
+from app.core.settings import get_settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CURRENT_SPAN: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+_SPAN_IDS = itertools.count(1)
+# Per-process random prefix keeps trace ids unique across restarts.
+_TRACE_PREFIX = os.urandom(4).hex()
+
+
+class Span:
+    """One timed unit of work; children are linked through ``parent_id``."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attrs", "_start_wall", "_start_ns")
+
+    def __init__(self, name: str, parent: "Span | None", attrs: dict[str, Any]):
+        self.name = name
+        self.span_id = f"{next(_SPAN_IDS):x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else f"{_TRACE_PREFIX}-{self.span_id}"
+        self.attrs = attrs
+        self._start_wall = time.time()
+        self._start_ns = time.perf_counter_ns()
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes to the span (exported when it ends)."""
+        self.attrs.update(attrs)
+
+    def _export(self, error: BaseException | None) -> None:
+        """Emit the finished span as one JSON line."""
+        payload: dict[str, Any] = {
+            "trace": self.trace_id,
+            "span": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "ts": round(self._start_wall, 6),
+            "ms": round((time.perf_counter_ns() - self._start_ns) / 1_000_000, 3),
+            "thread": threading.current_thread().name,
+            "status": "ok" if error is None else "error",
+        }
+        if error is not None:
+            payload["error"] = error.code if isinstance(error, AppError) and error.code else type(error).__name__
+        if self.attrs:
+            payload["attrs"] = self.attrs
+        logging.getLogger(LOGGER_TRACE).info(json.dumps(payload, ensure_ascii=False, default=str))
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        """Ignore attributes."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def span(name: str, /, **attrs: Any) -> Iterator[Span | _NoopSpan]:
+    """Time the enclosed block as a child of the current span.
+
+    The active span lives in a context variable, so asyncio tasks inherit it
+    automatically; worker threads inherit it when submitted through
+    `app.utils.concurrency.fetch_ordered`. Exceptions mark the span as failed
+    and propagate unchanged.
+    """
+    if not get_settings().TRACE_ENABLED:
+        yield _NOOP_SPAN
+        return
+    current = Span(name, _CURRENT_SPAN.get(), attrs)
+    token = _CURRENT_SPAN.set(current)
+    error: BaseException | None = None
+    try:
+        yield current
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        current._export(error)
+
+
+def traced(name: str, /, **attrs: Any) -> Callable[[F], F]:
+    """Decorate a function so every call runs inside `span(name, **attrs)`."""
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, **attrs):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def current_span() -> Span | None:
+    """Return the active span in this context, if any."""
+    return _CURRENT_SPAN.get()
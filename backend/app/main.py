@@ -7,12 +7,15 @@ import logging
 from fastapi import FastAPI
 
 from app.api.routes import router
+from app.catalog.service import warm_catalog_index
 from app.core.constants import LOGGER_APP
 from app.core.errors import AppError
 from app.core.logging import log_item
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, shutdown_logging
 from app.core.settings import get_settings
-from app.services.status_service import sync_status_from_locks
+from app.services.request_handler import wait_for_queue_drain
+from app.services.scheduler import RefreshScheduler
+from app.services.status_service import flush_status_publisher, sync_status_from_locks
 
 settings = get_settings()
 
@@ -33,7 +36,24 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
                 cause=e,
             ),
         )
-    yield
+    warm_catalog_index()
+    scheduler: RefreshScheduler | None = None
+    if get_settings().SCHEDULER_ENABLED:
+        scheduler = RefreshScheduler()
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            scheduler.stop()
+        if not wait_for_queue_drain():
+            log_item(
+                LOGGER_APP,
+                logging.WARNING,
+                AppError("Queue drain still running at shutdown; run lock left to expire.", "QUEUE_DRAIN_SHUTDOWN_TIMEOUT"),
+            )
+        flush_status_publisher()
+        shutdown_logging()
 
 
 app = FastAPI(
@@ -1,44 +1,59 @@
 """I/O helpers for NTE available pipeline dependencies and outputs."""
 
+from collections.abc import Mapping
+from pathlib import Path
 from typing import Any
 
 from app.core.constants import DEPARTMENTS_FILE, NTE_LIST_FILE, DATA_FILE
 from app.core.errors import AppError
-from app.core.paths import downloaded_path
+from app.storage.lazy_json import LazyJsonObject, open_json_lazy
 from app.storage.local import read_json
-from app.storage.s3 import download_file, s3_file_exists
+from app.storage.s3 import mirror_file
 
+DEPENDENCY_KEYS: tuple[str, ...] = (DEPARTMENTS_FILE, NTE_LIST_FILE, DATA_FILE)
 
-def download_dependencies() -> None:
-    """Download departments, nte list, and data artifacts from S3 into the local downloaded directory."""
+
+def download_dependencies(keys: tuple[str, ...] = DEPENDENCY_KEYS) -> dict[str, Path]:
+    """Return local mirror paths of the given dependency artifacts, downloading only changed ones."""
     try:
-        exists=s3_file_exists(DEPARTMENTS_FILE) and s3_file_exists(NTE_LIST_FILE) and s3_file_exists(DATA_FILE)
-        if not exists:
-            raise AppError("One or more dependencies do not exist in S3", "DOWNLOAD_DEPENDENCIES_FAILED")
-        download_file(DEPARTMENTS_FILE, downloaded_path(DEPARTMENTS_FILE))
-        download_file(NTE_LIST_FILE, downloaded_path(NTE_LIST_FILE))
-        download_file(DATA_FILE, downloaded_path(DATA_FILE))
+        return {key: mirror_file(key) for key in keys}
     except Exception as e:
-        err = e if isinstance(e, AppError) else AppError(
+        # Always wrapped so mirror errors keep the dependency code callers map to 503.
+        raise AppError(
             "Failed to download dependencies",
             "DOWNLOAD_DEPENDENCIES_FAILED",
             cause=e,
         )
-        raise err
 
 
-def load_dependencies() -> dict[str, Any]:
-    """Load downloaded departments, nte list, and data JSON and validate it as a non-empty mapping."""
+def load_dependencies(
+    *,
+    departments: dict[str, Any] | None = None,
+    nte_list: dict[str, Any] | None = None,
+    data: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Load departments, nte list, and data JSON and validate it as a non-empty mapping.
+
+    Artifacts passed in by an upstream pipeline are used as-is; the others are
+    read from the local storage mirror. A mirrored data.json is opened lazily
+    (see `open_json_lazy`), so callers should close it when done.
+    """
+    opened: LazyJsonObject | None = None
     try:
-        download_dependencies()
-        departments = read_json(downloaded_path(DEPARTMENTS_FILE))
-        nte_list = read_json(downloaded_path(NTE_LIST_FILE))
-        data = read_json(downloaded_path(DATA_FILE))
+        provided = {DEPARTMENTS_FILE: departments, NTE_LIST_FILE: nte_list, DATA_FILE: data}
+        paths = download_dependencies(tuple(key for key, value in provided.items() if value is None))
+        loaded = {key: value if value is not None else read_json(paths[key]) for key, value in provided.items() if key != DATA_FILE}
+        if data is None:
+            opened = open_json_lazy(paths[DATA_FILE])
+        loaded[DATA_FILE] = data if data is not None else opened
+        departments = loaded[DEPARTMENTS_FILE]
+        nte_list = loaded[NTE_LIST_FILE]
+        data = loaded[DATA_FILE]
 
         valid = (
             isinstance(departments, dict)
             and isinstance(nte_list, dict)
-            and isinstance(data, dict)
+            and isinstance(data, Mapping)
             and bool(departments)
             and bool(nte_list)
             and bool(data)
@@ -51,6 +66,8 @@ def load_dependencies() -> dict[str, Any]:
             "data": data,
         }
     except Exception as e:
+        if opened is not None:
+            opened.close()
         err = e if isinstance(e, AppError) else AppError(
             "Failed to load dependencies data",
             "LOAD_DEPENDENCIES_FAILED",
@@ -1,5 +1,6 @@
 """Parsing helpers for NTE pipelines."""
 
+from collections.abc import Mapping
 from typing import Any
 from urllib.parse import urljoin
 
@@ -82,9 +83,11 @@ def extract_courses(
 
 # NTE Available parsing functions
 
+_ALLOWED_DEPARTMENTS: tuple[str, ...] = ("ALL", "TUM", "TÜM")
+
+
 def _is_available_section(section: dict[str, Any]) -> bool:
     """Return True when section has no constraints or is open to all departments."""
-    _ALLOWED = {"ALL", "TUM", "TÜM"}
     constraints = section.get("c", [])
     if not constraints:
         return True
@@ -92,28 +95,99 @@ def _is_available_section(section: dict[str, Any]) -> bool:
         dept_text = str(item.get("d", "")).strip().upper()
         if not dept_text:
             continue
-        if any(allowed in dept_text for allowed in _ALLOWED):
+        if any(allowed in dept_text for allowed in _ALLOWED_DEPARTMENTS):
             return True
     return False
 
+
+def build_availability_index(courses: dict[str, Any]) -> dict[str, tuple[str, ...]]:
+    """Return available section ids per course code (string keys) in one pass over data.json.
+
+    Courses without any available section are omitted.
+    """
+    try:
+        availability: dict[str, tuple[str, ...]] = {}
+        for course_code, course_node in courses.items():
+            if not isinstance(course_node, dict):
+                continue
+            sections = course_node.get("Sections", {})
+            if not isinstance(sections, dict):
+                continue
+            available = tuple(
+                section_id
+                for section_id, section in sections.items()
+                if isinstance(section, dict) and _is_available_section(section)
+            )
+            if available:
+                availability[str(course_code)] = available
+        return availability
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Failed to build section availability index.",
+            "BUILD_AVAILABILITY_INDEX_FAILED",
+            cause=e,
+        )
+        raise err
+
+
+def numeric_code_candidates(prefixed_code: str, dept_map: dict[str, Any]) -> list[str]:
+    """Return numeric course codes that `deptify` could have turned into prefixed_code."""
+    candidates: list[str] = []
+    for dept_code, dept_meta in dept_map.items():
+        prefix = dept_meta.get("p", "") if isinstance(dept_meta, dict) else ""
+        if not prefix or prefix in NO_PREFIX_VARIANTS or not prefixed_code.startswith(prefix):
+            continue
+        rest = prefixed_code[len(prefix):]
+        for numeric in (f"{dept_code}0{rest}", f"{dept_code}{rest}"):
+            if rest.isdigit() and deptify(prefix, numeric) == prefixed_code and numeric not in candidates:
+                candidates.append(numeric)
+    return candidates
+
+
+def select_courses(
+    prefixed_codes: list[str],
+    courses: Mapping[str, Any],
+    dept_map: dict[str, Any],
+) -> dict[str, Any]:
+    """Return the data.json course nodes that may match the given prefixed codes.
+
+    Only these nodes are read from ``courses``, so a lazily decoded catalog is
+    never materialized as a whole.
+    """
+    try:
+        selected: dict[str, Any] = {}
+        for prefixed_code in prefixed_codes:
+            for numeric in numeric_code_candidates(prefixed_code, dept_map):
+                if numeric not in selected and numeric in courses:
+                    selected[numeric] = courses[numeric]
+        return selected
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Failed to select NTE course nodes.",
+            "SELECT_NTE_COURSES_FAILED",
+            cause=e,
+        )
+        raise err
+
+
 def build_available_index(
     courses: dict[str, Any],
     dept_map: dict[str, Any],
+    availability: dict[str, tuple[str, ...]] | None = None,
 ) -> dict[str, dict[str, str]]:
-    """Build index of available courses keyed by prefixed course code."""
+    """Build index of available courses keyed by prefixed course code.
+
+    Pass the result of `build_availability_index` to reuse it across calls.
+    """
     try:
+        if availability is None:
+            availability = build_availability_index(courses)
         index: dict[str, dict[str, str]] = {}
 
         for course_code, course_node in courses.items():
-            if not isinstance(course_node, dict):
-                continue
-            sections = course_node.get("Sections", {})
-            if not isinstance(sections, dict):
-                sections = {}
-            
-            if not any(_is_available_section(s) for s in sections.values()):
-                continue
             course_code_str = str(course_code)
+            if course_code_str not in availability or not isinstance(course_node, dict):
+                continue
             dept_code = course_code_str[:3]
             dept_meta = dept_map.get(dept_code, {})
             dept_prefix = dept_meta.get("p", "") if isinstance(dept_meta, dict) else ""
@@ -163,8 +237,13 @@ def build_course_output(
     course_name: str,
     credits: str,
     courses_data: dict[str, Any],
+    availability: dict[str, tuple[str, ...]] | None = None,
 ) -> dict[str, Any]:
-    """Build output course node with available sections only."""
+    """Build output course node with available sections only.
+
+    With ``availability`` (from `build_availability_index`) the section
+    constraints are not re-evaluated.
+    """
     try:
         course_node = courses_data.get(course_code, {})
         if not isinstance(course_node, dict):
@@ -172,15 +251,19 @@ def build_course_output(
         sections = course_node.get("Sections", {})
         if not isinstance(sections, dict):
             sections = {}
-        
+
+        if availability is not None:
+            available_sections = [(section_id, sections[section_id]) for section_id in availability.get(course_code, ()) if section_id in sections]
+        else:
+            available_sections = [
+                (section_id, section)
+                for section_id, section in sections.items()
+                if isinstance(section, dict) and _is_available_section(section)
+            ]
+
         output_sections: list[dict[str, Any]] = []
         
-        for section_id, section in sections.items():
-            if not isinstance(section, dict):
-                continue
-            if not _is_available_section(section):
-                continue
-            
+        for section_id, section in available_sections:
             times = section.get("t", [])
             if not times:
                 time_list = [{"day": "No Timestamp Added Yet"}]
@@ -1,6 +1,7 @@
 """Musts pipeline orchestrator for building and publishing musts.json."""
 
 import logging
+import time
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -17,6 +18,9 @@ from app.core.constants import (
 from app.core.errors import AppError
 from app.core.logging import log_item
 from app.core.paths import cache_path, published_path, staged_path
+from app.core.progress import ProgressTracker
+from app.core.profiling import profiled
+from app.core.tracing import span, traced
 from app.core.settings import get_settings
 from app.musts.fetch import get_department_catalog_page
 from app.musts.io import load_departments
@@ -24,7 +28,10 @@ from app.musts.parse import extract_dept_node
 from app.storage.local import move_file, write_json
 from app.storage.s3 import upload_file
 from app.utils.cache import CacheStore
+from app.utils.concurrency import fetch_ordered
 from app.pipelines.nte_list import run_nte_list
+from app.pipelines.schedule_bundles import run_schedule_bundles
+from app.pipelines.section_conflicts import run_section_conflicts
 
 MUSTS_DEPENDENCY_ERROR_CODES: tuple[str, ...] = (
     "DOWNLOAD_DEPARTMENTS_FAILED",
@@ -42,11 +49,30 @@ def _is_dependency_error(err: AppError) -> bool:
     return False
 
 
+def _log_department_timings(timings: dict[str, dict[str, float]]) -> None:
+    """Log per-department fetch/parse seconds (DEBUG) and a summary with the slowest fetches."""
+    for dept_code, timing in timings.items():
+        log_item(LOGGER_MUSTS, logging.DEBUG, f"department {dept_code}: fetch {timing['fetch']:.3f}s, parse {timing['parse']:.3f}s")
+    if not timings:
+        return
+    slowest = sorted(timings, key=lambda code: timings[code]["fetch"], reverse=True)[:5]
+    log_item(
+        LOGGER_MUSTS,
+        logging.INFO,
+        f"Department timings: fetch {sum(t['fetch'] for t in timings.values()):.2f}s, "
+        f"parse {sum(t['parse'] for t in timings.values()):.2f}s total; slowest fetches: "
+        + ", ".join(f"{code}={timings[code]['fetch']:.2f}s" for code in slowest),
+    )
+
+
+@profiled("musts")
+@traced("pipeline", pipeline="musts")
 def run_musts() -> tuple[ResponseModel, int]:
     """Execute musts pipeline and publish musts.json artifact.
 
     NTE list refresh is run as best-effort post-step and does not fail musts output.
     """
+    tracker = ProgressTracker("musts")
     try:
         settings = get_settings()
         cache = CacheStore(path=cache_path(MUSTS_CACHE_FILE), parser_version=settings.MUSTS_PARSER_VERSION)
@@ -57,35 +83,43 @@ def run_musts() -> tuple[ResponseModel, int]:
         departments: dict[str, dict[str, Any]] = load_departments()
 
         data: dict[str, dict[int, list[str]]] = {}
-        dept_codes = list(departments.keys())
-        dept_len = len(dept_codes)
-        for index, dept_code in enumerate(dept_codes, start=1):
-            dept_meta = departments.get(dept_code, {})
-            prefix = dept_meta.get("p")
-            if not isinstance(prefix, str) or prefix in NO_PREFIX_VARIANTS:
-                continue
-
-            cache_key, html_hash, response = get_department_catalog_page(dept_code)
+        prefixes: dict[str, str] = {}
+        for dept_code, dept_meta in departments.items():
+            prefix = dept_meta.get("p") if isinstance(dept_meta, dict) else None
+            if isinstance(prefix, str) and prefix not in NO_PREFIX_VARIANTS:
+                prefixes[dept_code] = prefix
+        dept_len = len(prefixes)
+        timings: dict[str, dict[str, float]] = {}
+        tracker.stage("departments")
+        tracker.advance("departments", 0, dept_len, done=0)
+        fetched = fetch_ordered(get_department_catalog_page, prefixes, max_workers=settings.MUSTS_FETCH_WORKERS)
+        for index, (dept_code, (cache_key, html_hash, response), fetch_seconds) in enumerate(fetched, start=1):
+            parse_started = time.perf_counter()
             parsed: dict[str, Any] | None = cache.get(cache_key, html_hash)
 
             dept_node: dict[int, list[str]] = {}
             if parsed:
                 dept_node = parsed["dept_node"]
             else:
-                dept_soup = BeautifulSoup(response.text, "html.parser")
-                dept_node = extract_dept_node(dept_soup)
+                with span("parse", page="department", dept_code=dept_code):
+                    dept_soup = BeautifulSoup(response.text, "html.parser")
+                    dept_node = extract_dept_node(dept_soup)
                 cache.set(cache_key, html_hash, {"dept_node": dept_node})
-            
-            data[prefix] = dept_node
+
+            data[prefixes[dept_code]] = dept_node
+            timings[dept_code] = {"fetch": fetch_seconds, "parse": time.perf_counter() - parse_started}
+            tracker.advance("departments", index, dept_len, done=len(data))
 
             if index % 10 == 0:
                 progress = (index / dept_len) * 100
                 log_item(LOGGER_MUSTS, logging.INFO, f"completed {progress:.2f}% ({index}/{dept_len})")
-        
+
+        _log_department_timings(timings)
         if not data:
             raise AppError("Musts process produced no course data.", "MUSTS_NO_DATA")
         
         cache.flush()
+        tracker.stage("publish")
 
         musts_path = staged_path(MUSTS_FILE)
         musts_published_path = published_path(MUSTS_FILE)
@@ -94,7 +128,28 @@ def run_musts() -> tuple[ResponseModel, int]:
         upload_file(musts_path, MUSTS_FILE)
         move_file(musts_path, musts_published_path)
 
+        try:
+            run_section_conflicts()
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Section conflicts process failed after musts.",
+                "SECTION_CONFLICTS_POST_MUSTS_FAILED",
+                cause=e,
+            )
+            log_item(LOGGER_MUSTS, logging.WARNING, err)
+
+        try:
+            run_schedule_bundles()
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Schedule bundles process failed after musts.",
+                "SCHEDULE_BUNDLES_POST_MUSTS_FAILED",
+                cause=e,
+            )
+            log_item(LOGGER_MUSTS, logging.WARNING, err)
+
         log_item(LOGGER_MUSTS, logging.INFO, "Musts process completed successfully and files uploaded to S3.")
+        tracker.stage("nte_list")
         
         try:
             run_nte_list()
@@ -106,6 +161,7 @@ def run_musts() -> tuple[ResponseModel, int]:
             )
             log_item(LOGGER_MUSTS, logging.WARNING, err)
 
+        tracker.stage("done")
         return ResponseModel(
             request_type=RequestType.MUSTS,
             status="SUCCESS",
@@ -121,6 +177,7 @@ def run_musts() -> tuple[ResponseModel, int]:
             log_item(LOGGER_ERROR, logging.ERROR, err)
             status_code = 500
             message = "Musts process failed, see the error logs for details."
+        tracker.stage("failed", message=err.message)
         return ResponseModel(
             request_type=RequestType.MUSTS,
             status="FAILED",
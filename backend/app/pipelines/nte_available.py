@@ -11,24 +11,46 @@ from app.core.constants import (
 from app.core.errors import AppError
 from app.core.logging import log_item
 from app.core.paths import published_path, staged_path
-from app.nte.parse import build_available_index, extract_nte_courses, build_course_output
+from app.core.progress import ProgressTracker
+from app.core.profiling import profiled
+from app.core.tracing import traced
+from app.nte.parse import build_availability_index, build_available_index, extract_nte_courses, build_course_output, select_courses
 from app.nte.io import load_dependencies
+from app.storage.lazy_json import LazyJsonObject
 from app.storage.local import move_file, write_json
 from app.storage.s3 import upload_file
 
-def run_nte_available() -> str:
-    """Build nteAvailable.json from dependencies and publish it."""
+@profiled("nte_available")
+@traced("pipeline", pipeline="nte_available")
+def run_nte_available(
+    *,
+    data: dict[str, Any] | None = None,
+    departments: dict[str, Any] | None = None,
+) -> str:
+    """Build nteAvailable.json from dependencies and publish it.
+
+    The scrape pipeline passes its freshly built ``data`` and ``departments``
+    (string course-code keys, as published); anything not passed is downloaded.
+    Only the course nodes matching NTE codes are decoded from data.json.
+    """
+    tracker = ProgressTracker("nte_available")
+    courses_source: Any = None
     try:
         log_item(LOGGER_NTE_AVAILABLE, logging.INFO, "NTE available process started.")
+        tracker.stage("dependencies")
 
-        deps = load_dependencies()
+        deps = load_dependencies(data=data, departments=departments)
         departments_data = deps["departments"]
         nte_list = deps["nte_list"]
-        courses_data = deps["data"]
+        courses_source = deps["data"]
 
+        tracker.stage("match")
         nte_courses: list[dict[str, str]] = []
         extract_nte_courses(nte_list, nte_courses)
-        available_index = build_available_index(courses_data, departments_data)
+        nte_codes = [course.get("code", "").strip().upper().replace(" ", "") for course in nte_courses]
+        courses_data = select_courses([code for code in nte_codes if code], courses_source, departments_data)
+        availability = build_availability_index(courses_data)
+        available_index = build_available_index(courses_data, departments_data, availability)
 
         if not available_index:
             raise AppError("No available courses found in dependencies data.", "NTE_AVAILABLE_NO_COURSES")
@@ -47,7 +69,8 @@ def run_nte_available() -> str:
                 prefixed_code=code,
                 course_name=course_info["name"],
                 credits=credits,
-                courses_data=courses_data
+                courses_data=courses_data,
+                availability=availability,
             ))
         
         output.sort(key=lambda item: item.get("code", {}).get("departmental", ""))
@@ -55,6 +78,7 @@ def run_nte_available() -> str:
         if not output:
             raise AppError("No matching NTE courses could be produced from the input data.", "NTE_AVAILABLE_NO_NTE_COURSES")
         
+        tracker.stage("publish")
         output_path = staged_path(NTE_AVAILABLE_FILE)
         output_published_path = published_path(NTE_AVAILABLE_FILE)
 
@@ -63,6 +87,7 @@ def run_nte_available() -> str:
         move_file(output_path, output_published_path)
 
         log_item(LOGGER_NTE_AVAILABLE, logging.INFO, "NTE available process completed successfully and files uploaded to S3.")
+        tracker.stage("done")
         return str(output_published_path)
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
@@ -71,4 +96,8 @@ def run_nte_available() -> str:
             cause=e,
         )
         log_item(LOGGER_ERROR, logging.ERROR, err)
+        tracker.stage("failed", message=err.message)
         raise err
+    finally:
+        if isinstance(courses_source, LazyJsonObject):
+            courses_source.close()
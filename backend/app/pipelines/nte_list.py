@@ -1,6 +1,8 @@
 """NTE list pipeline orchestrator for building and publishing nteList.json."""
 
+from dataclasses import dataclass
 import logging
+import time
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -14,16 +16,38 @@ from app.core.constants import (
 from app.core.errors import AppError
 from app.core.logging import log_item
 from app.core.paths import cache_path, published_path, staged_path
+from app.core.progress import ProgressTracker
+from app.core.profiling import profiled
+from app.core.tracing import span, traced
 from app.core.settings import get_settings
 from app.nte.fetch import get_department_page, get_nte_courses
 from app.nte.parse import extract_courses, extract_department_links
 from app.storage.local import move_file, write_json
 from app.storage.s3 import upload_file
 from app.utils.cache import CacheStore
+from app.utils.concurrency import fetch_ordered, per_host_limited
 
 
-def run_nte_list() -> str:
-    """Build nteList.json from NTE pages, publish it to S3, and return published path."""
+@dataclass(frozen=True)
+class NteListResult:
+    """Summary of a published NTE list run with crawl timings and the links that failed."""
+
+    path: str
+    pages: int
+    failed_links: tuple[str, ...]
+    crawl_seconds: float
+    fetch_seconds: float
+
+
+@profiled("nte_list")
+@traced("pipeline", pipeline="nte_list")
+def run_nte_list() -> NteListResult:
+    """Build nteList.json from NTE pages, publish it to S3, and return the run summary.
+
+    When more than NTE_LIST_MAX_FAILED_RATIO of the department pages fail, the
+    run fails and the previously published nteList.json is kept.
+    """
+    tracker = ProgressTracker("nte_list")
     try:
         settings = get_settings()
         cache = CacheStore(
@@ -49,8 +73,32 @@ def run_nte_list() -> str:
                 raise AppError("Parsed department links are empty.", "NTE_LIST_NO_DEPARTMENT_LINKS")
             cache.set(cache_key, html_hash, {"dept_links": dept_links})
 
-        for link in dept_links:
-            cache_key, html_hash, response = get_department_page(link)
+        links_len = len(dept_links)
+        failed_links: list[str] = []
+        fetch_seconds = 0.0
+        crawl_started = time.perf_counter()
+        tracker.stage("departments")
+        tracker.advance("departments", 0, links_len, done=0)
+        fetched = fetch_ordered(
+            per_host_limited(get_department_page, settings.NTE_LIST_MAX_PER_HOST),
+            dept_links,
+            max_workers=settings.NTE_LIST_FETCH_WORKERS,
+            return_exceptions=True,
+        )
+        for index, (link, page, elapsed) in enumerate(fetched, start=1):
+            tracker.advance("departments", index, links_len, done=len(departments))
+            fetch_seconds += elapsed
+            if isinstance(page, Exception):
+                err = page if isinstance(page, AppError) else AppError(
+                    "Failed to fetch NTE department page",
+                    "NTE_LIST_DEPARTMENT_FETCH_FAILED",
+                    context={"link": link},
+                    cause=page,
+                )
+                log_item(LOGGER_NTE_LIST, logging.WARNING, err)
+                failed_links.append(link)
+                continue
+            cache_key, html_hash, response = page
             parsed = cache.get(cache_key, html_hash)
 
             courses: list[dict[str, str]] = []
@@ -59,8 +107,9 @@ def run_nte_list() -> str:
                 dept_name = parsed.get("dept_name", "")
                 courses = parsed.get("courses", [])
             else:
-                dept_soup = BeautifulSoup(response.text, "html.parser")
-                dept_name = extract_courses(dept_soup, courses)
+                with span("parse", page="nte_department", link=link):
+                    dept_soup = BeautifulSoup(response.text, "html.parser")
+                    dept_name = extract_courses(dept_soup, courses)
                 cache.set(cache_key, html_hash, {"dept_name": dept_name, "courses": courses})
 
             if not dept_name:
@@ -76,8 +125,27 @@ def run_nte_list() -> str:
                 credits = str(course.get("credits", "")).strip()
                 bucket.add((code, name, credits))
 
+        crawl_seconds = time.perf_counter() - crawl_started
+        log_item(
+            LOGGER_NTE_LIST,
+            logging.INFO,
+            f"Department pages: {links_len - len(failed_links)}/{links_len} fetched in "
+            f"{crawl_seconds:.2f}s (fetch time {fetch_seconds:.2f}s), {len(failed_links)} failed",
+        )
+        if len(failed_links) > links_len * settings.NTE_LIST_MAX_FAILED_RATIO:
+            raise AppError(
+                "Too many NTE department pages failed; keeping the previous NTE list.",
+                "NTE_LIST_TOO_MANY_FAILURES",
+                context={
+                    "failed_links": failed_links,
+                    "pages": links_len,
+                    "crawl_seconds": round(crawl_seconds, 3),
+                    "fetch_seconds": round(fetch_seconds, 3),
+                },
+            )
         final_output: dict[str, list[dict[str, str]]] = {}
-        for dept_name, course_set in departments.items():
+        for dept_name in sorted(departments):
+            course_set = departments[dept_name]
             final_output[dept_name] = [
                 {"code": code, "name": name, "credits": credits}
                 for code, name, credits in sorted(course_set)
@@ -87,6 +155,7 @@ def run_nte_list() -> str:
             raise AppError("NTE list process produced no output.", "NTE_LIST_NO_DATA")
 
         cache.flush()
+        tracker.stage("publish")
 
         path = staged_path(NTE_LIST_FILE)
         path_published = published_path(NTE_LIST_FILE)
@@ -96,7 +165,14 @@ def run_nte_list() -> str:
         move_file(path, path_published)
 
         log_item(LOGGER_NTE_LIST, logging.INFO, "NTE list process completed successfully and files uploaded to S3.")
-        return str(path_published)
+        tracker.stage("done")
+        return NteListResult(
+            path=str(path_published),
+            pages=links_len,
+            failed_links=tuple(failed_links),
+            crawl_seconds=crawl_seconds,
+            fetch_seconds=fetch_seconds,
+        )
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
             "NTE list process failed.",
@@ -104,4 +180,5 @@ def run_nte_list() -> str:
             cause=e,
         )
         log_item(LOGGER_ERROR, logging.ERROR, err)
+        tracker.stage("failed", message=err.message)
         raise err
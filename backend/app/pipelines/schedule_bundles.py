@@ -0,0 +1,109 @@
+"""Schedule bundles pipeline for precomputing musts-cohort schedules per department."""
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from app.core.constants import DATA_FILE, LOGGER_SCRAPE, MUSTS_FILE, SCHEDULE_BUNDLES_INDEX_FILE, SECTION_MASKS_FILE
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.paths import published_path, staged_path
+from app.core.settings import get_settings
+from app.core.tracing import traced
+from app.schedule.bundles import build_department_bundles, bundle_key
+from app.schedule.occupancy import decode_section_masks
+from app.storage.lazy_json import LazyJsonObject, open_json_lazy
+from app.storage.local import delete_file as delete_local_file, move_file, read_json, write_json
+from app.storage.s3 import delete_file, mirror_file, upload_file
+from app.storage.s3.store import read_json_if_changed
+from app.utils.cache import hash_content
+
+
+@traced("pipeline", pipeline="schedule_bundles")
+def run_schedule_bundles(
+    masks: dict[str, dict[str, int]] | None = None,
+    data: Mapping[str, Any] | None = None,
+) -> str:
+    """Build per-department schedule bundles from section masks, data.json and musts.json and publish them.
+
+    ``masks`` and ``data`` can be passed in by the scrape pipeline; otherwise the
+    published artifacts are read (data.json lazily from the storage mirror, the
+    rest past the payload cache so decoded inputs are not kept after the run).
+    Bundles whose content hash matches the previously published index (read from
+    storage, or the local copy when storage has none) are not re-uploaded, and
+    bundles of departments no longer in the index are deleted.
+    """
+    opened: LazyJsonObject | None = None
+    try:
+        settings = get_settings()
+        if masks is None:
+            _, payload, _ = read_json_if_changed(SECTION_MASKS_FILE, None)
+            masks = decode_section_masks(payload)
+            if masks is None:
+                raise AppError("Section masks are missing or outdated", "SECTION_MASKS_UNAVAILABLE")
+        _, musts, _ = read_json_if_changed(MUSTS_FILE, None)
+        if not musts:
+            raise AppError("Musts data is missing", "SCHEDULE_BUNDLES_NO_MUSTS")
+        if data is None:
+            opened = open_json_lazy(mirror_file(DATA_FILE))
+            data = opened
+        if not data:
+            raise AppError("Catalog data is missing", "SCHEDULE_BUNDLES_NO_DATA")
+
+        bundles = build_department_bundles(
+            masks,
+            musts,
+            data,
+            limit=settings.SCHEDULE_BUNDLE_MAX_RESULTS,
+            search_limit=settings.SCHEDULE_BUNDLE_SEARCH_LIMIT,
+            timeout=float(settings.SCHEDULE_BUNDLE_TIMEOUT_SECONDS),
+        )
+
+        index_path = staged_path(SCHEDULE_BUNDLES_INDEX_FILE)
+        index_published_path = published_path(SCHEDULE_BUNDLES_INDEX_FILE)
+        _, previous_index, _ = read_json_if_changed(SCHEDULE_BUNDLES_INDEX_FILE, None)
+        previous_entries = (previous_index or read_json(index_published_path)).get("d", {})
+        if not isinstance(previous_entries, dict):
+            previous_entries = {}
+
+        entries: dict[str, dict[str, object]] = {}
+        changed: list[str] = []
+        for prefix in sorted(bundles):
+            bundle_path = write_json(staged_path(bundle_key(prefix)), bundles[prefix], compact=True)
+            with open(bundle_path, "rb") as f:
+                bundle_hash = hash_content(f.read())
+            entries[prefix] = {"k": bundle_key(prefix), "h": bundle_hash, "n": len(bundles[prefix])}
+            previous = previous_entries.get(prefix)
+            if not isinstance(previous, dict) or previous.get("h") != bundle_hash:
+                changed.append(prefix)
+
+        write_json(index_path, {"d": entries})
+        for prefix in changed:
+            upload_file(staged_path(bundle_key(prefix)), bundle_key(prefix))
+        upload_file(index_path, SCHEDULE_BUNDLES_INDEX_FILE)
+
+        for prefix in bundles:
+            move_file(staged_path(bundle_key(prefix)), published_path(bundle_key(prefix)))
+        move_file(index_path, index_published_path)
+
+        removed = sorted(prefix for prefix in previous_entries if prefix not in entries)
+        for prefix in removed:
+            delete_file(bundle_key(prefix))
+            delete_local_file(published_path(bundle_key(prefix)))
+
+        log_item(
+            LOGGER_SCRAPE,
+            logging.INFO,
+            f"Schedule bundles published: {len(changed)} changed of {len(bundles)}, {len(removed)} removed",
+        )
+        return str(index_published_path)
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Schedule bundles processing failed.",
+            "SCHEDULE_BUNDLES_PROCESSING_FAILED",
+            cause=e,
+        )
+        raise err
+    finally:
+        if opened is not None:
+            opened.close()
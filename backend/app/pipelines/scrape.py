@@ -9,7 +9,9 @@ from bs4 import BeautifulSoup
 
 from app.api.schemas import ResponseModel
 from app.core.constants import (
+    DATA_COMPACT_FILE,
     DATA_FILE,
+    DATA_INDEX_FILE,
     DEPARTMENTS_FILE,
     DEPARTMENTS_NO_PREFIX_FILE,
     DEPARTMENTS_OVERRIDES_FILE,
@@ -17,12 +19,16 @@ from app.core.constants import (
     NO_PREFIX_VARIANTS,
     RequestType,
     SCRAPE_CACHE_FILE,
+    SECTION_MASKS_FILE,
     LOGGER_SCRAPE,
     LOGGER_ERROR,
 )
 from app.core.errors import AppError
 from app.core.logging import log_item
 from app.core.paths import cache_path, published_path, raw_path, staged_path
+from app.core.progress import ProgressTracker
+from app.core.profiling import profiled
+from app.core.tracing import span, traced
 from app.core.settings import get_settings
 from app.scrape.fetch import (
     get_course_catalog_page,
@@ -30,7 +36,10 @@ from app.scrape.fetch import (
     get_department_page,
     get_main_page,
 )
+from app.scrape.compact import encode_compact_catalog
 from app.scrape.io import load_local_dept_prefixes
+from app.scrape.shards import build_department_shards, build_shard_index, changed_shards, removed_shards, shard_key
+from app.schedule.occupancy import build_section_masks, encode_section_masks
 from app.scrape.parse import (
     any_course,
     deptify,
@@ -40,20 +49,83 @@ from app.scrape.parse import (
     extract_dept_prefix,
     extract_sections,
 )
-from app.storage.local import move_file, write_json
-from app.storage.s3 import upload_file
-from app.utils.cache import CacheStore
+from app.storage.local import delete_file as delete_local_file, move_file, read_json, write_json
+from app.storage.s3 import delete_file, upload_file
+from app.storage.s3.store import read_json_if_changed
+from app.utils.cache import CacheStore, hash_content
 from app.pipelines.nte_available import run_nte_available
+from app.pipelines.schedule_bundles import run_schedule_bundles
+from app.pipelines.section_conflicts import run_section_conflicts
 
 
+def _previous_published_index(key: str) -> dict[str, Any]:
+    """Return the index last published to storage, or the local published copy when storage has none.
+
+    Storage is authoritative so versions keep counting up on a fresh machine.
+    """
+    _, payload, _ = read_json_if_changed(key, None)
+    return payload if payload else read_json(published_path(key))
+
+
+def _publish_department_shards(data: dict[int, dict[str, Any]], last_updated_info: dict[str, str]) -> None:
+    """Write per-department data shards with an index and upload shards whose content changed.
+
+    Shards of departments missing from the new index are deleted after it is published.
+    """
+    index_path = staged_path(DATA_INDEX_FILE)
+    index_published_path = published_path(DATA_INDEX_FILE)
+    previous_index = _previous_published_index(DATA_INDEX_FILE)
+
+    shards = build_department_shards(data)
+    shard_hashes: dict[str, str] = {}
+    shard_sizes: dict[str, int] = {}
+    for dept_code, shard in shards.items():
+        shard_path = write_json(staged_path(shard_key(dept_code)), shard)
+        with open(shard_path, "rb") as f:
+            shard_hashes[dept_code] = hash_content(f.read())
+        shard_sizes[dept_code] = len(shard)
+
+    entries = build_shard_index(shard_hashes, shard_sizes, previous_index)
+    index = {
+        "t": last_updated_info["t"],
+        "u": last_updated_info["u"],
+        "d": entries,
+    }
+    write_json(index_path, index)
+
+    changed = changed_shards(entries, previous_index)
+    for dept_code in changed:
+        upload_file(staged_path(shard_key(dept_code)), shard_key(dept_code))
+    upload_file(index_path, DATA_INDEX_FILE)
+
+    for dept_code in shards:
+        move_file(staged_path(shard_key(dept_code)), published_path(shard_key(dept_code)))
+    move_file(index_path, index_published_path)
+
+    removed = removed_shards(entries, previous_index)
+    for dept_code in removed:
+        delete_file(shard_key(dept_code))
+        delete_local_file(published_path(shard_key(dept_code)))
+
+    log_item(
+        LOGGER_SCRAPE,
+        logging.INFO,
+        f"Department shards published: {len(changed)} changed of {len(shards)}, {len(removed)} removed",
+    )
+
+
+@profiled("scrape")
+@traced("pipeline", pipeline="scrape")
 def run_scrape() -> tuple[ResponseModel, int]:
     """Run full scrape process, publish output files, and return API response."""
+    tracker = ProgressTracker("scrape")
     try:
         settings = get_settings()
         cache = CacheStore(path=cache_path(SCRAPE_CACHE_FILE), parser_version=settings.SCRAPE_PARSER_VERSION)
         cache.load()
 
         log_item(LOGGER_SCRAPE, logging.INFO, "Scraping process started.")
+        tracker.stage("main_page")
 
         cache_key, html_hash, response = get_main_page()
         parsed = cache.get(cache_key, html_hash)
@@ -84,98 +156,107 @@ def run_scrape() -> tuple[ResponseModel, int]:
         department_prefixes = load_local_dept_prefixes()
         data: dict[int, dict[str, Any]] = {}
         dept_len = len(dept_codes)
+        tracker.stage("departments")
         for index, dept_code in enumerate(dept_codes, start=1):
-            cache_key, html_hash, response = get_department_page(dept_code, current_semester[0])
-            parsed = cache.get(cache_key, html_hash)
-
-            course_codes: list[str] = []
-            course_names: dict[str, str] = {}
-            if parsed:
-                course_codes = parsed["course_codes"]
-                course_names = parsed["course_names"]
-                if len(course_codes) == 0:
-                    if dept_code not in department_prefixes:
-                        department_prefixes[dept_code] = "<no-course>"
-                    continue
-            else:
-                dept_soup = BeautifulSoup(response.text, "html.parser")
-                if not any_course(dept_soup):
-                    if dept_code not in department_prefixes:
-                        department_prefixes[dept_code] = "<no-course>"
-                    cache.set(
-                        cache_key,
-                        html_hash,
-                        {"course_codes": [], "course_names": {}},
-                    )
-                    continue
-                extract_courses(dept_soup, course_codes, course_names)
-                cache.set(
-                    cache_key,
-                    html_hash,
-                    {"course_codes": course_codes, "course_names": course_names},
-                )
-            if len(course_codes) == 0:
-                if dept_code not in department_prefixes:
-                    department_prefixes[dept_code] = "<no-course>"
-                continue
-
-            if dept_code not in department_prefixes or department_prefixes[dept_code] in NO_PREFIX_VARIANTS:
-                try:
-                    cache_key, html_hash, response = get_course_catalog_page(dept_code, course_codes[0])
-                    parsed = cache.get(cache_key, html_hash)
-
-                    dept_prefix = None
-                    if parsed:
-                        dept_prefix = parsed["dept_prefix"]
-                    else:
-                        catalog_soup = BeautifulSoup(response.text, "html.parser")
-                        dept_prefix = extract_dept_prefix(catalog_soup)
-                        if not dept_prefix:
-                            dept_prefix = "<prefix-not-found>"
-                        cache.set(
-                            cache_key,
-                            html_hash,
-                            {"dept_prefix": dept_prefix},
-                        )
-                    department_prefixes[dept_code] = dept_prefix
-                except Exception as e:
-                    err = e if isinstance(e, AppError) else AppError(
-                        message="dept_prefix determination failed",
-                        code="DEPT_PREFIX_FAILED",
-                        context={"dept_code": dept_code},
-                        cause=e,
-                    )
-                    log_item(LOGGER_SCRAPE, logging.WARNING, err)
-                    department_prefixes[dept_code] = "<prefix-not-found>"
-
-            for course_code in course_codes:
-                cache_key, html_hash, response = get_course_page(course_code)
+            tracker.advance("departments", index - 1, dept_len, done=len(data))
+            with span("department", dept_code=dept_code) as dept_span:
+                cache_key, html_hash, response = get_department_page(dept_code, current_semester[0])
                 parsed = cache.get(cache_key, html_hash)
 
-                course_node: dict[str, Any] = {}
+                course_codes: list[str] = []
+                course_names: dict[str, str] = {}
                 if parsed:
-                    course_node = parsed["course_node"]
+                    course_codes = parsed["course_codes"]
+                    course_names = parsed["course_names"]
+                    if len(course_codes) == 0:
+                        if dept_code not in department_prefixes:
+                            department_prefixes[dept_code] = "<no-course>"
+                        continue
                 else:
-                    course_soup = BeautifulSoup(response.text, "html.parser")
-                    sections: dict[str, Any] = {}
-                    extract_sections(cache, course_soup, sections)
-                    course_node["Course Code"] = course_code
-                    if dept_code not in department_prefixes or department_prefixes[dept_code] in NO_PREFIX_VARIANTS:
-                        course_node["Course Name"] = (course_code + " - " + course_names[course_code])
-                    else:
-                        course_node["Course Name"] = (deptify(department_prefixes[dept_code], course_code) + " - " + course_names[course_code])
-                    course_node["Sections"] = sections
+                    dept_soup = BeautifulSoup(response.text, "html.parser")
+                    if not any_course(dept_soup):
+                        if dept_code not in department_prefixes:
+                            department_prefixes[dept_code] = "<no-course>"
+                        cache.set(
+                            cache_key,
+                            html_hash,
+                            {"course_codes": [], "course_names": {}},
+                        )
+                        continue
+                    extract_courses(dept_soup, course_codes, course_names)
                     cache.set(
                         cache_key,
                         html_hash,
-                        {"course_node": course_node},
+                        {"course_codes": course_codes, "course_names": course_names},
                     )
-                data[int(course_code)] = course_node
-            if index % 10 == 0:
-                progress = (index / dept_len) * 100
-                log_item(LOGGER_SCRAPE, logging.INFO, f"completed {progress:.2f}% ({index}/{dept_len})")
+                if len(course_codes) == 0:
+                    if dept_code not in department_prefixes:
+                        department_prefixes[dept_code] = "<no-course>"
+                    continue
+
+                if dept_code not in department_prefixes or department_prefixes[dept_code] in NO_PREFIX_VARIANTS:
+                    try:
+                        cache_key, html_hash, response = get_course_catalog_page(dept_code, course_codes[0])
+                        parsed = cache.get(cache_key, html_hash)
+
+                        dept_prefix = None
+                        if parsed:
+                            dept_prefix = parsed["dept_prefix"]
+                        else:
+                            catalog_soup = BeautifulSoup(response.text, "html.parser")
+                            dept_prefix = extract_dept_prefix(catalog_soup)
+                            if not dept_prefix:
+                                dept_prefix = "<prefix-not-found>"
+                            cache.set(
+                                cache_key,
+                                html_hash,
+                                {"dept_prefix": dept_prefix},
+                            )
+                        department_prefixes[dept_code] = dept_prefix
+                    except Exception as e:
+                        err = e if isinstance(e, AppError) else AppError(
+                            message="dept_prefix determination failed",
+                            code="DEPT_PREFIX_FAILED",
+                            context={"dept_code": dept_code},
+                            cause=e,
+                        )
+                        log_item(LOGGER_SCRAPE, logging.WARNING, err)
+                        department_prefixes[dept_code] = "<prefix-not-found>"
+
+                dept_span.set(courses=len(course_codes))
+                for course_code in course_codes:
+                    with span("course", course_code=course_code) as course_span:
+                        cache_key, html_hash, response = get_course_page(course_code)
+                        parsed = cache.get(cache_key, html_hash)
+                        course_span.set(cached=bool(parsed))
+
+                        course_node: dict[str, Any] = {}
+                        if parsed:
+                            course_node = parsed["course_node"]
+                        else:
+                            with span("parse", page="course"):
+                                course_soup = BeautifulSoup(response.text, "html.parser")
+                                sections: dict[str, Any] = {}
+                                extract_sections(cache, course_soup, sections)
+                            course_node["Course Code"] = course_code
+                            if dept_code not in department_prefixes or department_prefixes[dept_code] in NO_PREFIX_VARIANTS:
+                                course_node["Course Name"] = (course_code + " - " + course_names[course_code])
+                            else:
+                                course_node["Course Name"] = (deptify(department_prefixes[dept_code], course_code) + " - " + course_names[course_code])
+                            course_node["Sections"] = sections
+                            cache.set(
+                                cache_key,
+                                html_hash,
+                                {"course_node": course_node},
+                            )
+                        data[int(course_code)] = course_node
+                if index % 10 == 0:
+                    progress = (index / dept_len) * 100
+                    log_item(LOGGER_SCRAPE, logging.INFO, f"completed {progress:.2f}% ({index}/{dept_len})")
+        tracker.advance("departments", dept_len, dept_len, done=len(data))
 
         cache.flush()
+        tracker.stage("publish")
 
         departments_json: dict[str, dict[str, str]] = {}
         departments_noprefix: dict[str, dict[str, str]] = {}
@@ -224,10 +305,45 @@ def run_scrape() -> tuple[ResponseModel, int]:
         move_file(data_path, data_published_path)
         move_file(last_updated_path, last_updated_published_path)
 
+        _publish_department_shards(data, last_updated_info)
+
+        if settings.SCRAPE_COMPACT_OUTPUT_ENABLED:
+            data_compact_path = staged_path(DATA_COMPACT_FILE)
+            write_json(data_compact_path, encode_compact_catalog(data), compact=True)
+            upload_file(data_compact_path, DATA_COMPACT_FILE)
+            move_file(data_compact_path, published_path(DATA_COMPACT_FILE))
+
+        section_masks = build_section_masks(data)
+        section_masks_path = staged_path(SECTION_MASKS_FILE)
+        write_json(section_masks_path, encode_section_masks(section_masks), compact=True)
+        upload_file(section_masks_path, SECTION_MASKS_FILE)
+        move_file(section_masks_path, published_path(SECTION_MASKS_FILE))
+
+        try:
+            run_section_conflicts(section_masks)
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Section conflicts process failed after scrape.",
+                "SECTION_CONFLICTS_POST_SCRAPE_FAILED",
+                cause=e,
+            )
+            log_item(LOGGER_SCRAPE, logging.WARNING, err)
+
+        try:
+            run_schedule_bundles(section_masks, {str(code): node for code, node in data.items()})
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Schedule bundles process failed after scrape.",
+                "SCHEDULE_BUNDLES_POST_SCRAPE_FAILED",
+                cause=e,
+            )
+            log_item(LOGGER_SCRAPE, logging.WARNING, err)
+
         log_item(LOGGER_SCRAPE, logging.INFO, "Scraping process completed successfully and files uploaded to S3.")
+        tracker.stage("nte_available")
         
         try:
-            run_nte_available()
+            run_nte_available(data={str(code): node for code, node in data.items()}, departments=departments_json)
         except Exception as e:
             err = e if isinstance(e, AppError) else AppError(
                 "NTE available process failed after scrape.",
@@ -236,6 +352,7 @@ def run_scrape() -> tuple[ResponseModel, int]:
             )
             log_item(LOGGER_SCRAPE, logging.WARNING, err)
         
+        tracker.stage("done")
         return ResponseModel(request_type=RequestType.SCRAPE, status="SUCCESS", message="Scraping process completed successfully and files uploaded to S3."), 200
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
@@ -244,4 +361,5 @@ def run_scrape() -> tuple[ResponseModel, int]:
             cause=e,
         )
         log_item(LOGGER_ERROR, logging.ERROR, err)
+        tracker.stage("failed", message=err.message)
         return ResponseModel(request_type=RequestType.SCRAPE, status="FAILED", message="Scrape process failed, see the error logs for details."), 500
@@ -0,0 +1,50 @@
+"""Section conflicts pipeline for building and publishing sectionConflicts.json."""
+
+import logging
+
+from app.core.constants import LOGGER_SCRAPE, MUSTS_FILE, SECTION_CONFLICTS_FILE, SECTION_MASKS_FILE
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.paths import published_path, staged_path
+from app.core.tracing import traced
+from app.schedule.conflicts import build_conflict_index
+from app.schedule.occupancy import decode_section_masks
+from app.storage.local import move_file, write_json
+from app.storage.s3 import upload_file
+from app.storage.s3.store import read_json_if_changed
+
+
+@traced("pipeline", pipeline="section_conflicts")
+def run_section_conflicts(masks: dict[str, dict[str, int]] | None = None) -> str:
+    """Build sectionConflicts.json from section masks and musts.json and publish it.
+
+    ``masks`` can be passed in by the scrape pipeline; otherwise the published
+    sectionMasks.json is read from storage. Inputs are read past the payload
+    cache so the decoded artifacts are not kept once the index is published.
+    """
+    try:
+        if masks is None:
+            _, payload, _ = read_json_if_changed(SECTION_MASKS_FILE, None)
+            masks = decode_section_masks(payload)
+            if masks is None:
+                raise AppError("Section masks are missing or outdated", "SECTION_MASKS_UNAVAILABLE")
+        _, musts, _ = read_json_if_changed(MUSTS_FILE, None)
+        if not musts:
+            raise AppError("Musts data is missing", "SECTION_CONFLICTS_NO_MUSTS")
+
+        index = build_conflict_index(masks, musts)
+        output_path = staged_path(SECTION_CONFLICTS_FILE)
+        output_published_path = published_path(SECTION_CONFLICTS_FILE)
+        write_json(output_path, index, compact=True)
+        upload_file(output_path, SECTION_CONFLICTS_FILE)
+        move_file(output_path, output_published_path)
+
+        log_item(LOGGER_SCRAPE, logging.INFO, f"Section conflicts published for {len(index['c'])} departments.")
+        return str(output_published_path)
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            "Section conflicts processing failed.",
+            "SECTION_CONFLICTS_PROCESSING_FAILED",
+            cause=e,
+        )
+        raise err
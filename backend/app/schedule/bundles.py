@@ -0,0 +1,138 @@
+"""Precomputed, ranked schedule bundles for musts cohorts (department prefix + semester)."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from app.core.constants import SCHEDULE_BUNDLES_DIR
+from app.core.errors import AppError
+from app.schedule.engine import CourseChoice, generate_schedules
+from app.schedule.occupancy import DAYS_PER_WEEK, SLOTS_PER_DAY
+
+_DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+
+
+def bundle_key(prefix: str) -> str:
+    """Return storage key of a department's schedule bundle."""
+    return f"{SCHEDULE_BUNDLES_DIR}/{prefix}.json"
+
+
+def schedule_rank(occupied: int) -> tuple[int, int]:
+    """Rank a combined weekly mask: fewer campus days first, then fewer idle slots between lectures."""
+    days = 0
+    gaps = 0
+    for day in range(DAYS_PER_WEEK):
+        bits = (occupied >> (day * SLOTS_PER_DAY)) & _DAY_MASK
+        if not bits:
+            continue
+        days += 1
+        first = (bits & -bits).bit_length() - 1
+        span = bits.bit_length() - first
+        gaps += span - bin(bits).count("1")
+    return days, gaps
+
+
+def admits_department(section: dict[str, Any], prefix: str) -> bool:
+    """Return whether any section criterion admits students of department prefix."""
+    return any(criterion.get("d") in ("ALL", prefix) for criterion in section.get("c", []) if isinstance(criterion, dict))
+
+
+def cohort_masks(
+    codes: list[str],
+    masks: dict[str, dict[str, int]],
+    data: Mapping[str, Any],
+    prefix: str,
+) -> dict[str, dict[str, int]]:
+    """Return masks of the cohort's courses limited to sections open to department prefix.
+
+    ``data`` may be keyed by string codes (published data.json) or integer codes
+    (in-memory scrape output).
+    """
+    restricted: dict[str, dict[str, int]] = {}
+    for code in dict.fromkeys(str(code) for code in codes):
+        course = data.get(code)
+        if course is None and code.isdigit():
+            course = data.get(int(code))
+        sections = course.get("Sections", {}) if isinstance(course, dict) else {}
+        restricted[code] = {
+            section_id: mask
+            for section_id, mask in masks.get(code, {}).items()
+            if isinstance(sections.get(section_id), dict) and admits_department(sections[section_id], prefix)
+        }
+    return restricted
+
+
+def build_cohort_bundle(
+    codes: list[str],
+    masks: dict[str, dict[str, int]],
+    *,
+    limit: int,
+    search_limit: int,
+    timeout: float,
+) -> dict[str, Any] | None:
+    """Search clash-free combinations of a cohort's must courses and keep the best ranked ones.
+
+    The search stops after ``search_limit`` combinations and only those are
+    ranked, so when ``"x"`` (exhausted) is false the bundle is the best of the
+    combinations found first, not necessarily the best overall.
+
+    Returns ``{"c": [codes], "s": [[section per code]], "x": exhausted}`` or None
+    when no listed course has section data.
+    """
+    known = [str(code) for code in dict.fromkeys(codes) if str(code) in masks and masks[str(code)]]
+    if not known:
+        return None
+    choices = [CourseChoice(code=code, sections=masks[code]) for code in known]
+    result = generate_schedules(choices, limit=max(limit, search_limit), timeout=timeout)
+
+    ranked: list[tuple[tuple[int, int], list[str]]] = []
+    for schedule in result.schedules:
+        occupied = 0
+        sections: list[str] = []
+        for code, section_id in schedule:
+            occupied |= masks[code][section_id]
+            sections.append(section_id)
+        ranked.append((schedule_rank(occupied), sections))
+    ranked.sort(key=lambda item: item[0])
+    return {"c": known, "s": [sections for _, sections in ranked[:limit]], "x": result.exhausted}
+
+
+def build_department_bundles(
+    masks: dict[str, dict[str, int]],
+    musts: dict[str, dict[str, list[str]]],
+    data: Mapping[str, Any],
+    *,
+    limit: int,
+    search_limit: int,
+    timeout: float,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Build schedule bundles for every (prefix, semester) cohort in musts.json.
+
+    Sections whose criteria do not admit the cohort's department are left out
+    before searching.
+    """
+    try:
+        bundles: dict[str, dict[str, dict[str, Any]]] = {}
+        for prefix, semesters in (musts or {}).items():
+            if not isinstance(semesters, dict):
+                continue
+            node: dict[str, dict[str, Any]] = {}
+            for semester, codes in semesters.items():
+                if not isinstance(codes, list):
+                    continue
+                bundle = build_cohort_bundle(
+                    codes,
+                    cohort_masks(codes, masks, data, prefix),
+                    limit=limit,
+                    search_limit=search_limit,
+                    timeout=timeout,
+                )
+                if bundle is not None:
+                    node[str(semester)] = bundle
+            if node:
+                bundles[prefix] = node
+        return bundles
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to build schedule bundles", "SCHEDULE_BUNDLES_BUILD_FAILED", cause=e)
+        raise err
@@ -0,0 +1,46 @@
+"""Section-pair conflict index for courses commonly taken together (musts cohorts)."""
+
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Any
+
+from app.core.errors import AppError
+
+CONFLICTS_FORMAT_VERSION = 1
+
+
+def cohort_conflicts(codes: list[str], masks: dict[str, dict[str, int]]) -> list[list[str]]:
+    """Return clashing section pairs ``[code_a, section_a, code_b, section_b]`` for one cohort.
+
+    Codes missing from masks are ignored; each pair is listed once with
+    ``code_a < code_b``.
+    """
+    known = sorted({str(code) for code in codes if str(code) in masks})
+    pairs: list[list[str]] = []
+    for code_a, code_b in combinations(known, 2):
+        sections_b = masks[code_b].items()
+        for section_a, mask_a in masks[code_a].items():
+            if not mask_a:
+                continue
+            pairs.extend([code_a, section_a, code_b, section_b] for section_b, mask_b in sections_b if mask_a & mask_b)
+    return pairs
+
+
+def build_conflict_index(masks: dict[str, dict[str, int]], musts: dict[str, dict[str, list[str]]]) -> dict[str, Any]:
+    """Build the sectionConflicts.json payload from section masks and musts.json."""
+    try:
+        index: dict[str, dict[str, list[list[str]]]] = {}
+        for prefix, semesters in (musts or {}).items():
+            if not isinstance(semesters, dict):
+                continue
+            cohort_index = {
+                str(semester): cohort_conflicts(codes, masks)
+                for semester, codes in semesters.items()
+                if isinstance(codes, list)
+            }
+            index[prefix] = {semester: pairs for semester, pairs in cohort_index.items() if pairs}
+        return {"v": CONFLICTS_FORMAT_VERSION, "c": {prefix: node for prefix, node in index.items() if node}}
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to build section conflict index", "SECTION_CONFLICTS_BUILD_FAILED", cause=e)
+        raise err
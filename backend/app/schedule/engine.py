@@ -0,0 +1,111 @@
+"""Pruned backtracking search over section occupancy bitmasks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import product
+import time
+
+# Check the deadline once per this many visited search nodes.
+_DEADLINE_CHECK_INTERVAL = 256
+
+
+@dataclass
+class CourseChoice:
+    """Candidate sections of one course for the search.
+
+    ``sections`` maps section id to occupancy mask. Courses with
+    ``check_collision=False`` never clash and do not occupy time.
+    """
+
+    code: str
+    sections: dict[str, int]
+    check_collision: bool = True
+
+
+@dataclass
+class ScheduleResult:
+    """Search outcome; ``exhausted`` is True when every combination was considered."""
+
+    schedules: list[list[tuple[str, str]]] = field(default_factory=list)
+    exhausted: bool = True
+    timed_out: bool = False
+    visited: int = 0
+
+
+class _Timeout(Exception):
+    """Internal signal used to unwind the search at the deadline."""
+
+
+def _group_by_mask(sections: dict[str, int], blocked: int, check_collision: bool) -> list[tuple[int, list[str]]]:
+    """Group interchangeable sections (same mask) and drop ones hitting blocked slots."""
+    groups: dict[int, list[str]] = {}
+    for section_id, mask in sections.items():
+        effective = mask if check_collision else 0
+        if effective & blocked:
+            continue
+        groups.setdefault(effective, []).append(section_id)
+    return sorted(groups.items(), key=lambda item: (bin(item[0]).count("1"), item[1]))
+
+
+def generate_schedules(
+    courses: list[CourseChoice],
+    *,
+    blocked_mask: int = 0,
+    limit: int = 100,
+    timeout: float = 2.0,
+) -> ScheduleResult:
+    """Return up to limit clash-free section combinations.
+
+    Sections with identical masks are searched once and expanded at the end,
+    courses with the fewest options are placed first, and a branch is cut as
+    soon as any remaining course has no option compatible with the occupied
+    slots (forward checking). The search stops at ``timeout`` seconds.
+    """
+    result = ScheduleResult()
+    if not courses or limit <= 0:
+        return result
+
+    options = [_group_by_mask(course.sections, blocked_mask, course.check_collision) for course in courses]
+    if any(not groups for groups in options):
+        return result
+    order = sorted(range(len(courses)), key=lambda i: len(options[i]))
+    deadline = time.monotonic() + max(0.0, timeout)
+    chosen: list[list[str]] = [[] for _ in courses]
+
+    def _emit() -> bool:
+        """Expand the current group choice into concrete schedules; True when limit reached."""
+        for combo in product(*chosen):
+            result.schedules.append([(courses[i].code, combo[i]) for i in range(len(courses))])
+            if len(result.schedules) >= limit:
+                return True
+        return False
+
+    def _search(depth: int, occupied: int) -> bool:
+        result.visited += 1
+        if result.visited % _DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            raise _Timeout()
+        if depth == len(order):
+            return _emit()
+        course_index = order[depth]
+        for mask, section_ids in options[course_index]:
+            if mask & occupied:
+                continue
+            next_occupied = occupied | mask
+            if any(
+                all(other_mask & next_occupied for other_mask, _ in options[later])
+                for later in order[depth + 1:]
+            ):
+                continue
+            chosen[course_index] = section_ids
+            if _search(depth + 1, next_occupied):
+                return True
+        return False
+
+    try:
+        if _search(0, 0):
+            result.exhausted = False
+    except _Timeout:
+        result.exhausted = False
+        result.timed_out = True
+    return result
@@ -0,0 +1,97 @@
+"""Weekly occupancy bitmasks for course sections.
+
+The week is split into fixed ``SLOT_MINUTES`` cells; bit ``day * SLOTS_PER_DAY +
+minute // SLOT_MINUTES`` is set when a lecture covers that cell. Lecture
+intervals are half-open: a lecture ending at 09:30 does not clash with one
+starting at 09:30. Two sections clash exactly when ``mask_a & mask_b != 0``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.errors import AppError
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAYS_PER_WEEK = 7
+MASK_FORMAT_VERSION = 1
+
+
+def parse_minutes(value: Any) -> int | None:
+    """Parse an ``H:MM``/``HH:MM`` time string into minutes since midnight."""
+    hours, sep, minutes = str(value or "").strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit():
+        return None
+    total = int(hours) * 60 + int(minutes)
+    return total if 0 <= total <= 24 * 60 else None
+
+
+def interval_mask(day: int, start_minute: int, end_minute: int) -> int:
+    """Return mask bits for [start_minute, end_minute) on day, rounded outward to slots."""
+    if not 0 <= day < DAYS_PER_WEEK or end_minute <= start_minute:
+        return 0
+    first = start_minute // SLOT_MINUTES
+    last = -(-end_minute // SLOT_MINUTES)
+    width = last - first
+    return ((1 << width) - 1) << (day * SLOTS_PER_DAY + first)
+
+
+def section_mask(section: dict[str, Any]) -> int:
+    """Return occupancy mask of a data.json section node (``"t"`` lecture times)."""
+    mask = 0
+    for time_slot in section.get("t", []) if isinstance(section, dict) else []:
+        start = parse_minutes(time_slot.get("s"))
+        end = parse_minutes(time_slot.get("e"))
+        if start is None or end is None:
+            continue
+        try:
+            day = int(time_slot.get("d", -1))
+        except (TypeError, ValueError):
+            continue
+        mask |= interval_mask(day, start, end)
+    return mask
+
+
+def build_section_masks(data: dict[Any, dict[str, Any]]) -> dict[str, dict[str, int]]:
+    """Compute masks for every section in a data.json-shaped catalog."""
+    try:
+        masks: dict[str, dict[str, int]] = {}
+        for course_code, course_node in data.items():
+            sections = course_node.get("Sections", {}) if isinstance(course_node, dict) else {}
+            masks[str(course_code)] = {
+                str(section_id): section_mask(section) for section_id, section in sections.items()
+            }
+        return masks
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to build section masks", "SECTION_MASKS_BUILD_FAILED", cause=e)
+        raise err
+
+
+def encode_mask(mask: int) -> str:
+    """Encode a mask as lower-case hex (JSON numbers cannot hold 2016 bits)."""
+    return format(mask, "x")
+
+
+def decode_mask(text: str) -> int:
+    """Decode a hex mask produced by `encode_mask`."""
+    return int(text, 16) if text else 0
+
+
+def encode_section_masks(masks: dict[str, dict[str, int]]) -> dict[str, Any]:
+    """Build the sectionMasks.json payload."""
+    return {
+        "v": MASK_FORMAT_VERSION,
+        "slot_minutes": SLOT_MINUTES,
+        "m": {code: {section_id: encode_mask(mask) for section_id, mask in sections.items()} for code, sections in masks.items()},
+    }
+
+
+def decode_section_masks(payload: dict[str, Any] | None) -> dict[str, dict[str, int]] | None:
+    """Decode a sectionMasks.json payload; None when missing or from another layout."""
+    if not payload or payload.get("v") != MASK_FORMAT_VERSION or payload.get("slot_minutes") != SLOT_MINUTES:
+        return None
+    return {
+        code: {section_id: decode_mask(text) for section_id, text in sections.items()}
+        for code, sections in payload.get("m", {}).items()
+    }
@@ -0,0 +1,168 @@
+"""Schedule generation service on top of the catalog index and precomputed masks."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+from app.catalog.index import CatalogIndex
+from app.catalog.service import catalog_generation, get_catalog_index
+from app.core.constants import SECTION_MASKS_FILE
+from app.core.errors import AppError
+from app.core.settings import get_settings
+from app.schedule.engine import CourseChoice, ScheduleResult, generate_schedules
+from app.schedule.occupancy import decode_section_masks, interval_mask, parse_minutes, section_mask
+from app.storage.s3.store import read_json_if_changed
+
+_TURKISH_ALPHABET = "ABCÇDEFGĞHIİJKLMNOÖPQRSŞTUÜVWXYZ"
+_LETTER_RANK = {letter: rank for rank, letter in enumerate(_TURKISH_ALPHABET, start=1)}
+
+
+@dataclass(frozen=True)
+class CourseRequest:
+    """One requested course with optional section whitelist and check toggles."""
+
+    code: str
+    sections: tuple[str, ...] | None = None
+    check_collision: bool = True
+    check_department: bool = True
+    check_surname: bool = True
+
+
+@dataclass(frozen=True)
+class ScheduleQuery:
+    """Normalized, hashable schedule request (used as cache key)."""
+
+    courses: tuple[CourseRequest, ...]
+    blocks: tuple[tuple[int, str, str], ...] = ()
+    surname: str | None = None
+    department: str | None = None
+    limit: int = 100
+
+
+def _upper_tr(text: str) -> str:
+    """Upper-case text with Turkish dotted/dotless i rules."""
+    return text.replace("i", "İ").replace("ı", "I").upper()
+
+
+def _surname_key(text: str) -> tuple[int, int]:
+    """Rank the first two letters of a surname in Turkish alphabetical order."""
+    letters = _upper_tr(text.strip())[:2].ljust(2, "A")
+    return _LETTER_RANK.get(letters[0], 0), _LETTER_RANK.get(letters[1], 0)
+
+
+def section_allowed(section: dict[str, Any], course: CourseRequest, *, surname: str | None, department: str | None) -> bool:
+    """Return whether any section criterion admits the student (department and surname range)."""
+    check_department = course.check_department and bool(department)
+    check_surname = course.check_surname and bool(surname)
+    if not check_department and not check_surname:
+        return True
+    for criterion in section.get("c", []):
+        if check_department and criterion.get("d") not in ("ALL", department):
+            continue
+        if check_surname and not (
+            _surname_key(str(criterion.get("s", "AA"))) <= _surname_key(surname or "") <= _surname_key(str(criterion.get("e", "ZZ")))
+        ):
+            continue
+        return True
+    return False
+
+
+class _MaskTable:
+    """Section masks from the published sectionMasks.json, refreshed by ETag."""
+
+    def __init__(self) -> None:
+        self.etag: str | None = None
+        self.masks: dict[str, dict[str, int]] = {}
+        self.checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def current(self) -> tuple[str | None, dict[str, dict[str, int]]]:
+        """Return the ETag and decoded masks, revalidating at most every CATALOG_REFRESH_SECONDS.
+
+        Only the decoded masks are kept; the raw payload is not cached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.checked_at is None or now - self.checked_at > float(get_settings().CATALOG_REFRESH_SECONDS):
+                modified, payload, etag = read_json_if_changed(SECTION_MASKS_FILE, self.etag)
+                if modified:
+                    self.masks = decode_section_masks(payload) or {}
+                    self.etag = etag
+                self.checked_at = now
+            return self.etag, self.masks
+
+
+_MASKS = _MaskTable()
+_RESULT_CACHE: OrderedDict[tuple[Any, ...], ScheduleResult] = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _course_choice(index: CatalogIndex, masks: dict[str, dict[str, int]], course: CourseRequest, query: ScheduleQuery) -> CourseChoice:
+    """Resolve a requested course into candidate sections with masks."""
+    numeric = index.resolve_code(course.code)
+    if numeric is None:
+        raise AppError("Unknown course code", "SCHEDULE_UNKNOWN_COURSE", context={"code": course.code})
+    sections: dict[str, Any] = index.courses[numeric].get("Sections", {})
+    known_masks = masks.get(numeric, {})
+    candidates: dict[str, int] = {}
+    for section_id, section in sections.items():
+        if course.sections is not None and section_id not in course.sections:
+            continue
+        if not section_allowed(section, course, surname=query.surname, department=query.department):
+            continue
+        mask = known_masks.get(section_id)
+        candidates[section_id] = section_mask(section) if mask is None else mask
+    return CourseChoice(code=numeric, sections=candidates, check_collision=course.check_collision)
+
+
+def _blocked_mask(blocks: tuple[tuple[int, str, str], ...]) -> int:
+    """Combine "don't fill" blocks into one mask."""
+    mask = 0
+    for day, start, end in blocks:
+        start_minute, end_minute = parse_minutes(start), parse_minutes(end)
+        if start_minute is None or end_minute is None:
+            raise AppError("Invalid blocked time range", "SCHEDULE_INVALID_BLOCK", context={"d": day, "s": start, "e": end})
+        mask |= interval_mask(day, start_minute, end_minute)
+    return mask
+
+
+def find_schedules(query: ScheduleQuery) -> ScheduleResult:
+    """Run (or reuse a cached) schedule search for query against the current catalog."""
+    try:
+        settings = get_settings()
+        generation = catalog_generation()
+        index = get_catalog_index()
+        masks_etag, masks = _MASKS.current()
+        cache_key = (generation, masks_etag, query)
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+                return cached
+
+        choices = [_course_choice(index, masks, course, query) for course in query.courses]
+        result = generate_schedules(
+            choices,
+            blocked_mask=_blocked_mask(query.blocks),
+            limit=min(query.limit, settings.SCHEDULE_MAX_RESULTS),
+            timeout=float(settings.SCHEDULE_TIMEOUT_SECONDS),
+        )
+        if not result.timed_out:
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[cache_key] = result
+                while len(_RESULT_CACHE) > max(0, settings.SCHEDULE_CACHE_SIZE):
+                    _RESULT_CACHE.popitem(last=False)
+        return result
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to generate schedules", "SCHEDULE_FAILED", cause=e)
+        raise err
+
+
+def clear_schedule_cache() -> None:
+    """Drop cached search results."""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
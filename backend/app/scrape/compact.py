@@ -0,0 +1,162 @@
+"""Compact columnar encoding of the course catalog artifact with a reference decoder.
+
+Layout (all list columns are aligned by row index):
+
+- ``v``: format version.
+- ``strings``: interned string table; every text value is stored as an index into it.
+- ``courses``: ``k`` numeric course keys, ``c`` course code, ``n`` course name,
+  ``so`` section offsets (length ``len(k) + 1``) into the section columns.
+- ``sections``: ``id`` section code, ``io``/``co``/``to`` offsets into the
+  instructor, constraint and time columns.
+- ``instructors``: ``s`` instructor names.
+- ``constraints``: ``d`` department, ``s`` start, ``e`` end.
+- ``times``: ``d`` day index, ``s``/``e`` packed times, ``p`` room.
+
+Packed times are minutes since midnight when the source text is a canonical
+``HH:MM`` value; any other text is stored as ``-(string_index + 1)`` so that
+decoding always reproduces the original string.
+"""
+
+from typing import Any
+
+from app.core.errors import AppError
+
+COMPACT_FORMAT_VERSION = 1
+
+
+class _StringTable:
+    """Insertion-ordered string interning table."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def intern(self, value: Any) -> int:
+        """Return table index for value, adding it when unseen."""
+        text = "" if value is None else str(value)
+        index = self._index.get(text)
+        if index is None:
+            index = len(self.values)
+            self.values.append(text)
+            self._index[text] = index
+        return index
+
+
+def _pack_time(value: Any, strings: _StringTable) -> int:
+    """Pack a time string into minutes since midnight, or a negative string reference."""
+    text = "" if value is None else str(value)
+    hours, sep, minutes = text.partition(":")
+    if sep and len(hours) == 2 and len(minutes) == 2 and hours.isdigit() and minutes.isdigit():
+        packed = int(hours) * 60 + int(minutes)
+        if packed < 24 * 60:
+            return packed
+    return -(strings.intern(text) + 1)
+
+
+def _unpack_time(packed: int, strings: list[str]) -> str:
+    """Reverse `_pack_time`."""
+    if packed < 0:
+        return strings[-packed - 1]
+    return f"{packed // 60:02d}:{packed % 60:02d}"
+
+
+def encode_compact_catalog(data: dict[Any, dict[str, Any]]) -> dict[str, Any]:
+    """Encode course data (as written to data.json) into the compact columnar layout."""
+    try:
+        strings = _StringTable()
+        courses: dict[str, list[int]] = {"k": [], "c": [], "n": [], "so": [0]}
+        sections: dict[str, list[int]] = {"id": [], "io": [0], "co": [0], "to": [0]}
+        instructors: dict[str, list[int]] = {"s": []}
+        constraints: dict[str, list[int]] = {"d": [], "s": [], "e": []}
+        times: dict[str, list[int]] = {"d": [], "s": [], "e": [], "p": []}
+
+        for course_key in sorted(data, key=int):
+            course_node = data[course_key]
+            courses["k"].append(int(course_key))
+            courses["c"].append(strings.intern(course_node.get("Course Code", "")))
+            courses["n"].append(strings.intern(course_node.get("Course Name", "")))
+
+            for section_id, section in (course_node.get("Sections") or {}).items():
+                sections["id"].append(strings.intern(section_id))
+                for instructor in section.get("i", []):
+                    instructors["s"].append(strings.intern(instructor))
+                for constraint in section.get("c", []):
+                    constraints["d"].append(strings.intern(constraint.get("d", "")))
+                    constraints["s"].append(strings.intern(constraint.get("s", "")))
+                    constraints["e"].append(strings.intern(constraint.get("e", "")))
+                for time_slot in section.get("t", []):
+                    times["d"].append(int(time_slot.get("d", 0)))
+                    times["s"].append(_pack_time(time_slot.get("s", ""), strings))
+                    times["e"].append(_pack_time(time_slot.get("e", ""), strings))
+                    times["p"].append(strings.intern(time_slot.get("p", "")))
+                sections["io"].append(len(instructors["s"]))
+                sections["co"].append(len(constraints["d"]))
+                sections["to"].append(len(times["d"]))
+            courses["so"].append(len(sections["id"]))
+
+        return {
+            "v": COMPACT_FORMAT_VERSION,
+            "strings": strings.values,
+            "courses": courses,
+            "sections": sections,
+            "instructors": instructors,
+            "constraints": constraints,
+            "times": times,
+        }
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to encode compact catalog", "ENCODE_COMPACT_CATALOG_FAILED", cause=e)
+        raise err
+
+
+def decode_compact_catalog(payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Decode the compact layout back into data.json shape (string course keys)."""
+    try:
+        if payload.get("v") != COMPACT_FORMAT_VERSION:
+            raise AppError(
+                "Unsupported compact catalog version",
+                "DECODE_COMPACT_CATALOG_FAILED",
+                context={"version": payload.get("v")},
+            )
+        strings: list[str] = payload["strings"]
+        courses = payload["courses"]
+        sections = payload["sections"]
+        instructors = payload["instructors"]
+        constraints = payload["constraints"]
+        times = payload["times"]
+
+        data: dict[str, dict[str, Any]] = {}
+        for row, course_key in enumerate(courses["k"]):
+            section_nodes: dict[str, Any] = {}
+            for s_row in range(courses["so"][row], courses["so"][row + 1]):
+                section_nodes[strings[sections["id"][s_row]]] = {
+                    "i": [
+                        strings[instructors["s"][i]]
+                        for i in range(sections["io"][s_row], sections["io"][s_row + 1])
+                    ],
+                    "c": [
+                        {
+                            "d": strings[constraints["d"][i]],
+                            "s": strings[constraints["s"][i]],
+                            "e": strings[constraints["e"][i]],
+                        }
+                        for i in range(sections["co"][s_row], sections["co"][s_row + 1])
+                    ],
+                    "t": [
+                        {
+                            "p": strings[times["p"][i]],
+                            "s": _unpack_time(times["s"][i], strings),
+                            "e": _unpack_time(times["e"][i], strings),
+                            "d": times["d"][i],
+                        }
+                        for i in range(sections["to"][s_row], sections["to"][s_row + 1])
+                    ],
+                }
+            data[str(course_key)] = {
+                "Course Code": strings[courses["c"][row]],
+                "Course Name": strings[courses["n"][row]],
+                "Sections": section_nodes,
+            }
+        return data
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to decode compact catalog", "DECODE_COMPACT_CATALOG_FAILED", cause=e)
+        raise err
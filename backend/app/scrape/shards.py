@@ -0,0 +1,77 @@
+"""Per-department sharding helpers for the scrape data artifact."""
+
+from typing import Any
+
+from app.core.constants import DATA_SHARDS_DIR
+from app.core.errors import AppError
+
+
+def shard_key(dept_code: str) -> str:
+    """Return storage key of a department shard."""
+    return f"{DATA_SHARDS_DIR}/{dept_code}.json"
+
+
+def build_department_shards(data: dict[int, dict[str, Any]]) -> dict[str, dict[int, dict[str, Any]]]:
+    """Split course data into shards keyed by 3-digit department code prefix."""
+    try:
+        shards: dict[str, dict[int, dict[str, Any]]] = {}
+        for course_code in sorted(data):
+            dept_code = str(course_code)[:3]
+            shards.setdefault(dept_code, {})[course_code] = data[course_code]
+        return shards
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to build department shards", "BUILD_SHARDS_FAILED", cause=e)
+        raise err
+
+
+def build_shard_index(
+    shard_hashes: dict[str, str],
+    shard_sizes: dict[str, int],
+    previous_index: dict[str, Any],
+) -> dict[str, dict[str, Any]]:
+    """Build shard index entries, bumping a shard version only when its hash changes."""
+    try:
+        previous_shards = previous_index.get("d", {}) if isinstance(previous_index, dict) else {}
+        if not isinstance(previous_shards, dict):
+            previous_shards = {}
+
+        entries: dict[str, dict[str, Any]] = {}
+        for dept_code in sorted(shard_hashes):
+            shard_hash = shard_hashes[dept_code]
+            previous = previous_shards.get(dept_code)
+            version = 1
+            if isinstance(previous, dict):
+                previous_version = previous.get("v")
+                if isinstance(previous_version, int) and previous_version > 0:
+                    version = previous_version if previous.get("h") == shard_hash else previous_version + 1
+            entries[dept_code] = {
+                "k": shard_key(dept_code),
+                "h": shard_hash,
+                "v": version,
+                "n": shard_sizes.get(dept_code, 0),
+            }
+        return entries
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError("Failed to build shard index", "BUILD_SHARD_INDEX_FAILED", cause=e)
+        raise err
+
+
+def changed_shards(entries: dict[str, dict[str, Any]], previous_index: dict[str, Any]) -> list[str]:
+    """Return department codes whose shard hash differs from the previous index."""
+    previous_shards = previous_index.get("d", {}) if isinstance(previous_index, dict) else {}
+    if not isinstance(previous_shards, dict):
+        previous_shards = {}
+    changed: list[str] = []
+    for dept_code, entry in entries.items():
+        previous = previous_shards.get(dept_code)
+        if not isinstance(previous, dict) or previous.get("h") != entry.get("h"):
+            changed.append(dept_code)
+    return changed
+
+
+def removed_shards(entries: dict[str, dict[str, Any]], previous_index: dict[str, Any]) -> list[str]:
+    """Return department codes listed in the previous index that no longer have a shard."""
+    previous_shards = previous_index.get("d", {}) if isinstance(previous_index, dict) else {}
+    if not isinstance(previous_shards, dict):
+        return []
+    return sorted(dept_code for dept_code in previous_shards if dept_code not in entries)
@@ -18,7 +18,8 @@ from app.context.service import (
 from app.core.constants import AdminAction, LOGGER_APP
 from app.core.errors import AppError
 from app.core.logging import log_item
-from app.services.status_service import sync_status_from_locks
+from app.core.profiling import arm_profiling, disarm_profiling, profiling_status
+from app.services.status_service import sync_status_from_locks_async
 from app.services.settings_admin import apply_settings_updates, get_public_settings
 from app.storage.s3 import (
     admin_acquire_lock,
@@ -35,6 +36,8 @@ _MUTATING_ACTIONS: tuple[AdminAction, ...] = (
     AdminAction.CONTEXT_RESET_FAILURES,
     AdminAction.CONTEXT_UNSUSPEND,
     AdminAction.SETTINGS_SET,
+    AdminAction.PROFILE_ARM,
+    AdminAction.PROFILE_DISARM,
 )
 
 
@@ -74,7 +77,7 @@ def _handle_action(
         result = admin_acquire_lock()
         if result.get("acquired"):
             try:
-                sync_status_from_locks()
+                sync_status_from_locks_async()
             except Exception as e:
                 log_item(
                     LOGGER_APP,
@@ -103,7 +106,7 @@ def _handle_action(
             )
         if admin_release_lock(lock_token):
             try:
-                sync_status_from_locks()
+                sync_status_from_locks_async()
             except Exception as e:
                 log_item(
                     LOGGER_APP,
@@ -183,6 +186,28 @@ def _handle_action(
             return _partial(action, "Some setting updates failed.", data=data)
         return _partial(action, "No setting updates were applied.", data=data)
 
+    if action == AdminAction.PROFILE_ARM:
+        options = payload if isinstance(payload, dict) else {}
+        pipelines = options.get("pipelines")
+        if isinstance(pipelines, str):
+            pipelines = [pipelines]
+        try:
+            armed = arm_profiling(
+                list(pipelines) if isinstance(pipelines, list) else [],
+                mode=str(options.get("mode", "sampling")),
+                runs=int(options.get("runs", 1)),
+            )
+        except (AppError, ValueError, TypeError) as e:
+            return _failed(action, e.message if isinstance(e, AppError) else "Invalid profiling options.", 400)
+        return _ok(action, "Profiling armed for the next pipeline runs.", data={"armed": armed})
+
+    if action == AdminAction.PROFILE_DISARM:
+        disarm_profiling()
+        return _ok(action, "Profiling disarmed.", data=profiling_status())
+
+    if action == AdminAction.PROFILE_STATUS:
+        return _ok(action, "Profiling status fetched.", data=profiling_status())
+
     return _failed(action, "Unsupported admin action.", 400)
 
 
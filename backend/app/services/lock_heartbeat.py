@@ -0,0 +1,68 @@
+"""Background lease renewal for the run lock while a request is being handled."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from app.core.constants import LOGGER_APP, LOGGER_ERROR
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.settings import get_settings
+from app.storage.s3 import renew_lock
+
+
+def _heartbeat_interval() -> float:
+    """Return renewal interval, capped to a third of the lock TTL so a lease never lapses between beats."""
+    settings = get_settings()
+    interval = float(settings.S3_LOCK_HEARTBEAT_SECONDS)
+    ttl = float(settings.S3_LOCK_TIMEOUT_SECONDS)
+    return max(1.0, min(interval, ttl / 3))
+
+
+class LockHeartbeat:
+    """Daemon thread that periodically extends the run lock lease until stopped or lost.
+
+    A lost or lapsed lease also blocks further run-side uploads in the storage
+    layer, so a pipeline still running fails at its next publish step.
+    """
+
+    def __init__(self, *, interval: float | None = None):
+        self.interval = _heartbeat_interval() if interval is None else interval
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start renewing in the background."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="run-lock-heartbeat", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop renewing and wait for the heartbeat thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Renew the lease every interval; give up once ownership is lost."""
+        while not self._stop.wait(self.interval):
+            try:
+                if not renew_lock():
+                    self.lost = True
+                    log_item(
+                        LOGGER_ERROR,
+                        logging.ERROR,
+                        AppError("Run lock lease was lost during request handling.", "LOCK_LEASE_LOST"),
+                    )
+                    return
+            except Exception as e:
+                err = e if isinstance(e, AppError) else AppError(
+                    "Failed to renew run lock lease.",
+                    "LOCK_RENEW_FAILED",
+                    cause=e,
+                )
+                log_item(LOGGER_APP, logging.WARNING, err)
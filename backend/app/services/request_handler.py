@@ -2,11 +2,13 @@
 
 from dataclasses import dataclass
 import logging
+import threading
 
 from app.api.schemas import ResponseModel, RootResponse
 from app.context.service import (
     enqueue_request,
     load_context_state,
+    next_queued_request,
     publish_context_state,
     record_failure,
     record_success,
@@ -15,13 +17,16 @@ from app.context.service import (
 from app.core.constants import RequestType, LOGGER_APP, LOGGER_ERROR
 from app.core.errors import AppError
 from app.core.logging import log_item
+from app.core.settings import get_settings, pinned_settings
 from app.pipelines.scrape import run_scrape
 from app.pipelines.musts import run_musts
-from app.services.status_service import publish_status, sync_status_from_locks
+from app.services.lock_heartbeat import LockHeartbeat
+from app.services.status_service import publish_status_async, sync_status_from_locks_async
 from app.storage.local import clear_downloaded_dir
 from app.storage.s3 import acquire_lock, release_lock
 
 _allow_context_modification: bool = False
+_drain_worker: threading.Thread | None = None
 
 INCREMENT_ERROR_STATUS_CODES = (500,)
 DECREMENT_ERROR_STATUS_CODES = (200,)
@@ -53,14 +58,192 @@ def _apply_public_extra(model: ResponseModel, from_queue: bool) -> None:
         return
     model.extra["from_queue"] = True
 
+def _run_request(request_type: RequestType) -> tuple[ResponseModel | None, int | None]:
+    """Dispatch a request type to its pipeline; return (None, None) when unsupported.
+
+    Each run sees one settings snapshot; admin updates apply from the next run.
+    """
+    with pinned_settings():
+        if request_type == RequestType.SCRAPE:
+            return run_scrape()
+        if request_type == RequestType.MUSTS:
+            return run_musts()
+    # Request types can be extended here with additional branches
+    return None, None
+
+
+def _drain_queue(heartbeat: LockHeartbeat | None) -> int:
+    """Run queued requests back-to-back while the run lock is still held.
+
+    Each drained job updates the error counters on its own. Draining stops when
+    the queue is empty, the lease is lost, the context gets suspended, or the
+    configured job budget is spent. Returns the number of jobs run.
+    """
+    max_jobs = get_settings().QUEUE_DRAIN_MAX_JOBS
+    drained = 0
+    while drained < max_jobs:
+        if heartbeat is not None and heartbeat.lost:
+            break
+        try:
+            next_req = next_queued_request()
+        except AppError as e:
+            if e.code != "CONTEXT_SUSPENDED":
+                log_item(LOGGER_ERROR, logging.ERROR, e)
+            break
+        if next_req is None:
+            break
+        drained += 1
+        try:
+            model, status_code = _run_request(next_req)
+            if model is None or status_code is None:
+                continue
+            log_item(
+                LOGGER_APP,
+                logging.INFO,
+                f"Drained queued request {next_req.value}: {model.status} ({status_code})",
+            )
+            if status_code in INCREMENT_ERROR_STATUS_CODES:
+                record_failure()
+            elif status_code in DECREMENT_ERROR_STATUS_CODES:
+                record_success()
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                message="Failed to run queued request",
+                code="QUEUE_DRAIN_FAILED",
+                context={"request_type": next_req.value},
+                cause=e,
+            )
+            log_item(LOGGER_ERROR, logging.ERROR, err)
+            break
+    return drained
+
+
+def _record_error_flags(flags: ErrorFlags) -> None:
+    """Apply the handled request's error counter flags; failures are logged."""
+    if flags.suspended:
+        return
+    try:
+        if flags.increment:
+            record_failure()
+        if flags.decrement:
+            record_success()
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to update error counters after request handling",
+            code="ERROR_COUNT_UPDATE_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_ERROR, logging.ERROR, err)
+
+
+def _finish_run(heartbeat: LockHeartbeat | None) -> None:
+    """Publish context, clean up, and release the run lock; every step runs even if an earlier one fails."""
+    global _allow_context_modification
+
+    _allow_context_modification = False
+    try:
+        publish_context_state()
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to publish context after request handling",
+            code="CONTEXT_PUBLISH_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_ERROR, logging.ERROR, err)
+    try:
+        cleared_entries = clear_downloaded_dir()
+        if cleared_entries > 0:
+            log_item(
+                LOGGER_APP,
+                logging.INFO,
+                f"Cleared downloaded directory entries: {cleared_entries}",
+            )
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to clear downloaded directory after request handling",
+            code="DOWNLOADED_CLEANUP_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_APP, logging.WARNING, err)
+    if heartbeat is not None:
+        heartbeat.stop()
+    try:
+        if not release_lock():
+            raise AppError(
+                message="Failed to release lock after request handling",
+                code="LOCK_RELEASE_FAILED",
+            )
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to release lock after request handling",
+            code="LOCK_RELEASE_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_ERROR, logging.ERROR, err)
+    try:
+        sync_status_from_locks_async()
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to synchronize status after request handling",
+            code="STATUS_SYNC_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_APP, logging.WARNING, err)
+
+
+def _drain_and_finish(heartbeat: LockHeartbeat | None) -> None:
+    """Drain queued requests, then publish context and release the lock."""
+    try:
+        _drain_queue(heartbeat)
+    except Exception as e:
+        err = e if isinstance(e, AppError) else AppError(
+            message="Failed to drain request queue",
+            code="QUEUE_DRAIN_FAILED",
+            cause=e,
+        )
+        log_item(LOGGER_ERROR, logging.ERROR, err)
+    finally:
+        _finish_run(heartbeat)
+
+
+def _start_drain_worker(heartbeat: LockHeartbeat | None) -> threading.Thread:
+    """Drain the queue on a background thread that keeps the run lock and heartbeat until done."""
+    global _drain_worker
+
+    worker = threading.Thread(target=_drain_and_finish, args=(heartbeat,), name="queue-drain", daemon=True)
+    _drain_worker = worker
+    worker.start()
+    return worker
+
+
+def wait_for_queue_drain(timeout: float | None = None) -> bool:
+    """Wait for a running queue drain to publish and release the lock; return False if still running.
+
+    Called on shutdown so a drain is not killed mid-publish while holding the
+    run lock. ``timeout`` defaults to QUEUE_DRAIN_SHUTDOWN_TIMEOUT_SECONDS.
+    """
+    worker = _drain_worker
+    if worker is None:
+        return True
+    worker.join(timeout=float(get_settings().QUEUE_DRAIN_SHUTDOWN_TIMEOUT_SECONDS) if timeout is None else timeout)
+    return not worker.is_alive()
+
+
 def handle_request(request_type: RequestType) -> tuple[RootResponse | ResponseModel, int]:
-    """Handle a request type, coordinating lock, queue, execution, and persistence."""
+    """Handle a request type, coordinating lock, queue, execution, and persistence.
+
+    The response is returned once the requested pipeline finishes; queued
+    requests are then drained on a background worker that still holds the run
+    lock, so the caller does not wait for them.
+    """
     global _allow_context_modification
 
     if request_type == RequestType.ROOT:
         return RootResponse(), 200
 
     lock_owned = False
+    drain = False
+    heartbeat: LockHeartbeat | None = None
     error_flags = ErrorFlags()
     try:
         if not acquire_lock():
@@ -72,8 +255,10 @@ def handle_request(request_type: RequestType) -> tuple[RootResponse | ResponseMo
             return _finalize_response(ResponseModel(request_type=request_type, status="BUSY", message="System is busy processing another request"), 503, flags=error_flags)
 
         lock_owned = True
+        heartbeat = LockHeartbeat()
+        heartbeat.start()
         try:
-            publish_status("busy")
+            publish_status_async("busy")
         except Exception as e:
             err = e if isinstance(e, AppError) else AppError(
                 message="Failed to publish busy status after run lock acquisition",
@@ -84,20 +269,13 @@ def handle_request(request_type: RequestType) -> tuple[RootResponse | ResponseMo
         _allow_context_modification = True
         load_context_state()
         from_queue, next_req = resolve_request(request_type)
-        model: ResponseModel | None = None
-        status_code: int | None = None
-
-        if next_req == RequestType.SCRAPE:
-            model, status_code = run_scrape()
-        elif next_req == RequestType.MUSTS:
-            model, status_code = run_musts()
-        # Request types can be extended here with additional elif blocks
+        model, status_code = _run_request(next_req)
 
         if model is None or status_code is None:
             return _finalize_response(ResponseModel(request_type=request_type, status="UNSUPPORTED", message="Request type is not supported"), 501, flags=error_flags)
 
         _apply_public_extra(model, from_queue)
-    
+        drain = True
         return _finalize_response(model, status_code, flags=error_flags)
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError(
@@ -111,56 +289,10 @@ def handle_request(request_type: RequestType) -> tuple[RootResponse | ResponseMo
         log_item(LOGGER_ERROR, logging.ERROR, err)
         return _finalize_response(ResponseModel(request_type=request_type, status="ERROR", message=err.message), 500, flags=error_flags)
     finally:
-        _allow_context_modification = False
         if lock_owned:
-            try:
-                if not error_flags.suspended:
-                    if error_flags.increment:
-                        record_failure()
-                    if error_flags.decrement:
-                        record_success()
-                publish_context_state()
-            except Exception as e:
-                err = e if isinstance(e, AppError) else AppError(
-                    message="Failed to publish context after request handling",
-                    code="CONTEXT_PUBLISH_FAILED",
-                    cause=e,
-                )
-                log_item(LOGGER_ERROR, logging.ERROR, err)
-            try:
-                cleared_entries = clear_downloaded_dir()
-                if cleared_entries > 0:
-                    log_item(
-                        LOGGER_APP,
-                        logging.INFO,
-                        f"Cleared downloaded directory entries: {cleared_entries}",
-                    )
-            except Exception as e:
-                err = e if isinstance(e, AppError) else AppError(
-                    message="Failed to clear downloaded directory after request handling",
-                    code="DOWNLOADED_CLEANUP_FAILED",
-                    cause=e,
-                )
-                log_item(LOGGER_APP, logging.WARNING, err)
-            try:
-                if not release_lock():
-                    raise AppError(
-                        message="Failed to release lock after request handling",
-                        code="LOCK_RELEASE_FAILED",
-                    )
-            except Exception as e:
-                err = e if isinstance(e, AppError) else AppError(
-                    message="Failed to release lock after request handling",
-                    code="LOCK_RELEASE_FAILED",
-                    cause=e,
-                )
-                log_item(LOGGER_ERROR, logging.ERROR, err)
-            try:
-                sync_status_from_locks()
-            except Exception as e:
-                err = e if isinstance(e, AppError) else AppError(
-                    message="Failed to synchronize status after request handling",
-                    code="STATUS_SYNC_FAILED",
-                    cause=e,
-                )
-                log_item(LOGGER_APP, logging.WARNING, err)
+            # Counters for this request are recorded before any queued job can suspend the context.
+            _record_error_flags(error_flags)
+            if drain:
+                _start_drain_worker(heartbeat)
+            else:
+                _finish_run(heartbeat)
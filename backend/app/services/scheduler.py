@@ -0,0 +1,254 @@
+"""In-process scheduler that periodically triggers scrape/musts refreshes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import logging
+import random
+import threading
+
+import pytz
+
+from app.core.constants import LOGGER_APP, RequestType
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.settings import get_settings
+from app.services.request_handler import handle_request
+from app.storage.s3 import admin_lock_exists, run_lock_exists
+
+# Upper bound for a single sleep so settings updates and shutdown are noticed promptly.
+_MAX_SLEEP_SECONDS = 60.0
+_FIELD_BOUNDS: tuple[tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_cron_field(text: str, low: int, high: int) -> frozenset[int]:
+    """Parse one cron field (``*``, ``*/n``, ``a``, ``a-b``, ``a-b/n``, comma lists)."""
+    values: set[int] = set()
+    for part in text.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step <= 0:
+            raise ValueError(f"invalid step in {part!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(base)
+            end = high if step_text else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"value out of range in {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """Minimal five-field cron expression (minute hour day-of-month month day-of-week).
+
+    Day-of-week uses 0-6 with Sunday as 0 (7 is accepted as Sunday). As in cron,
+    when both day fields are restricted a day matches if either one does.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise AppError(
+                "Cron expression must have five fields",
+                "SCHEDULER_CRON_INVALID",
+                context={"expression": expression},
+            )
+        try:
+            parsed = [_parse_cron_field(field, low, high) for field, (low, high) in zip(fields, _FIELD_BOUNDS)]
+        except ValueError as e:
+            raise AppError(
+                "Invalid cron expression",
+                "SCHEDULER_CRON_INVALID",
+                context={"expression": expression},
+                cause=e,
+            )
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def _day_matches(self, value: datetime) -> bool:
+        """Return whether the calendar day of value matches the day fields."""
+        day_ok = value.day in self.days
+        weekday_ok = (value.weekday() + 1) % 7 in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, value: datetime) -> datetime:
+        """Return the first matching minute strictly after value (naive local time)."""
+        candidate = value.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=5 * 366)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = (candidate.year + 1, 1) if candidate.month == 12 else (candidate.year, candidate.month + 1)
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise AppError(
+            "Cron expression never matches",
+            "SCHEDULER_CRON_INVALID",
+            context={"expression": self.expression},
+        )
+
+
+def _parse_window(text: str) -> tuple[date, date]:
+    """Parse an inclusive ``YYYY-MM-DD/YYYY-MM-DD`` registration window."""
+    start_text, _, end_text = text.partition("/")
+    start = date.fromisoformat(start_text.strip())
+    end = date.fromisoformat(end_text.strip()) if end_text else start
+    return start, end
+
+
+def in_registration_window(today: date, windows: list[str]) -> bool:
+    """Return whether today falls inside any configured registration window."""
+    for window in windows:
+        try:
+            start, end = _parse_window(window)
+        except ValueError:
+            continue
+        if start <= today <= end:
+            return True
+    return False
+
+
+def _local_now() -> datetime:
+    """Return current naive wall-clock time in the configured timezone."""
+    return datetime.now(pytz.timezone(get_settings().TIMEZONE)).replace(tzinfo=None)
+
+
+@dataclass
+class _PlannedRun:
+    """Next fire time for one request type and the expression it was derived from."""
+
+    expression: str
+    scheduled_for: datetime
+    fire_at: datetime
+
+
+class RefreshScheduler:
+    """Daemon thread that triggers configured request types on cron-like schedules.
+
+    Schedules are re-read from settings on every wake-up, so admin settings
+    updates apply without a restart. Each fire time gets a random delay of up to
+    SCHEDULER_JITTER_SECONDS, and a tick is skipped when the run or admin lock is
+    already held. Missed ticks are not caught up.
+    """
+
+    def __init__(self) -> None:
+        self._planned: dict[RequestType, _PlannedRun] = {}
+        self._invalid: set[str] = set()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the scheduler thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="refresh-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal the scheduler to stop and wait briefly for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _expressions(self, now: datetime) -> dict[RequestType, str]:
+        """Return active cron expressions per request type for now."""
+        settings = get_settings()
+        expressions = dict(settings.SCHEDULER_CRON)
+        if in_registration_window(now.date(), settings.SCHEDULER_REGISTRATION_WINDOWS):
+            expressions.update(settings.SCHEDULER_REGISTRATION_CRON)
+        active: dict[RequestType, str] = {}
+        for key, expression in expressions.items():
+            try:
+                request_type = RequestType(key)
+            except ValueError:
+                continue
+            if request_type != RequestType.ROOT and expression.strip():
+                active[request_type] = expression.strip()
+        return active
+
+    def plan(self, now: datetime) -> dict[RequestType, _PlannedRun]:
+        """Refresh planned runs against current settings and return them."""
+        expressions = self._expressions(now)
+        for request_type in list(self._planned):
+            if request_type not in expressions:
+                del self._planned[request_type]
+        jitter = max(0.0, float(get_settings().SCHEDULER_JITTER_SECONDS))
+        for request_type, expression in expressions.items():
+            planned = self._planned.get(request_type)
+            if planned is not None and planned.expression == expression:
+                continue
+            try:
+                scheduled_for = CronSchedule(expression).next_after(now)
+            except AppError as e:
+                self._planned.pop(request_type, None)
+                if expression not in self._invalid:
+                    self._invalid.add(expression)
+                    log_item(LOGGER_APP, logging.WARNING, e)
+                continue
+            self._planned[request_type] = _PlannedRun(
+                expression=expression,
+                scheduled_for=scheduled_for,
+                fire_at=scheduled_for + timedelta(seconds=random.uniform(0.0, jitter)),
+            )
+        return self._planned
+
+    def tick(self, request_type: RequestType) -> bool:
+        """Trigger request_type unless a lock is held; return whether it ran."""
+        try:
+            if run_lock_exists() or admin_lock_exists():
+                log_item(LOGGER_APP, logging.INFO, f"Scheduler skipped {request_type.value}: lock is held")
+                return False
+            model, status_code = handle_request(request_type)
+            log_item(
+                LOGGER_APP,
+                logging.INFO,
+                f"Scheduler ran {request_type.value}: {getattr(model, 'status', '')} ({status_code})",
+            )
+            return True
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Scheduled request failed",
+                "SCHEDULER_TICK_FAILED",
+                context={"request_type": request_type.value},
+                cause=e,
+            )
+            log_item(LOGGER_APP, logging.WARNING, err)
+            return False
+
+    def _run(self) -> None:
+        """Sleep until the earliest planned run, fire it, and re-plan."""
+        while not self._stop.is_set():
+            now = _local_now()
+            planned = self.plan(now)
+            if not planned:
+                self._stop.wait(_MAX_SLEEP_SECONDS)
+                continue
+            request_type, run = min(planned.items(), key=lambda item: item[1].fire_at)
+            delay = (run.fire_at - now).total_seconds()
+            if delay > 0:
+                self._stop.wait(min(delay, _MAX_SLEEP_SECONDS))
+                continue
+            del self._planned[request_type]
+            self.tick(request_type)
@@ -6,7 +6,7 @@ from pathlib import Path
 import re
 from typing import Any
 
-from app.core.settings import Settings, get_settings
+from app.core.settings import Settings, get_settings, reload_settings
 
 _BLOCKED_SETTING_KEYS: set[str] = {
     "ADMIN_SECRET",
@@ -34,7 +34,7 @@ def get_public_settings() -> dict[str, Any]:
 
 
 def apply_settings_updates(updates: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], int, int]:
-    """Apply settings updates into backend/.env and reload settings cache.
+    """Apply settings updates into backend/.env and publish a reloaded settings snapshot.
 
     Returns:
         tuple[results, applied_count, failed_count]
@@ -63,8 +63,7 @@ def apply_settings_updates(updates: dict[str, Any]) -> tuple[dict[str, dict[str,
     if valid_env_updates:
         env_path = _settings_env_path()
         _update_env_file(env_path, valid_env_updates)
-        get_settings.cache_clear()
-        get_settings()
+        reload_settings()
 
     applied_count = sum(1 for row in results.values() if row.get("ok"))
     failed_count = len(results) - applied_count
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Literal
+import logging
+import threading
+import time
+from typing import Any, Literal
 
-from app.core.constants import STATUS_FILE
+from app.core.constants import LOGGER_APP, STATUS_FILE
+from app.core.errors import AppError
+from app.core.logging import log_item
+from app.core.settings import get_settings
 from app.storage.s3 import admin_lock_exists, run_lock_exists
-from app.storage.s3.store import write_json_payload
+from app.storage.s3.store import read_json_payload, write_json_payload
 
 
 StatusValue = Literal["idle", "busy"]
@@ -41,3 +47,121 @@ def sync_status_from_locks() -> None:
     """Publish status derived from current lock state."""
     publish_status(compute_status_from_locks())
 
+
+def _refresh_due(updated_at: Any) -> bool:
+    """Return whether a stored ``updated_at`` is older than STATUS_REFRESH_SECONDS (or unreadable)."""
+    try:
+        stored = datetime.fromisoformat(str(updated_at).replace("Z", "+00:00"))
+    except ValueError:
+        return True
+    age = (datetime.now(timezone.utc) - stored).total_seconds()
+    return age >= float(get_settings().STATUS_REFRESH_SECONDS)
+
+
+def publish_status_if_changed(status: StatusValue) -> bool:
+    """Publish status unless storage already holds the same value recently; return whether it wrote.
+
+    Only the status value is compared; an unchanged status is still rewritten
+    once its ``updated_at`` is older than STATUS_REFRESH_SECONDS.
+    """
+    current = read_json_payload(STATUS_FILE)
+    if current is not None and current.get("status") == status and not _refresh_due(current.get("updated_at")):
+        return False
+    publish_status(status)
+    return True
+
+
+class _StatusPublisher:
+    """Background writer that coalesces status updates off the request path.
+
+    Only the latest submitted value is kept: after the first pending update the
+    worker waits out the full STATUS_PUBLISH_COALESCE_SECONDS window, so rapid
+    busy/idle transitions inside it collapse into a single write. A submitted
+    value of None means "derive from locks at write time". Failed writes are
+    retried with exponential backoff up to GLOBAL_RETRIES times unless a newer
+    value supersedes them.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending = False
+        self._in_flight = False
+        self._desired: StatusValue | None = None
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, status: StatusValue | None) -> None:
+        """Record the latest desired status and wake the worker."""
+        with self._cond:
+            self._pending = True
+            self._desired = status
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="status-publisher", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        self._wakeup.set()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until no update is pending or in flight; return False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._in_flight, timeout=timeout)
+
+    def _take(self) -> StatusValue | None:
+        """Block until an update is pending, then claim it."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending)
+        # Plain sleep: later submits must not cut the debounce window short.
+        time.sleep(max(0.0, float(get_settings().STATUS_PUBLISH_COALESCE_SECONDS)))
+        with self._cond:
+            self._pending = False
+            self._in_flight = True
+            self._wakeup.clear()
+            return self._desired
+
+    def _run(self) -> None:
+        """Write claimed updates forever, retrying failures with backoff."""
+        attempt = 0
+        while True:
+            desired = self._take()
+            try:
+                publish_status_if_changed(desired or compute_status_from_locks())
+                attempt = 0
+            except Exception as e:
+                err = e if isinstance(e, AppError) else AppError(
+                    "Failed to publish status in background.",
+                    "STATUS_PUBLISH_FAILED",
+                    cause=e,
+                )
+                log_item(LOGGER_APP, logging.WARNING, err)
+                settings = get_settings()
+                attempt += 1
+                with self._cond:
+                    if not self._pending and attempt <= settings.GLOBAL_RETRIES:
+                        self._pending = True
+                        self._desired = desired
+                if attempt <= settings.GLOBAL_RETRIES:
+                    self._wakeup.wait(float(settings.RETRY_BASE_DELAY) * (2 ** (attempt - 1)))
+                else:
+                    attempt = 0
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._cond.notify_all()
+
+
+_PUBLISHER = _StatusPublisher()
+
+
+def publish_status_async(status: StatusValue) -> None:
+    """Queue a status write without blocking the caller."""
+    _PUBLISHER.submit(status)
+
+
+def sync_status_from_locks_async() -> None:
+    """Queue a lock-derived status write without blocking the caller."""
+    _PUBLISHER.submit(None)
+
+
+def flush_status_publisher(timeout: float = 5.0) -> bool:
+    """Wait for queued status writes to finish (used on shutdown and in tests)."""
+    return _PUBLISHER.flush(timeout)
@@ -0,0 +1,164 @@
+"""Memory-mapped JSON object reader that decodes top-level values on demand."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import json
+import mmap
+from pathlib import Path
+import re
+from typing import Any
+
+from app.core.errors import AppError
+
+# Strings (with escapes) and structural brackets; everything else is skipped by the scanner.
+_TOKEN_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+_WHITESPACE = b" \t\r\n"
+_PRIMITIVE_PATTERN = re.compile(rb"-?[0-9][0-9.eE+-]*|true|false|null")
+# Top-level keys of files written by `write_json` (indent=4): raw newlines cannot occur
+# inside JSON strings and nested keys are indented deeper, so this only matches depth 1.
+_INDENTED_KEY_PATTERN = re.compile(rb'\n {4}("(?:[^"\\]|\\.)*"): ')
+
+
+class LazyJsonObject(Mapping[str, Any]):
+    """Read-only mapping over a JSON object file; values are parsed only when accessed.
+
+    Opening the file builds an index of top-level keys to byte ranges without
+    decoding any value: files written by `write_json` (indent=4) are indexed by
+    their line layout, any other layout by a single token scan. Each lookup
+    decodes just that value from the memory map.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as f:
+                self._mm: mmap.mmap | None = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.path.stat().st_size else None
+            self._offsets: dict[str, tuple[int, int]] = {}
+            if self._mm is not None:
+                indexed = _index_indented(self._mm)
+                self._offsets = indexed if indexed is not None else _index_top_level(self._mm)
+        except Exception as e:
+            err = e if isinstance(e, AppError) else AppError(
+                "Failed to index json",
+                "READ_JSON_LAZY_FAILED",
+                context={"path": str(path)},
+                cause=e,
+            )
+            raise err
+
+    def __getitem__(self, key: str) -> Any:
+        start, end = self._offsets[key]
+        if self._mm is None:
+            raise AppError("Lazy json reader is closed", "READ_JSON_LAZY_FAILED", context={"path": str(self.path)})
+        return json.loads(self._mm[start:end])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self) -> "LazyJsonObject":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def _skip_whitespace(buffer: mmap.mmap, position: int) -> int:
+    """Return the first non-whitespace offset at or after position."""
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def _last_content_offset(buffer: mmap.mmap, end: int) -> int:
+    """Return the offset of the last non-whitespace byte before end (-1 when none)."""
+    position = end - 1
+    while position >= 0 and buffer[position] in _WHITESPACE:
+        position -= 1
+    return position
+
+
+def _index_indented(buffer: mmap.mmap) -> dict[str, tuple[int, int]] | None:
+    """Index an indent=4 JSON object by its line layout; None when the file has another layout."""
+    closing = _last_content_offset(buffer, len(buffer))
+    if buffer[:7] != b'{\n    "' or buffer[closing - 1:closing + 1] != b"\n}":
+        return None
+    matches = list(_INDENTED_KEY_PATTERN.finditer(buffer))
+    offsets: dict[str, tuple[int, int]] = {}
+    for index, match in enumerate(matches):
+        if index + 1 < len(matches):
+            comma = _last_content_offset(buffer, matches[index + 1].start())
+            if buffer[comma] != ord(","):
+                return None
+            value_end = _last_content_offset(buffer, comma) + 1
+        else:
+            value_end = _last_content_offset(buffer, closing) + 1
+        offsets[json.loads(match.group(1))] = (match.end(), value_end)
+    return offsets
+
+
+def _index_top_level(buffer: mmap.mmap) -> dict[str, tuple[int, int]]:
+    """Map each top-level key of a JSON object to the byte range of its value."""
+    offsets: dict[str, tuple[int, int]] = {}
+    depth = 0
+    expect_key = False
+    key: str | None = None
+    value_start = 0
+    for match in _TOKEN_PATTERN.finditer(buffer):
+        token = match.group()
+        first = token[:1]
+        if first == b'"':
+            if depth != 1:
+                continue
+            if key is not None:
+                # String value of the current top-level key.
+                offsets[key] = (value_start, match.end())
+                key = None
+                expect_key = True
+                continue
+            if not expect_key:
+                continue
+            key = json.loads(token)
+            colon = buffer.find(b":", match.end())
+            if colon < 0:
+                raise AppError("Malformed json object", "READ_JSON_LAZY_FAILED", context={"offset": match.start()})
+            value_start = _skip_whitespace(buffer, colon + 1)
+            if buffer[value_start:value_start + 1] not in (b'"', b"{", b"["):
+                primitive = _PRIMITIVE_PATTERN.match(buffer, value_start)
+                if primitive is None:
+                    raise AppError("Malformed json value", "READ_JSON_LAZY_FAILED", context={"offset": value_start})
+                offsets[key] = (value_start, primitive.end())
+                key = None
+                expect_key = True
+            else:
+                expect_key = False
+        elif first in (b"{", b"["):
+            depth += 1
+            if depth == 1:
+                if first != b"{":
+                    raise AppError("Top-level json value is not an object", "READ_JSON_LAZY_FAILED")
+                expect_key = True
+        else:
+            depth -= 1
+            if depth == 1 and key is not None:
+                offsets[key] = (value_start, match.end())
+                key = None
+                expect_key = True
+    return offsets
+
+
+def open_json_lazy(path: str | Path) -> LazyJsonObject:
+    """Open a JSON object file as a lazily decoded mapping."""
+    return LazyJsonObject(path)
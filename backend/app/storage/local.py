@@ -22,12 +22,16 @@ def read_json(path: str | Path) -> dict[str, Any]:
         raise err
 
 
-def write_json(path: str | Path, data: Any) -> str:
-    """Write data as JSON file and return written path as string."""
+def write_json(path: str | Path, data: Any, *, compact: bool = False) -> str:
+    """Write data as JSON file (indented, or minified when compact) and return written path as string."""
     try:
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=4), encoding="utf-8")
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=4)
+        p.write_text(text, encoding="utf-8")
         return str(p)
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError("Failed to write json", "WRITE_JSON_FAILED", context={"path": str(path)}, cause=e)
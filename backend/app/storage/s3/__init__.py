@@ -2,7 +2,7 @@
 
 from app.core.settings import get_settings
 
-from .api import delete_file, download_file, s3_file_exists, upload_file
+from .api import delete_file, download_file, download_json, s3_file_exists, upload_file, upload_json
 from .common import _mock_dir
 from .locks import (
     acquire_lock,
@@ -16,9 +16,11 @@ from .locks import (
     admin_validate_lock_token,
     run_lock_exists,
     release_lock,
+    renew_lock,
 )
+from .mirror import mirror_file
 from .real_backend import reset_cached_client
-from .state import set_run_lock_held
+from .state import clear_payload_cache, set_run_lock_held
 
 
 def _reset_s3_client_for_tests() -> None:
@@ -31,11 +33,20 @@ def _set_run_lock_held_for_tests(value: bool) -> None:
     set_run_lock_held(value)
 
 
+def _reset_lock_cache_for_tests() -> None:
+    """Drop cached lock payloads (used by test suites)."""
+    clear_payload_cache()
+
+
 __all__ = [
     "acquire_lock",
     "release_lock",
+    "renew_lock",
     "upload_file",
     "download_file",
+    "upload_json",
+    "download_json",
+    "mirror_file",
     "s3_file_exists",
     "delete_file",
     "admin_acquire_lock",
@@ -49,6 +60,7 @@ __all__ = [
     "run_lock_exists",
     "_reset_s3_client_for_tests",
     "_set_run_lock_held_for_tests",
+    "_reset_lock_cache_for_tests",
     "_mock_dir",
     "get_settings",
 ]
@@ -3,21 +3,42 @@
 from __future__ import annotations
 
 from pathlib import Path
+import time
 from typing import Any
 
-from app.core.constants import PUBLIC_S3_FILES
+from app.core.constants import PUBLIC_S3_FILES, PUBLIC_S3_PREFIXES
 from app.core.errors import AppError
+from app.core.tracing import span
 
 from .common import _is_real_s3_enabled, _normalize_key, _mock_path
 from .locks import admin_lock_exists, admin_op_lock_exists
-from .state import is_run_lock_held
-from .store import delete_object, object_exists, read_object_bytes, write_object_bytes
+from .state import is_run_lock_held, run_lock_expires_at
+from .store import (
+    delete_object,
+    object_exists,
+    read_json_payload,
+    read_object_bytes,
+    write_json_payload,
+    write_object_bytes,
+)
 
 
 def _ensure_run_mutation_allowed(operation: str, **context: Any) -> None:
-    """Raise when run-side storage mutation is not currently allowed."""
+    """Raise when run-side storage mutation is not currently allowed.
+
+    Besides ownership, the lease written by the last acquire/renew must not have
+    expired: once it lapses another instance may hold the lock, so a running
+    pipeline is stopped at its next publish step.
+    """
     if not is_run_lock_held():
         raise AppError(f"Run lock not acquired before {operation}.", "LOCK_NOT_ACQUIRED", context=context)
+    expires_at = run_lock_expires_at()
+    if expires_at is not None and expires_at <= time.time():
+        raise AppError(
+            f"Run lock lease expired before {operation}.",
+            "LOCK_LEASE_LOST",
+            context={**context, "expires_at": expires_at},
+        )
     if admin_lock_exists():
         raise AppError(
             "Run-side mutation blocked because admin lock is active.",
@@ -54,7 +75,9 @@ def _should_upload_public(key: str) -> bool:
     """Return whether a storage key should be uploaded as publicly readable."""
     normalized = _normalize_key(key)
     filename = Path(normalized).name
-    return filename in PUBLIC_S3_FILES
+    if filename in PUBLIC_S3_FILES:
+        return True
+    return normalized.startswith(PUBLIC_S3_PREFIXES)
 
 
 def upload_file(local_path: str | Path, key: str, _admin: bool = False) -> str:
@@ -68,7 +91,10 @@ def upload_file(local_path: str | Path, key: str, _admin: bool = False) -> str:
                 "UPLOAD_FILE_FAILED",
                 context={"local_path": str(local_path), "key": key},
             )
-        write_object_bytes(key, src.read_bytes(), public_read=_should_upload_public(key))
+        with span("upload", key=key) as current:
+            content = src.read_bytes()
+            current.set(bytes=len(content))
+            write_object_bytes(key, content, public_read=_should_upload_public(key))
         if _is_real_s3_enabled():
             return _normalize_key(key)
         return str(_mock_path(key))
@@ -104,6 +130,40 @@ def download_file(key: str, local_path: str | Path) -> str:
         )
 
 
+def download_json(key: str) -> dict[str, Any] | None:
+    """Read a JSON object from storage without touching local disk (read-only).
+
+    Uses the ETag-validated payload cache, so an unchanged object costs one
+    conditional request and no transfer. Returns None when the key is missing.
+    """
+    try:
+        return read_json_payload(key)
+    except Exception as e:
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to read JSON from storage.",
+            "DOWNLOAD_FILE_FAILED",
+            context={"key": key},
+            cause=e,
+        )
+
+
+def upload_json(payload: dict[str, Any], key: str, _admin: bool = False) -> str:
+    """Write a JSON object directly to storage key (mutating; lock-guarded)."""
+    try:
+        _ensure_mutation_allowed(admin=_admin, operation="upload_json", key=key)
+        write_json_payload(key, payload, public_read=_should_upload_public(key))
+        if _is_real_s3_enabled():
+            return _normalize_key(key)
+        return str(_mock_path(key))
+    except Exception as e:
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to upload JSON to storage.",
+            "UPLOAD_FILE_FAILED",
+            context={"key": key},
+            cause=e,
+        )
+
+
 def s3_file_exists(key: str) -> bool:
     """Check whether key exists in storage backend (read-only)."""
     try:
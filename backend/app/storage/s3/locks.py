@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 from app.core.constants import S3_ADMIN_LOCK_FILE, S3_ADMIN_OP_LOCK_FILE, S3_LOCK_FILE
@@ -11,101 +12,157 @@ from app.core.errors import AppError
 
 from .common import get_settings
 from .state import is_run_lock_held, set_run_lock_held
-from .store import delete_object, is_expired, read_json_payload, write_json_payload
+from .store import (
+    delete_object_if,
+    is_expired,
+    read_json_payload,
+    read_json_payload_entry,
+    write_json_payload_if,
+)
+
+
+def _lock_cache_seconds() -> float:
+    """Return how long lock-existence checks may reuse a cached lock payload."""
+    return float(getattr(get_settings(), "S3_LOCK_CACHE_SECONDS", 0.0) or 0.0)
+
+
+def _try_claim_lock(
+    key: str,
+    payload: dict[str, Any],
+    *,
+    now: float,
+    replaceable: Callable[[dict[str, Any]], bool] | None = None,
+) -> bool:
+    """Atomically write a lock payload when the key is free or its current lock has expired.
+
+    Uses create-only writes when no lock object exists and ETag-matched writes when
+    replacing an expired, unreadable or ``replaceable`` lock, so concurrent claimers
+    cannot both win. Stale locks are only ever replaced here, never deleted on read.
+    """
+    current = read_json_payload_entry(key)
+    if current.payload and not is_expired(current.payload, now=now):
+        if replaceable is None or not replaceable(current.payload):
+            return False
+    return write_json_payload_if(key, payload, etag=current.etag)
 
 
-def _active_run_lock_data() -> dict[str, Any] | None:
-    """Return active run lock payload and cleanup stale lock file."""
-    payload = read_json_payload(S3_LOCK_FILE)
+def _active_lock_data(key: str, *, max_age: float = 0.0) -> dict[str, Any] | None:
+    """Return active lock payload for key; expired locks are left for the next claimer to replace."""
+    payload = read_json_payload(key, max_age=max_age)
     if is_expired(payload):
-        delete_object(S3_LOCK_FILE)
         return None
     return payload
 
 
-def _active_admin_lock_data() -> dict[str, Any] | None:
-    """Return active admin lock payload and cleanup stale lock file."""
-    payload = read_json_payload(S3_ADMIN_LOCK_FILE)
-    if is_expired(payload):
-        delete_object(S3_ADMIN_LOCK_FILE)
-        return None
-    return payload
+def _active_run_lock_data(*, max_age: float = 0.0) -> dict[str, Any] | None:
+    """Return active run lock payload."""
+    return _active_lock_data(S3_LOCK_FILE, max_age=max_age)
 
 
-def _active_admin_op_lock_data() -> dict[str, Any] | None:
-    """Return active admin op-lock payload if it matches active admin lock token."""
-    op_payload = read_json_payload(S3_ADMIN_OP_LOCK_FILE)
-    if is_expired(op_payload):
-        delete_object(S3_ADMIN_OP_LOCK_FILE)
-        return None
+def _active_admin_lock_data(*, max_age: float = 0.0) -> dict[str, Any] | None:
+    """Return active admin lock payload."""
+    return _active_lock_data(S3_ADMIN_LOCK_FILE, max_age=max_age)
+
 
-    admin_payload = _active_admin_lock_data()
-    if not admin_payload:
-        delete_object(S3_ADMIN_OP_LOCK_FILE)
+def _active_admin_op_lock_data(*, max_age: float = 0.0) -> dict[str, Any] | None:
+    """Return active admin op-lock payload if it matches active admin lock token."""
+    op_payload = _active_lock_data(S3_ADMIN_OP_LOCK_FILE, max_age=max_age)
+    if op_payload is None:
         return None
 
-    if op_payload.get("holder_token") != admin_payload.get("token"):
-        delete_object(S3_ADMIN_OP_LOCK_FILE)
+    admin_payload = _active_admin_lock_data(max_age=max_age)
+    if not admin_payload or op_payload.get("holder_token") != admin_payload.get("token"):
         return None
     return op_payload
 
 
 def admin_lock_exists() -> bool:
-    """Return whether admin lock is currently active."""
-    return _active_admin_lock_data() is not None
+    """Return whether admin lock is currently active (may reuse a briefly cached read)."""
+    return _active_admin_lock_data(max_age=_lock_cache_seconds()) is not None
 
 
 def run_lock_exists() -> bool:
-    """Return whether run lock is currently active."""
-    return _active_run_lock_data() is not None
+    """Return whether run lock is currently active (may reuse a briefly cached read)."""
+    return _active_run_lock_data(max_age=_lock_cache_seconds()) is not None
 
 
 def admin_op_lock_exists() -> bool:
-    """Return whether admin operation lock is currently active and valid."""
-    return _active_admin_op_lock_data() is not None
+    """Return whether admin operation lock is currently active and valid (may reuse a briefly cached read)."""
+    return _active_admin_op_lock_data(max_age=_lock_cache_seconds()) is not None
 
 
 def acquire_lock() -> bool:
     """Acquire run lock for this instance if available and admin lock is not active."""
     try:
-        if admin_lock_exists():
-            return False
         if is_run_lock_held():
             return False
+        if _active_admin_lock_data() is not None:
+            return False
 
         now = time.time()
         settings = get_settings()
-        current_payload = _active_run_lock_data()
-        if current_payload:
-            return False
-
         payload = {
             "owner": settings.S3_LOCK_OWNER_ID,
             "acquired_at": now,
             "expires_at": now + float(settings.S3_LOCK_TIMEOUT_SECONDS),
         }
-        write_json_payload(S3_LOCK_FILE, payload)
-        set_run_lock_held(True)
+        if not _try_claim_lock(S3_LOCK_FILE, payload, now=now):
+            return False
+        set_run_lock_held(True, expires_at=payload["expires_at"])
         return True
     except Exception as e:
         raise e if isinstance(e, AppError) else AppError("Failed to acquire run lock.", "LOCK_ACQUIRE_FAILED", cause=e)
 
 
+def renew_lock() -> bool:
+    """Extend run lock lease while this instance still owns it.
+
+    The lease is rewritten with an ETag-matched write so a lock taken over by
+    another instance is never overwritten. Returns False (and drops local
+    ownership) when the lock has been lost.
+    """
+    try:
+        if not is_run_lock_held():
+            return False
+
+        settings = get_settings()
+        current = read_json_payload_entry(S3_LOCK_FILE)
+        payload = current.payload
+        if not payload or payload.get("owner") != settings.S3_LOCK_OWNER_ID:
+            set_run_lock_held(False)
+            return False
+
+        now = time.time()
+        renewed = {
+            **payload,
+            "renewed_at": now,
+            "expires_at": now + float(settings.S3_LOCK_TIMEOUT_SECONDS),
+        }
+        if not write_json_payload_if(S3_LOCK_FILE, renewed, etag=current.etag):
+            set_run_lock_held(False)
+            return False
+        set_run_lock_held(True, expires_at=renewed["expires_at"])
+        return True
+    except Exception as e:
+        raise e if isinstance(e, AppError) else AppError("Failed to renew run lock.", "LOCK_RENEW_FAILED", cause=e)
+
+
 def release_lock() -> bool:
     """Release run lock when current lock owner matches this instance."""
     try:
         if not is_run_lock_held():
             return True
 
-        payload = read_json_payload(S3_LOCK_FILE)
+        current = read_json_payload_entry(S3_LOCK_FILE)
         owner_id = get_settings().S3_LOCK_OWNER_ID
-        if not payload or payload.get("owner") != owner_id:
+        if not current.payload or current.payload.get("owner") != owner_id:
             set_run_lock_held(False)
             return False
 
-        delete_object(S3_LOCK_FILE)
+        # ETag-matched so a lock taken over since the read is never removed.
+        released = delete_object_if(S3_LOCK_FILE, etag=current.etag)
         set_run_lock_held(False)
-        return True
+        return released
     except Exception as e:
         raise e if isinstance(e, AppError) else AppError("Failed to release run lock.", "LOCK_RELEASE_FAILED", cause=e)
 
@@ -114,10 +171,6 @@ def admin_acquire_lock() -> dict[str, Any]:
     """Acquire admin lock and return acquisition status with lock metadata."""
     try:
         now = time.time()
-        current_payload = read_json_payload(S3_ADMIN_LOCK_FILE)
-        if current_payload and not is_expired(current_payload, now=now):
-            return {"acquired": False, "status": admin_lock_status()}
-
         token = str(uuid.uuid4())
         settings = get_settings()
         payload = {
@@ -126,7 +179,8 @@ def admin_acquire_lock() -> dict[str, Any]:
             "acquired_at": now,
             "expires_at": now + float(settings.ADMIN_LOCK_TIMEOUT_SECONDS),
         }
-        write_json_payload(S3_ADMIN_LOCK_FILE, payload)
+        if not _try_claim_lock(S3_ADMIN_LOCK_FILE, payload, now=now):
+            return {"acquired": False, "status": admin_lock_status()}
         return {"acquired": True, "token": token, "status": admin_lock_status()}
     except Exception as e:
         raise e if isinstance(e, AppError) else AppError(
@@ -151,12 +205,16 @@ def admin_release_lock(token: str | None) -> bool:
     try:
         if not admin_validate_lock_token(token):
             return False
-        if admin_op_lock_exists():
+        if _active_admin_op_lock_data() is not None:
             return False
 
-        delete_object(S3_ADMIN_LOCK_FILE)
-        delete_object(S3_ADMIN_OP_LOCK_FILE)
-        return True
+        op_lock = read_json_payload_entry(S3_ADMIN_OP_LOCK_FILE)
+        if op_lock.payload and op_lock.payload.get("holder_token") == token:
+            delete_object_if(S3_ADMIN_OP_LOCK_FILE, etag=op_lock.etag)
+        current = read_json_payload_entry(S3_ADMIN_LOCK_FILE)
+        if not current.payload or current.payload.get("token") != token:
+            return False
+        return delete_object_if(S3_ADMIN_LOCK_FILE, etag=current.etag)
     except Exception as e:
         raise e if isinstance(e, AppError) else AppError(
             "Failed to release admin lock.",
@@ -182,7 +240,7 @@ def admin_acquire_op_lock(token: str | None) -> bool:
     """Acquire admin operation lock for validated admin token."""
     if not admin_validate_lock_token(token):
         return False
-    if admin_op_lock_exists():
+    if _active_admin_op_lock_data() is not None:
         return False
 
     now = time.time()
@@ -192,16 +250,22 @@ def admin_acquire_op_lock(token: str | None) -> bool:
         "acquired_at": now,
         "expires_at": now + expires_in,
     }
-    write_json_payload(S3_ADMIN_OP_LOCK_FILE, payload)
-    return True
+    # An op lock held under another admin token is orphaned and may be replaced.
+    return _try_claim_lock(
+        S3_ADMIN_OP_LOCK_FILE,
+        payload,
+        now=now,
+        replaceable=lambda current: current.get("holder_token") != token,
+    )
 
 
 def admin_release_op_lock(token: str | None) -> bool:
     """Release admin operation lock when holder token matches."""
-    payload = read_json_payload(S3_ADMIN_OP_LOCK_FILE)
-    if not payload:
+    current = read_json_payload_entry(S3_ADMIN_OP_LOCK_FILE)
+    if not current.payload:
         return True
-    if payload.get("holder_token") != token:
+    if current.payload.get("holder_token") != token:
         return False
-    delete_object(S3_ADMIN_OP_LOCK_FILE)
+    # A failed If-Match means the lock was already replaced, so it is no longer ours either way.
+    delete_object_if(S3_ADMIN_OP_LOCK_FILE, etag=current.etag)
     return True
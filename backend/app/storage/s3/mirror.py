@@ -0,0 +1,81 @@
+"""Persistent local mirror of storage objects, revalidated by ETag."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+from typing import Any
+
+from app.core.constants import S3_MIRROR_DIR
+from app.core.errors import AppError
+from app.core.paths import cache_path
+
+from .store import read_object_if_changed
+
+_MIRROR_INDEX_FILE = "index.json"
+_LOCK = threading.Lock()
+
+
+def _mirror_root() -> Path:
+    """Return mirror root directory under the cache directory."""
+    return cache_path(S3_MIRROR_DIR)
+
+
+def _load_index(root: Path) -> dict[str, dict[str, Any]]:
+    """Load mirror index ``{key: {"etag", "size"}}``; unreadable indexes are treated as empty."""
+    try:
+        payload = json.loads((root / _MIRROR_INDEX_FILE).read_text(encoding="utf-8"))
+        return payload if isinstance(payload, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(root: Path, index: dict[str, dict[str, Any]]) -> None:
+    """Persist mirror index atomically."""
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / (_MIRROR_INDEX_FILE + ".tmp")
+    tmp_path.write_text(json.dumps(index, indent=4), encoding="utf-8")
+    tmp_path.replace(root / _MIRROR_INDEX_FILE)
+
+
+def mirror_file(key: str) -> Path:
+    """Return a local copy of storage key, downloading it only when its ETag changed (read-only).
+
+    The local copy is trusted only when it exists with the recorded size;
+    otherwise it is fetched unconditionally. Missing keys raise and drop any
+    stale local copy.
+    """
+    try:
+        with _LOCK:
+            root = _mirror_root()
+            local_path = root / key
+            index = _load_index(root)
+            entry = index.get(key) if isinstance(index.get(key), dict) else None
+            known_etag = None
+            if entry is not None and local_path.is_file() and local_path.stat().st_size == entry.get("size"):
+                known_etag = entry.get("etag")
+
+            modified, content, etag = read_object_if_changed(key, known_etag)
+            if not modified:
+                return local_path
+            if content is None:
+                local_path.unlink(missing_ok=True)
+                index.pop(key, None)
+                _save_index(root, index)
+                raise AppError("Storage key does not exist.", "DOWNLOAD_FILE_FAILED", context={"key": key})
+
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(local_path)
+            index[key] = {"etag": etag, "size": len(content)}
+            _save_index(root, index)
+            return local_path
+    except Exception as e:
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to mirror file from storage.",
+            "DOWNLOAD_FILE_FAILED",
+            context={"key": key},
+            cause=e,
+        )
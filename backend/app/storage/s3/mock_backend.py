@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+from pathlib import Path
+
 from .common import _mock_path
 
+# A guard file older than this is assumed to belong to a crashed writer.
+_GUARD_STALE_SECONDS = 30.0
+
+
+def _etag(content: bytes) -> str:
+    """Return S3-style ETag (MD5 of content) for mock objects."""
+    return hashlib.md5(content).hexdigest()
+
 
 def read_object_bytes(key: str) -> bytes | None:
     """Read object bytes from local mock storage."""
@@ -13,13 +26,76 @@ def read_object_bytes(key: str) -> bytes | None:
     return path.read_bytes()
 
 
-def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> None:
-    """Write object bytes to local mock storage atomically."""
+def read_object_if_changed(key: str, etag: str | None) -> tuple[bool, bytes | None, str | None]:
+    """Read object bytes unless its ETag still matches; return (modified, content, etag)."""
+    path = _mock_path(key)
+    if not path.exists():
+        return True, None, None
+    content = path.read_bytes()
+    current = _etag(content)
+    if etag is not None and current == etag:
+        return False, None, current
+    return True, content, current
+
+
+def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> str:
+    """Write object bytes to local mock storage atomically and return the new ETag."""
     path = _mock_path(key)
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     tmp_path.write_bytes(content)
     tmp_path.replace(path)
+    return _etag(content)
+
+
+def _acquire_guard(path: Path) -> Path | None:
+    """Create an exclusive guard file next to path, or return None when another writer holds it."""
+    guard = path.with_suffix(path.suffix + ".guard")
+    for _ in range(2):
+        try:
+            os.close(os.open(guard, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return guard
+        except FileExistsError:
+            try:
+                if time.time() - guard.stat().st_mtime <= _GUARD_STALE_SECONDS:
+                    return None
+                guard.unlink()
+            except FileNotFoundError:
+                continue
+    return None
+
+
+def write_object_bytes_if(key: str, content: bytes, *, etag: str | None, public_read: bool = False) -> str | None:
+    """Write object bytes only if the precondition holds; return new ETag or None when it fails.
+
+    ``etag=None`` means create-only (the key must not exist); otherwise the current
+    object ETag must equal ``etag``.
+    """
+    path = _mock_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+    tmp_path.write_bytes(content)
+    try:
+        if etag is None:
+            try:
+                # Hard-linking the fully written temp file creates the key atomically or fails.
+                os.link(tmp_path, path)
+            except FileExistsError:
+                return None
+            return _etag(content)
+
+        guard = _acquire_guard(path)
+        if guard is None:
+            return None
+        try:
+            if not path.exists() or _etag(path.read_bytes()) != etag:
+                return None
+            os.replace(tmp_path, path)
+            return _etag(content)
+        finally:
+            guard.unlink(missing_ok=True)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def object_exists(key: str) -> bool:
@@ -27,10 +103,34 @@ def object_exists(key: str) -> bool:
     return _mock_path(key).exists()
 
 
-def delete_object(key: str) -> bool:
-    """Delete object from local mock storage and return whether it existed."""
+def delete_object(key: str, *, check_exists: bool = True) -> bool:
+    """Delete object from local mock storage and return whether it existed.
+
+    With ``check_exists=False`` True is returned even for a missing key, matching
+    the real backend's idempotent delete.
+    """
     path = _mock_path(key)
+    if not check_exists:
+        path.unlink(missing_ok=True)
+        return True
     if not path.exists():
         return False
     path.unlink()
     return True
+
+
+def delete_object_if(key: str, *, etag: str) -> bool:
+    """Delete object only while its ETag still matches; return whether it was deleted."""
+    path = _mock_path(key)
+    if not path.exists():
+        return False
+    guard = _acquire_guard(path)
+    if guard is None:
+        return False
+    try:
+        if not path.exists() or _etag(path.read_bytes()) != etag:
+            return False
+        path.unlink()
+        return True
+    finally:
+        guard.unlink(missing_ok=True)
@@ -28,6 +28,17 @@ def _is_not_found_error(error: Exception) -> bool:
     return code in {"404", "NotFound", "NoSuchKey", "NoSuchBucket"}
 
 
+def _is_not_modified_error(error: Exception) -> bool:
+    """Return True when a client error indicates a conditional read matched the ETag."""
+    if not isinstance(error, ClientError):
+        return False
+    try:
+        code = str(error.response.get("Error", {}).get("Code", ""))
+    except Exception:
+        return False
+    return code in {"304", "NotModified"}
+
+
 def _get_s3_client() -> Any:
     """Build and cache boto3 S3 client."""
     client = get_cached_client()
@@ -76,8 +87,30 @@ def read_object_bytes(key: str) -> bytes | None:
         )
 
 
-def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> None:
-    """Write object bytes to real S3."""
+def read_object_if_changed(key: str, etag: str | None) -> tuple[bool, bytes | None, str | None]:
+    """Read object bytes with If-None-Match; return (modified, content, etag)."""
+    client = _get_s3_client()
+    try:
+        get_kwargs: dict[str, Any] = {"Bucket": _s3_bucket(), "Key": _normalize_key(key)}
+        if etag:
+            get_kwargs["IfNoneMatch"] = etag
+        response = client.get_object(**get_kwargs)
+        return True, bytes(response["Body"].read()), response.get("ETag")
+    except Exception as e:
+        if _is_not_modified_error(e):
+            return False, None, etag
+        if _is_not_found_error(e):
+            return True, None, None
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to read object from S3.",
+            "S3_READ_FAILED",
+            context={"key": key},
+            cause=e,
+        )
+
+
+def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> str | None:
+    """Write object bytes to real S3 and return the new ETag when reported."""
     client = _get_s3_client()
     try:
         put_kwargs: dict[str, Any] = {
@@ -87,7 +120,8 @@ def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> N
         }
         if public_read:
             put_kwargs["ACL"] = "public-read"
-        client.put_object(**put_kwargs)
+        response = client.put_object(**put_kwargs)
+        return response.get("ETag") if isinstance(response, dict) else None
     except Exception as e:
         if public_read and isinstance(e, ClientError):
             code = str(e.response.get("Error", {}).get("Code", ""))
@@ -106,6 +140,48 @@ def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> N
         )
 
 
+def _is_precondition_failed_error(error: Exception) -> bool:
+    """Return True when a client error indicates a failed conditional write."""
+    if not isinstance(error, ClientError):
+        return False
+    try:
+        code = str(error.response.get("Error", {}).get("Code", ""))
+    except Exception:
+        return False
+    return code in {"412", "PreconditionFailed", "409", "ConditionalRequestConflict"}
+
+
+def write_object_bytes_if(key: str, content: bytes, *, etag: str | None, public_read: bool = False) -> str | None:
+    """Write object bytes with If-None-Match/If-Match; return new ETag or None when the precondition fails.
+
+    ``etag=None`` sends ``If-None-Match: *`` (create-only); otherwise ``If-Match: etag``.
+    """
+    client = _get_s3_client()
+    try:
+        put_kwargs: dict[str, Any] = {
+            "Bucket": _s3_bucket(),
+            "Key": _normalize_key(key),
+            "Body": content,
+        }
+        if etag is None:
+            put_kwargs["IfNoneMatch"] = "*"
+        else:
+            put_kwargs["IfMatch"] = etag
+        if public_read:
+            put_kwargs["ACL"] = "public-read"
+        response = client.put_object(**put_kwargs)
+        return str(response.get("ETag") or "") if isinstance(response, dict) else ""
+    except Exception as e:
+        if _is_precondition_failed_error(e):
+            return None
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to conditionally write object to S3.",
+            "S3_WRITE_FAILED",
+            context={"key": key},
+            cause=e,
+        )
+
+
 def object_exists(key: str) -> bool:
     """Check object existence in real S3."""
     client = _get_s3_client()
@@ -123,11 +199,14 @@ def object_exists(key: str) -> bool:
         )
 
 
-def delete_object(key: str) -> bool:
-    """Delete object in real S3 and return whether it existed."""
+def delete_object(key: str, *, check_exists: bool = True) -> bool:
+    """Delete object in real S3 and return whether it existed.
+
+    With ``check_exists=False`` the HEAD round-trip is skipped and True is returned,
+    since S3 deletes are idempotent.
+    """
     client = _get_s3_client()
-    existed = object_exists(key)
-    if not existed:
+    if check_exists and not object_exists(key):
         return False
     try:
         client.delete_object(Bucket=_s3_bucket(), Key=_normalize_key(key))
@@ -141,6 +220,23 @@ def delete_object(key: str) -> bool:
         )
 
 
+def delete_object_if(key: str, *, etag: str) -> bool:
+    """Delete object in real S3 with If-Match; return False when the precondition fails or the key is gone."""
+    client = _get_s3_client()
+    try:
+        client.delete_object(Bucket=_s3_bucket(), Key=_normalize_key(key), IfMatch=etag)
+        return True
+    except Exception as e:
+        if _is_precondition_failed_error(e) or _is_not_found_error(e):
+            return False
+        raise e if isinstance(e, AppError) else AppError(
+            "Failed to conditionally delete object from S3.",
+            "S3_DELETE_FAILED",
+            context={"key": key},
+            cause=e,
+        )
+
+
 def reset_cached_client() -> None:
     """Reset cached S3 client reference."""
     set_cached_client(None)
@@ -1,20 +1,40 @@
 """Internal mutable state for S3 storage adapter."""
 
+from dataclasses import dataclass
 from typing import Any
 
 _run_lock_held = False
+_run_lock_expires_at: float | None = None
 _s3_client: Any | None = None
 
 
+@dataclass(frozen=True)
+class PayloadCacheEntry:
+    """Last known JSON payload of a storage key with its ETag and fetch time."""
+
+    payload: dict[str, Any] | None
+    etag: str | None
+    fetched_at: float
+
+
+_payload_cache: dict[str, PayloadCacheEntry] = {}
+
+
 def is_run_lock_held() -> bool:
     """Return whether the current process holds the run lock."""
     return _run_lock_held
 
 
-def set_run_lock_held(value: bool) -> None:
-    """Set in-memory run lock ownership flag."""
-    global _run_lock_held
+def set_run_lock_held(value: bool, *, expires_at: float | None = None) -> None:
+    """Set in-memory run lock ownership flag and the lease expiry last written for it."""
+    global _run_lock_held, _run_lock_expires_at
     _run_lock_held = value
+    _run_lock_expires_at = expires_at if value else None
+
+
+def run_lock_expires_at() -> float | None:
+    """Return the wall-clock expiry of the held run lock lease, if known."""
+    return _run_lock_expires_at
 
 
 def get_cached_client() -> Any | None:
@@ -26,3 +46,23 @@ def set_cached_client(client: Any | None) -> None:
     """Set cached boto3 client reference."""
     global _s3_client
     _s3_client = client
+
+
+def get_payload_cache_entry(key: str) -> PayloadCacheEntry | None:
+    """Return cached payload entry for key, if any."""
+    return _payload_cache.get(key)
+
+
+def set_payload_cache_entry(key: str, entry: PayloadCacheEntry) -> None:
+    """Store payload cache entry for key."""
+    _payload_cache[key] = entry
+
+
+def drop_payload_cache_entry(key: str) -> None:
+    """Forget cached payload entry for key."""
+    _payload_cache.pop(key, None)
+
+
+def clear_payload_cache() -> None:
+    """Drop all cached payload entries."""
+    _payload_cache.clear()
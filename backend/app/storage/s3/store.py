@@ -6,22 +6,26 @@ import json
 import time
 from typing import Any
 
-from app.storage.local import read_json as read_local_json
-from app.storage.local import write_json as write_local_json
-
-from .common import _is_real_s3_enabled, _mock_path
+from .common import _is_real_s3_enabled
 from .mock_backend import (
     delete_object as delete_object_mock,
+    delete_object_if as delete_object_if_mock,
     object_exists as object_exists_mock,
     read_object_bytes as read_object_bytes_mock,
+    read_object_if_changed as read_object_if_changed_mock,
     write_object_bytes as write_object_bytes_mock,
+    write_object_bytes_if as write_object_bytes_if_mock,
 )
 from .real_backend import (
     delete_object as delete_object_real,
+    delete_object_if as delete_object_if_real,
     object_exists as object_exists_real,
     read_object_bytes as read_object_bytes_real,
+    read_object_if_changed as read_object_if_changed_real,
     write_object_bytes as write_object_bytes_real,
+    write_object_bytes_if as write_object_bytes_if_real,
 )
+from .state import PayloadCacheEntry, drop_payload_cache_entry, get_payload_cache_entry, set_payload_cache_entry
 
 
 def read_object_bytes(key: str) -> bytes | None:
@@ -29,12 +33,18 @@ def read_object_bytes(key: str) -> bytes | None:
     return read_object_bytes_real(key) if _is_real_s3_enabled() else read_object_bytes_mock(key)
 
 
-def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> None:
-    """Write object bytes to configured backend."""
+def read_object_if_changed(key: str, etag: str | None) -> tuple[bool, bytes | None, str | None]:
+    """Conditionally read object bytes from configured backend."""
     if _is_real_s3_enabled():
-        write_object_bytes_real(key, content, public_read=public_read)
-    else:
-        write_object_bytes_mock(key, content, public_read=public_read)
+        return read_object_if_changed_real(key, etag)
+    return read_object_if_changed_mock(key, etag)
+
+
+def write_object_bytes(key: str, content: bytes, public_read: bool = False) -> str | None:
+    """Write object bytes to configured backend and return the new ETag when known."""
+    if _is_real_s3_enabled():
+        return write_object_bytes_real(key, content, public_read=public_read)
+    return write_object_bytes_mock(key, content, public_read=public_read)
 
 
 def object_exists(key: str) -> bool:
@@ -42,37 +52,105 @@ def object_exists(key: str) -> bool:
     return object_exists_real(key) if _is_real_s3_enabled() else object_exists_mock(key)
 
 
-def delete_object(key: str) -> bool:
-    """Delete object from configured backend."""
-    return delete_object_real(key) if _is_real_s3_enabled() else delete_object_mock(key)
+def delete_object(key: str, *, check_exists: bool = True) -> bool:
+    """Delete object from configured backend and remember the key as missing."""
+    if _is_real_s3_enabled():
+        deleted = delete_object_real(key, check_exists=check_exists)
+    else:
+        deleted = delete_object_mock(key, check_exists=check_exists)
+    set_payload_cache_entry(key, PayloadCacheEntry(payload=None, etag=None, fetched_at=time.monotonic()))
+    return deleted
 
 
-def read_json_payload(key: str) -> dict[str, Any] | None:
-    """Read JSON payload from storage key and normalize invalid payloads as None."""
+def delete_object_if(key: str, *, etag: str) -> bool:
+    """Delete object only while it still has ``etag``; return False when it changed or is gone."""
+    if _is_real_s3_enabled():
+        deleted = delete_object_if_real(key, etag=etag)
+    else:
+        deleted = delete_object_if_mock(key, etag=etag)
+    if deleted:
+        set_payload_cache_entry(key, PayloadCacheEntry(payload=None, etag=None, fetched_at=time.monotonic()))
+    else:
+        drop_payload_cache_entry(key)
+    return deleted
+
+
+def _decode_json_payload(raw: bytes | None) -> dict[str, Any] | None:
+    """Decode raw JSON payload bytes and normalize invalid payloads as None."""
+    if raw is None:
+        return None
+    try:
+        payload = json.loads(raw.decode("utf-8"))
+        return payload if isinstance(payload, dict) and payload else None
+    except Exception:
+        return None
+
+
+def _encode_json_payload(payload: dict[str, Any]) -> bytes:
+    """Serialize a JSON payload the way the configured backend stores it."""
     if _is_real_s3_enabled():
-        raw = read_object_bytes_real(key)
-        if raw is None:
-            return None
-        try:
-            payload = json.loads(raw.decode("utf-8"))
-            return payload if isinstance(payload, dict) and payload else None
-        except Exception:
-            return None
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=4).encode("utf-8")
+
+
+def read_json_payload_entry(key: str, *, max_age: float = 0.0) -> PayloadCacheEntry:
+    """Read JSON payload of a storage key together with its ETag.
+
+    Payloads are cached per key with their ETag. Within ``max_age`` seconds of the
+    last fetch the cached entry is returned without a backend call; after that a
+    conditional read is issued and the cached payload is reused when unchanged.
+    The returned ETag is None only when the object does not exist.
+    """
+    now = time.monotonic()
+    entry = get_payload_cache_entry(key)
+    if entry is not None and max_age > 0 and now - entry.fetched_at <= max_age:
+        return entry
+
+    modified, raw, etag = read_object_if_changed(key, entry.etag if entry else None)
+    payload = entry.payload if (not modified and entry is not None) else _decode_json_payload(raw)
+    fresh = PayloadCacheEntry(payload=payload, etag=etag, fetched_at=now)
+    set_payload_cache_entry(key, fresh)
+    return fresh
+
+
+def read_json_if_changed(key: str, etag: str | None) -> tuple[bool, dict[str, Any] | None, str | None]:
+    """Conditionally read and decode a JSON object without touching the payload cache.
 
-    payload = read_local_json(_mock_path(key))
-    return payload if payload else None
+    Meant for large artifacts whose caller keeps its own derived copy; returns
+    ``(modified, payload, etag)`` where payload is None when unchanged or missing.
+    """
+    modified, raw, new_etag = read_object_if_changed(key, etag)
+    return modified, (_decode_json_payload(raw) if modified else None), new_etag
+
+
+def read_json_payload(key: str, *, max_age: float = 0.0) -> dict[str, Any] | None:
+    """Read JSON payload from storage key and normalize invalid payloads as None."""
+    payload = read_json_payload_entry(key, max_age=max_age).payload
+    return dict(payload) if payload else None
 
 
 def write_json_payload(key: str, payload: dict[str, Any], public_read: bool = False) -> None:
-    """Write JSON payload to storage key."""
+    """Write JSON payload to storage key and cache it as the latest known value."""
+    etag = write_object_bytes(key, _encode_json_payload(payload), public_read=public_read)
+    set_payload_cache_entry(key, PayloadCacheEntry(payload=dict(payload), etag=etag or None, fetched_at=time.monotonic()))
+
+
+def write_json_payload_if(key: str, payload: dict[str, Any], *, etag: str | None, public_read: bool = False) -> bool:
+    """Conditionally write JSON payload; return False when another writer got there first.
+
+    ``etag=None`` creates the key only if it does not exist; otherwise the write
+    succeeds only while the stored object still has that ETag.
+    """
+    content = _encode_json_payload(payload)
     if _is_real_s3_enabled():
-        write_object_bytes_real(
-            key,
-            json.dumps(payload, ensure_ascii=False).encode("utf-8"),
-            public_read=public_read,
-        )
-        return
-    write_local_json(_mock_path(key), payload)
+        new_etag = write_object_bytes_if_real(key, content, etag=etag, public_read=public_read)
+    else:
+        new_etag = write_object_bytes_if_mock(key, content, etag=etag, public_read=public_read)
+    if new_etag is None:
+        drop_payload_cache_entry(key)
+        return False
+    set_payload_cache_entry(key, PayloadCacheEntry(payload=dict(payload), etag=new_etag or None, fetched_at=time.monotonic()))
+    return True
 
 
 def is_expired(payload: dict[str, Any] | None, *, now: float | None = None) -> bool:
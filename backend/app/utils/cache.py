@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from app.core.errors import AppError
+from app.core.tracing import span
 
 
 def make_key(method: str, url: str, params: Any = None, data: Any = None, json_body: Any = None) -> str:
@@ -44,7 +45,9 @@ class CacheStore:
 
     def load(self) -> None:
         """Load cache from disk once."""
-        self._cache = _load_cache(self.path)
+        with span("cache", op="load", path=self.path.name) as current:
+            self._cache = _load_cache(self.path)
+            current.set(entries=len(self._cache))
         self._loaded = True
 
     def get(self, cache_key: str, html_hash: str) -> Any | None:
@@ -74,7 +77,8 @@ class CacheStore:
         """Persist in-memory cache to disk."""
         if not self._loaded:
             return
-        _save_cache(self._cache, self.path)
+        with span("cache", op="flush", path=self.path.name, entries=len(self._cache)):
+            _save_cache(self._cache, self.path)
 
 
 def _load_cache(path: Path) -> dict[str, dict[str, Any]]:
@@ -0,0 +1,80 @@
+"""Bounded concurrent fetching with ordered result assembly."""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+import threading
+import time
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+def _timed(fetch: Callable[[K], R], key: K) -> tuple[R, float]:
+    """Call fetch(key) and return its result with elapsed seconds."""
+    started = time.perf_counter()
+    result = fetch(key)
+    return result, time.perf_counter() - started
+
+
+def _timed_capture(fetch: Callable[[K], R], key: K) -> tuple[R | Exception, float]:
+    """Like `_timed`, but return the raised exception as the result."""
+    started = time.perf_counter()
+    try:
+        result: R | Exception = fetch(key)
+    except Exception as e:
+        result = e
+    return result, time.perf_counter() - started
+
+
+def per_host_limited(fetch: Callable[[str], R], max_per_host: int) -> Callable[[str], R]:
+    """Wrap a URL fetch so at most max_per_host calls run at once against each host."""
+    semaphores: dict[str, threading.BoundedSemaphore] = {}
+    lock = threading.Lock()
+
+    def _limited(url: str) -> R:
+        host = urlsplit(url).netloc.lower()
+        with lock:
+            semaphore = semaphores.setdefault(host, threading.BoundedSemaphore(max(1, max_per_host)))
+        with semaphore:
+            return fetch(url)
+
+    return _limited
+
+
+def fetch_ordered(
+    fetch: Callable[[K], R],
+    keys: Iterable[K],
+    *,
+    max_workers: int,
+    return_exceptions: bool = False,
+) -> Iterator[tuple[K, R, float]]:
+    """Yield ``(key, fetch(key), elapsed_seconds)`` in input order.
+
+    With ``max_workers > 1`` up to that many fetches run ahead on worker
+    threads; otherwise keys are fetched one by one. The first failure (in input
+    order) is raised and pending fetches are cancelled, unless
+    ``return_exceptions`` is set, in which case the exception is yielded as the
+    key's result and the remaining keys are still fetched.
+    """
+    key_list = list(keys)
+    call = _timed_capture if return_exceptions else _timed
+    if max_workers <= 1 or len(key_list) <= 1:
+        for key in key_list:
+            result, elapsed = call(fetch, key)
+            yield key, result, elapsed
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+    try:
+        # Each fetch runs in a copy of the caller's context so trace spans nest under the caller's span.
+        futures: list[Future[tuple[R, float]]] = [
+            executor.submit(contextvars.copy_context().run, call, fetch, key) for key in key_list
+        ]
+        for key, future in zip(key_list, futures):
+            result, elapsed = future.result()
+            yield key, result, elapsed
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -2,6 +2,7 @@
 
 from collections.abc import Iterable
 import random
+import threading
 import time
 from typing import Any
 
@@ -10,8 +11,10 @@ from requests import Response, Session
 
 from app.core.errors import AppError
 from app.core.settings import get_settings
+from app.core.tracing import span
 
 _SESSION: Session | None = None
+_SESSION_LOCK = threading.Lock()
 
 
 def get_session() -> Session:
@@ -19,13 +22,16 @@ def get_session() -> Session:
     global _SESSION
     if _SESSION is not None:
         return _SESSION
-    session = requests.Session()
-    settings = get_settings()
-    headers = settings.DEFAULT_HEADERS
-    if isinstance(headers, dict):
-        session.headers.update(headers)
-    _SESSION = session
-    return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            return _SESSION
+        session = requests.Session()
+        settings = get_settings()
+        headers = settings.DEFAULT_HEADERS
+        if isinstance(headers, dict):
+            session.headers.update(headers)
+        _SESSION = session
+        return _SESSION
 
 
 def reset_session() -> None:
@@ -100,7 +106,10 @@ def request(
 def get(url: str, **kwargs: Any) -> Response:
     """Send an HTTP GET request."""
     try:
-        return request("GET", url, **kwargs)
+        with span("fetch", method="GET", url=url, call=kwargs.get("name")) as current:
+            resp = request("GET", url, **kwargs)
+            current.set(status=resp.status_code, bytes=len(resp.content))
+            return resp
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError("GET request failed", "GET_REQUEST_FAILED", context={"url": url, **kwargs}, cause=e)
         raise err
@@ -109,7 +118,10 @@ def get(url: str, **kwargs: Any) -> Response:
 def post(url: str, *, data: Any = None, **kwargs: Any) -> Response:
     """Send an HTTP POST request."""
     try:
-        return request("POST", url, data=data, **kwargs)
+        with span("fetch", method="POST", url=url, call=kwargs.get("name")) as current:
+            resp = request("POST", url, data=data, **kwargs)
+            current.set(status=resp.status_code, bytes=len(resp.content))
+            return resp
     except Exception as e:
         err = e if isinstance(e, AppError) else AppError("POST request failed", "POST_REQUEST_FAILED", context={"url": url, "data": data, **kwargs}, cause=e)
         raise err
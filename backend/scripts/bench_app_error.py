@@ -0,0 +1,111 @@
+"""Benchmark the HTTP retry path with eager (previous) versus lazy AppError stack capture."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import traceback
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest.mock import patch
+
+
+def _repo_backend_root() -> Path:
+    """Return backend root directory for this script."""
+    return Path(__file__).resolve().parents[1]
+
+
+sys.path.insert(0, str(_repo_backend_root()))
+
+from app.core.errors import AppError  # noqa: E402
+from app.utils import http  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark AppError construction on the http.request retry path.")
+    parser.add_argument("--calls", type=int, default=2000, help="Failing GET calls per timed run.")
+    parser.add_argument("--retries", type=int, default=5, help="GLOBAL_RETRIES used for each call.")
+    parser.add_argument("--depth", type=int, default=40, help="Extra stack frames above the call (pipeline/server depth).")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is reported).")
+    return parser.parse_args()
+
+
+def _eager_post_init(self: AppError) -> None:
+    """Previous behavior: format the full stack on every construction."""
+    self._frames = []
+    if self.call_stack is None:
+        self.call_stack = "".join(traceback.format_stack()[:-1])
+
+
+class _FlakySession:
+    """Session stub whose every request answers 503 so all retries run."""
+
+    def request(self, *_args: Any, **_kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(status_code=503)
+
+
+def _at_depth(depth: int, fn: Callable[[], None]) -> None:
+    """Run fn below `depth` extra frames."""
+    if depth <= 0:
+        fn()
+        return
+    _at_depth(depth - 1, fn)
+
+
+def _failing_calls(calls: int) -> None:
+    """Issue failing GETs, swallowing the final AppError like a best-effort caller."""
+    for _ in range(calls):
+        try:
+            http.get("https://oibs.example/flaky", name="bench")
+        except AppError:
+            pass
+
+
+def _best_of(repeat: int, fn: Callable[[], None]) -> float:
+    """Return the best wall time of fn over repeat runs."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    args = _parse_args()
+    settings = SimpleNamespace(
+        HTTP_TIMEOUT=1,
+        GLOBAL_RETRIES=args.retries,
+        RETRY_BASE_DELAY=0,
+        RETRY_JITTER=0,
+        THROTTLE_ENABLED=False,
+        TRACE_ENABLED=False,
+    )
+
+    def run() -> None:
+        _at_depth(args.depth, lambda: _failing_calls(args.calls))
+
+    with (
+        patch("app.utils.http.get_settings", new=lambda: settings),
+        patch("app.core.tracing.get_settings", new=lambda: settings),
+        patch("app.utils.http.get_session", new=lambda: _FlakySession()),
+        # Backoff sleeps (even time.sleep(0)) would dominate; only error handling is measured.
+        patch("app.utils.http._sleep_with_jitter", new=lambda *_args: None),
+    ):
+        lazy_seconds = _best_of(args.repeat, run)
+        with patch.object(AppError, "__post_init__", _eager_post_init):
+            eager_seconds = _best_of(args.repeat, run)
+
+    errors = args.calls * (args.retries + 1)
+    print(f"{args.calls} failing calls x {args.retries} retries ({errors} AppErrors, +{args.depth} frames)")
+    print(f"Eager stack capture: {eager_seconds * 1000:.1f} ms ({eager_seconds / errors * 1e6:.1f} us/error)")
+    print(f"Lazy stack capture:  {lazy_seconds * 1000:.1f} ms ({lazy_seconds / errors * 1e6:.1f} us/error)")
+    print(f"Speedup:             {eager_seconds / lazy_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
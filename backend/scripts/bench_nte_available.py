@@ -0,0 +1,144 @@
+"""Benchmark NTE available index/output building and data.json loading (full decode vs lazy reader)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _repo_backend_root() -> Path:
+    """Return backend root directory for this script."""
+    return Path(__file__).resolve().parents[1]
+
+
+sys.path.insert(0, str(_repo_backend_root()))
+
+from app.nte.parse import build_availability_index, build_available_index, build_course_output, select_courses  # noqa: E402
+from app.storage.lazy_json import open_json_lazy  # noqa: E402
+from app.storage.local import write_json  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    backend_root = _repo_backend_root()
+    parser = argparse.ArgumentParser(description="Benchmark nteAvailable building on a data.json catalog.")
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=backend_root / "data" / "published" / "data.json",
+        help="data.json to benchmark on; a synthetic full-size catalog is used when missing.",
+    )
+    parser.add_argument(
+        "--departments",
+        type=Path,
+        default=backend_root / "data" / "published" / "departments.json",
+        help="departments.json matching --data (synthesized when missing).",
+    )
+    parser.add_argument("--nte-courses", type=int, default=600, help="Number of NTE courses to build output for.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is reported).")
+    return parser.parse_args()
+
+
+def _synthetic_catalog(departments: int = 120, courses_per_department: int = 30, sections: int = 6) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build a data.json-shaped catalog of roughly production size."""
+    rng = random.Random(42)
+    data: dict[str, Any] = {}
+    dept_map: dict[str, Any] = {}
+    for dept in range(departments):
+        dept_code = str(100 + dept)
+        dept_map[dept_code] = {"n": f"Department {dept_code}", "p": f"D{dept_code}"}
+        for course in range(courses_per_department):
+            code = f"{dept_code}{course:04d}"
+            data[code] = {
+                "Course Code": code,
+                "Course Name": f"{code} - Course",
+                "Sections": {
+                    str(section): {
+                        "i": ["Instructor"],
+                        "c": [
+                            {"d": rng.choice(["ALL", "TÜM BÖLÜMLER", f"D{dept_code}", "EE", "ME"]), "s": "AA", "e": "ZZ"}
+                            for _ in range(rng.randint(0, 4))
+                        ],
+                        "t": [{"d": rng.randint(0, 4), "s": "9:40", "e": "11:30", "p": "R1"}],
+                    }
+                    for section in range(1, sections + 1)
+                },
+            }
+    return data, dept_map
+
+
+def _load_inputs(args: argparse.Namespace) -> tuple[dict[str, Any], dict[str, Any], str]:
+    """Load data/departments from disk, or fall back to the synthetic catalog."""
+    if args.data.exists() and args.departments.exists():
+        data = json.loads(args.data.read_text(encoding="utf-8"))
+        departments = json.loads(args.departments.read_text(encoding="utf-8"))
+        return data, departments, str(args.data)
+    data, departments = _synthetic_catalog()
+    return data, departments, "synthetic"
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    """Return the best wall time of fn over repeat runs."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    args = _parse_args()
+    data, departments, source = _load_inputs(args)
+    matched = list(build_available_index(data, departments).items())
+    random.Random(7).shuffle(matched)
+    matched = matched[: args.nte_courses]
+
+    def baseline() -> None:
+        build_available_index(data, departments)
+        for prefixed, info in matched:
+            build_course_output(info["numeric"], prefixed, info["name"], "3", data)
+
+    def indexed() -> None:
+        availability = build_availability_index(data)
+        build_available_index(data, departments, availability)
+        for prefixed, info in matched:
+            build_course_output(info["numeric"], prefixed, info["name"], "3", data, availability)
+
+    sections = sum(len(node.get("Sections", {})) for node in data.values() if isinstance(node, dict))
+    baseline_seconds = _best_of(args.repeat, baseline)
+    indexed_seconds = _best_of(args.repeat, indexed)
+    print(f"Input: {source} ({len(data)} courses, {sections} sections, {len(matched)} NTE outputs)")
+    print(f"Per-call filtering:  {baseline_seconds * 1000:.1f} ms")
+    print(f"Availability index:  {indexed_seconds * 1000:.1f} ms")
+    print(f"Speedup:             {baseline_seconds / indexed_seconds:.2f}x")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = args.data if args.data.exists() else Path(tmp_dir) / "data.json"
+        if not args.data.exists():
+            write_json(data_path, data)
+        codes = [prefixed for prefixed, _ in matched]
+
+        def full_load() -> None:
+            select_courses(codes, json.loads(data_path.read_bytes()), departments)
+
+        def lazy_load() -> None:
+            with open_json_lazy(data_path) as lazy:
+                select_courses(codes, lazy, departments)
+
+        full_seconds = _best_of(args.repeat, full_load)
+        lazy_seconds = _best_of(args.repeat, lazy_load)
+        print(f"data.json ({data_path.stat().st_size / 1e6:.1f} MB) full decode: {full_seconds * 1000:.1f} ms")
+        print(f"data.json lazy reader:          {lazy_seconds * 1000:.1f} ms")
+        print(f"Speedup:                        {full_seconds / lazy_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
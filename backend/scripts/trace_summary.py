@@ -0,0 +1,74 @@
+"""Summarize trace spans from trace.jsonl: slowest spans per name and totals."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+
+def _repo_backend_root() -> Path:
+    """Return backend root directory for this script."""
+    return Path(__file__).resolve().parents[1]
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Summarize pipeline trace spans.")
+    parser.add_argument(
+        "--file",
+        type=Path,
+        default=_repo_backend_root() / "data" / "logs" / "trace.jsonl",
+        help="trace.jsonl to read.",
+    )
+    parser.add_argument("--name", action="append", help="Span names to list (default: department, course, fetch).")
+    parser.add_argument("--top", type=int, default=10, help="Slowest spans to list per name.")
+    parser.add_argument("--trace", help="Only include spans of this trace id (default: the latest pipeline trace).")
+    return parser.parse_args()
+
+
+def _load_spans(path: Path) -> list[dict[str, Any]]:
+    """Read span payloads, skipping unparsable lines."""
+    spans: list[dict[str, Any]] = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except ValueError:
+                continue
+    return spans
+
+
+def main() -> None:
+    """Print per-name totals and the slowest spans of one trace."""
+    args = _parse_args()
+    spans = _load_spans(args.file)
+    trace_id = args.trace
+    if trace_id is None:
+        roots = [item for item in spans if item.get("name") == "pipeline" and item.get("parent") is None]
+        trace_id = max(roots, key=lambda item: item.get("ts", 0))["trace"] if roots else None
+    if trace_id is not None:
+        spans = [item for item in spans if item.get("trace") == trace_id]
+        root = next((item for item in spans if item.get("parent") is None), {})
+        print(f"Trace {trace_id} ({root.get('attrs', {}).get('pipeline', '?')}): {root.get('ms', 0) / 1000:.2f}s, {len(spans)} spans")
+
+    by_name: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for item in spans:
+        by_name[item.get("name", "?")].append(item)
+    for name, items in sorted(by_name.items()):
+        errors = sum(1 for item in items if item.get("status") == "error")
+        print(f"  {name:<12} n={len(items):<6} total={sum(item['ms'] for item in items) / 1000:8.2f}s errors={errors}")
+
+    for name in args.name or ["department", "course", "fetch"]:
+        items = sorted(by_name.get(name, []), key=lambda item: item["ms"], reverse=True)[: args.top]
+        if not items:
+            continue
+        print(f"\nSlowest {name} spans:")
+        for item in items:
+            print(f"  {item['ms']:10.1f} ms  {json.dumps(item.get('attrs', {}), ensure_ascii=False)}")
+
+
+if __name__ == "__main__":
+    main()
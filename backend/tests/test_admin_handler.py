@@ -13,7 +13,7 @@ class AdminHandlerTests(unittest.TestCase):
     """Validate response flow for lock and mutating admin actions."""
 
     def setUp(self) -> None:
-        self._status_patcher = patch("app.services.admin_handler.sync_status_from_locks", return_value=None)
+        self._status_patcher = patch("app.services.admin_handler.sync_status_from_locks_async", return_value=None)
         self._status_patcher.start()
 
     def tearDown(self) -> None:
@@ -85,5 +85,23 @@ class AdminHandlerTests(unittest.TestCase):
         self.assertEqual(model.data["failed_count"], 1)
 
 
+    @patch("app.services.admin_handler.admin_validate_lock_token", return_value=True)
+    @patch("app.services.admin_handler.admin_acquire_op_lock", return_value=True)
+    @patch("app.services.admin_handler.admin_release_op_lock")
+    @patch("app.services.admin_handler.arm_profiling")
+    def test_profile_arm_validates_and_arms(self, arm_profiling, _release, _acquire, _validate) -> None:
+        arm_profiling.return_value = {"scrape": {"mode": "cprofile", "runs": 2}}
+        model, status = handle_admin_action(
+            AdminAction.PROFILE_ARM,
+            payload={"pipelines": "scrape", "mode": "cprofile", "runs": 2},
+            lock_token="t",
+        )
+        self.assertEqual(status, 200)
+        arm_profiling.assert_called_once_with(["scrape"], mode="cprofile", runs=2)
+        self.assertEqual(model.data["armed"]["scrape"]["runs"], 2)
+
+        model, status = handle_admin_action(AdminAction.PROFILE_ARM, payload={"runs": "many"}, lock_token="t")
+        self.assertEqual(status, 400)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+"""Unit tests for the in-memory catalog index, its reload logic, and catalog routes."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.routes import catalog_course, catalog_musts, catalog_search
+from app.catalog import service
+from app.catalog.index import CatalogIndex
+from app.core.errors import AppError
+from app.storage.s3 import store
+
+
+def _response_json(response: object) -> dict:
+    """Decode JSON payload from Starlette JSONResponse."""
+    body = getattr(response, "body", b"{}")
+    return json.loads(body.decode("utf-8"))
+
+
+def _data() -> dict:
+    """Build data.json-shaped sample catalog (string keys as published)."""
+    return {
+        "5710140": {
+            "Course Code": "5710140",
+            "Course Name": "CENG140 - C Programming",
+            "Sections": {
+                "1": {"i": ["JOHN  DOE"], "c": [], "t": []},
+                "2": {"i": ["Jane Roe"], "c": [], "t": []},
+            },
+        },
+        "5710213": {
+            "Course Code": "5710213",
+            "Course Name": "CENG213 - Data Structures",
+            "Sections": {"1": {"i": ["John Doe"], "c": [], "t": []}},
+        },
+        "2360201": {
+            "Course Code": "2360201",
+            "Course Name": "2360201 - Programming Practice",
+            "Sections": {},
+        },
+    }
+
+
+def _departments() -> dict:
+    """Build departments.json sample."""
+    return {"571": {"n": "Computer Engineering", "p": "CENG"}, "236": {"n": "Other", "p": "<no-course>"}}
+
+
+class CatalogIndexTests(unittest.TestCase):
+    """Validate index lookups over sample artifacts."""
+
+    def setUp(self) -> None:
+        self.index = CatalogIndex(_data(), _departments(), {"CENG": {"1": ["5710140"]}})
+
+    def test_course_lookup_by_numeric_and_prefixed_code(self) -> None:
+        """Numeric and deptified prefixed codes should resolve to the same course."""
+        by_numeric = self.index.course("5710140")
+        by_prefixed = self.index.course("ceng 140")
+
+        self.assertEqual(by_numeric, by_prefixed)
+        self.assertEqual(by_numeric["prefixed_code"], "CENG140")
+        self.assertIn("1", by_numeric["sections"])
+        self.assertIsNone(self.index.course("CENG999"))
+        self.assertIsNone(self.index.course("2360201")["prefixed_code"])
+
+    def test_department_and_instructor_lookups(self) -> None:
+        """Departments resolve by code or prefix; instructor names are normalized."""
+        self.assertEqual([c["code"] for c in self.index.department_courses("571")], ["5710140", "5710213"])
+        self.assertEqual([c["code"] for c in self.index.department_courses("ceng")], ["5710140", "5710213"])
+        sections = self.index.instructor_sections("john doe")
+        self.assertEqual([(s["code"], s["section"]) for s in sections], [("5710140", "1"), ("5710213", "1")])
+
+    def test_search_matches_token_prefixes(self) -> None:
+        """Every query token must prefix-match a name or code token."""
+        self.assertEqual([c["code"] for c in self.index.search("program")], ["2360201", "5710140"])
+        self.assertEqual([c["code"] for c in self.index.search("ceng data")], ["5710213"])
+        self.assertEqual(self.index.search("program", limit=1)[0]["code"], "2360201")
+        self.assertEqual(self.index.search("zzz"), [])
+        self.assertEqual(self.index.musts_for("ceng"), {"1": ["5710140"]})
+
+
+class CatalogServiceTests(unittest.TestCase):
+    """Validate ETag-driven hot reload and failure fallback."""
+
+    def setUp(self) -> None:
+        service.reset_catalog_index()
+        self.etag = "v1"
+        self._patches = [
+            patch("app.catalog.service.get_settings", return_value=SimpleNamespace(CATALOG_REFRESH_SECONDS=0.0)),
+            patch("app.catalog.service.log_item"),
+            patch("app.catalog.service.read_json_if_changed", side_effect=self._read),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        service.reset_catalog_index()
+
+    def _read(self, key: str, etag: str | None) -> tuple[bool, dict | None, str]:
+        """Answer conditional reads of sample payloads against the current test ETag."""
+        current = f"{key}:{self.etag}"
+        if etag == current:
+            return False, None, current
+        payloads = {"data.json": _data(), "departments.json": _departments(), "musts.json": None}
+        return True, payloads[key], current
+
+    def test_index_rebuilt_only_when_etag_changes(self) -> None:
+        """Same ETags should reuse the index; a new ETag should rebuild it."""
+        first = service.get_catalog_index()
+        self.assertIs(service.get_catalog_index(), first)
+
+        self.etag = "v2"
+        self.assertIsNot(service.get_catalog_index(), first)
+
+    def test_still_missing_source_does_not_rebuild(self) -> None:
+        """A source that stays missing should not trigger a rebuild or full re-reads."""
+        calls: list[tuple[str, str | None]] = []
+
+        def read(key: str, etag: str | None) -> tuple[bool, dict | None, str | None]:
+            calls.append((key, etag))
+            if key == "musts.json":
+                return True, None, None
+            return self._read(key, etag)
+
+        with patch("app.catalog.service.read_json_if_changed", side_effect=read):
+            first = service.get_catalog_index()
+            calls.clear()
+            self.assertIs(service.get_catalog_index(), first)
+        self.assertNotIn(("data.json", None), calls)
+
+    def test_catalog_payloads_stay_out_of_payload_cache(self) -> None:
+        """Decoded catalog sources should not be retained in the shared storage payload cache."""
+        with patch("app.storage.s3.store.read_object_if_changed", return_value=(True, b'{"a": 1}', "e1")):
+            with patch("app.storage.s3.store.set_payload_cache_entry") as set_entry:
+                self.assertEqual(store.read_json_if_changed("data.json", None), (True, {"a": 1}, "e1"))
+        set_entry.assert_not_called()
+
+    def test_refresh_failure_keeps_serving_previous_index(self) -> None:
+        """Revalidation errors should fall back to the existing index."""
+        first = service.get_catalog_index()
+        with patch("app.catalog.service.read_json_if_changed", side_effect=RuntimeError("s3 down")):
+            self.assertIs(service.get_catalog_index(), first)
+
+    def test_routes_map_results_and_errors(self) -> None:
+        """Routes should return 200/404 envelopes and 503 when no index can be built."""
+        response = catalog_course("CENG140")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_response_json(response)["data"]["code"], "5710140")
+
+        self.assertEqual(catalog_course("CENG999").status_code, 404)
+        self.assertEqual(catalog_musts("CENG").status_code, 404)
+
+        with patch("app.api.routes.get_settings", return_value=SimpleNamespace(CATALOG_SEARCH_MAX_RESULTS=1)):
+            payload = _response_json(catalog_search(q="ceng", limit=10))
+        self.assertEqual(len(payload["data"]), 1)
+
+        service.reset_catalog_index()
+        with patch("app.api.routes.get_catalog_index", side_effect=AppError("boom", "CATALOG_REFRESH_FAILED")):
+            self.assertEqual(catalog_course("CENG140").status_code, 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
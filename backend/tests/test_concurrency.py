@@ -0,0 +1,77 @@
+"""Unit tests for bounded concurrent fetching helpers."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from app.utils.concurrency import fetch_ordered, per_host_limited
+
+
+class FetchOrderedTests(unittest.TestCase):
+    """Validate ordering, concurrency bound, and error propagation."""
+
+    def test_results_follow_input_order_with_bounded_workers(self) -> None:
+        """Slow early keys should not reorder results; in-flight fetches stay within max_workers."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(key: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02 if key == 0 else 0.005)
+            with lock:
+                active -= 1
+            return key * 10
+
+        results = list(fetch_ordered(fetch, range(6), max_workers=3))
+
+        self.assertEqual([(key, value) for key, value, _ in results], [(i, i * 10) for i in range(6)])
+        self.assertTrue(all(elapsed > 0 for _, _, elapsed in results))
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 3)
+
+    def test_first_error_in_order_is_raised(self) -> None:
+        """A failing key should raise after earlier results were yielded."""
+        def fetch(key: int) -> int:
+            if key == 2:
+                raise ValueError("boom")
+            return key
+
+        seen: list[int] = []
+        with self.assertRaises(ValueError):
+            for key, _value, _elapsed in fetch_ordered(fetch, range(5), max_workers=2):
+                seen.append(key)
+        self.assertEqual(seen, [0, 1])
+
+        self.assertEqual([key for key, _, _ in fetch_ordered(lambda k: k, ["a", "b"], max_workers=1)], ["a", "b"])
+
+    def test_per_host_limit_caps_in_flight_requests(self) -> None:
+        """At most max_per_host fetches should run concurrently against one host."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def fetch(url: str) -> str:
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            return url
+
+        urls = [f"http://a.example/{i}" for i in range(6)] + [f"http://b.example/{i}" for i in range(2)]
+        results = list(fetch_ordered(per_host_limited(fetch, 2), urls, max_workers=8, return_exceptions=True))
+
+        self.assertEqual([value for _, value, _ in results], urls)
+        self.assertLessEqual(peak["a.example"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
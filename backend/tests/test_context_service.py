@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-import shutil
 import unittest
-import uuid
-from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -18,35 +15,9 @@ class ContextServiceTests(unittest.TestCase):
     """Validate run/admin context isolation and orchestration semantics."""
 
     def setUp(self) -> None:
-        base_tmp = Path(__file__).resolve().parent / ".tmp"
-        base_tmp.mkdir(parents=True, exist_ok=True)
-        self.tmp_dir = base_tmp / f"context_{uuid.uuid4().hex}"
-        self.tmp_dir.mkdir(parents=True, exist_ok=True)
-
         self._patches: list[patch] = []
-        self._patches.append(
-            patch(
-                "app.context.service.downloaded_path",
-                side_effect=lambda filename: self.tmp_dir / "downloaded" / filename,
-            )
-        )
-        self._patches.append(
-            patch(
-                "app.context.service.staged_path",
-                side_effect=lambda filename: self.tmp_dir / "staged" / filename,
-            )
-        )
-        self._patches.append(
-            patch(
-                "app.context.service.published_path",
-                side_effect=lambda filename: self.tmp_dir / "published" / filename,
-            )
-        )
-        self._patches.append(patch("app.context.service.s3_file_exists", return_value=False))
-        self._patches.append(patch("app.context.service.download_file", side_effect=lambda *args, **kwargs: "ok"))
-        self._patches.append(patch("app.context.service.upload_file", side_effect=lambda *args, **kwargs: "ok"))
-        self._patches.append(patch("app.context.service.move_file", side_effect=lambda src, dst: str(dst)))
-        self._patches.append(patch("app.context.service.read_json", return_value={}))
+        self._patches.append(patch("app.context.service.download_json", return_value=None))
+        self._patches.append(patch("app.context.service.upload_json", return_value="ok"))
         self._patches.append(patch("app.context.service.log_item"))
         self._patches.append(
             patch(
@@ -66,7 +37,6 @@ class ContextServiceTests(unittest.TestCase):
         service.detach_context(admin=True)
         for patcher in reversed(self._patches):
             patcher.stop()
-        shutil.rmtree(self.tmp_dir, ignore_errors=True)
 
     def test_run_and_admin_stores_are_isolated(self) -> None:
         """Mutating run context should not alter admin context store."""
@@ -105,17 +75,29 @@ class ContextServiceTests(unittest.TestCase):
         self.assertEqual(request_type, RequestType.SCRAPE)
 
     def test_publish_context_state_uses_admin_upload_guard(self) -> None:
-        """Admin publish should call upload_file with _admin=True."""
-        with patch("app.context.service.upload_file", return_value="ok") as upload_mock:
+        """Admin publish should call upload_json with _admin=True."""
+        with patch("app.context.service.upload_json", return_value="ok") as upload_mock:
             service.load_context_state(admin=True)
             self.assertTrue(service.enqueue_request(RequestType.MUSTS, admin=True))
 
-            service.publish_context_state(admin=True)
+            self.assertTrue(service.publish_context_state(admin=True))
 
             upload_mock.assert_called_once()
             call_args = upload_mock.call_args
             self.assertEqual(call_args.kwargs["_admin"], True)
             self.assertEqual(call_args.args[1], CONTEXT_KEY)
+            self.assertEqual(call_args.args[0]["queue"], [RequestType.MUSTS.value])
+
+    def test_publish_skips_upload_when_context_unchanged(self) -> None:
+        """Publishing an unmodified context should not touch storage but still detach."""
+        with patch("app.context.service.upload_json", return_value="ok") as upload_mock:
+            service.load_context_state(admin=False)
+            self.assertFalse(service.publish_context_state(admin=False))
+
+            upload_mock.assert_not_called()
+        with patch("app.context.service.download_json", return_value={"error_count": 3}) as download_mock:
+            self.assertEqual(service.get_context_snapshot(admin=False)["error_count"], 3)
+            download_mock.assert_called_once_with(CONTEXT_KEY)
 
     def test_record_failure_suspends_and_unsuspend_resets_gate(self) -> None:
         """Failure threshold should suspend; unsuspend should allow queue ops again."""
@@ -138,6 +120,32 @@ class ContextServiceTests(unittest.TestCase):
         service.unsuspend_processing(admin=False)
         self.assertTrue(service.enqueue_request(RequestType.MUSTS, admin=False))
 
+    def test_queue_orders_by_priority_and_deduplicates(self) -> None:
+        """Higher-priority requests dequeue first and duplicates are rejected."""
+        service.load_context_state(admin=False)
+        self.assertTrue(service.enqueue_request(RequestType.MUSTS, admin=False))
+        self.assertTrue(service.enqueue_request(RequestType.SCRAPE, admin=False))
+        self.assertFalse(service.enqueue_request(RequestType.SCRAPE, admin=False))
+        self.assertFalse(service.enqueue_request(RequestType.ROOT, admin=False))
+
+        snapshot = service.get_context_snapshot(admin=False)
+        self.assertEqual(snapshot["queue"], [RequestType.SCRAPE.value, RequestType.MUSTS.value])
+
+        self.assertEqual(service.next_queued_request(admin=False), RequestType.SCRAPE)
+        self.assertEqual(service.next_queued_request(admin=False), RequestType.MUSTS)
+        self.assertIsNone(service.next_queued_request(admin=False))
+
+    def test_loaded_queue_is_normalized(self) -> None:
+        """Persisted queues should be deduplicated, priority-ordered, and re-flagged on load."""
+        persisted = {"queue": ["musts", "scrape", "musts"], "in_queue": {"musts": False}}
+        with patch("app.context.service.download_json", return_value=persisted):
+            service.load_context_state(admin=False)
+
+        snapshot = service.get_context_snapshot(admin=False)
+        self.assertEqual(snapshot["queue"], ["scrape", "musts"])
+        self.assertTrue(snapshot["in_queue"]["musts"])
+        self.assertFalse(snapshot["in_queue"]["root"])
+
 
 if __name__ == "__main__":
     unittest.main()
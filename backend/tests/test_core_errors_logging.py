@@ -4,13 +4,25 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import shutil
 import unittest
+import uuid
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from app.core.constants import LOGGER_APP
+from app.core.constants import LOG_FILE_APP, LOGGER_APP, LOGGER_ERROR, LOGGER_SCRAPE, LOGGER_TRACE
 from app.core.errors import AppError
-from app.core.logging import _JsonFormatter, _build_formatter, log_item
+from app.core.logging import (
+    _BatchingSMTPHandler,
+    _DroppingQueueHandler,
+    _JsonFormatter,
+    _build_formatter,
+    log_item,
+    setup_logging,
+    shutdown_logging,
+)
 
 
 class AppErrorTests(unittest.TestCase):
@@ -67,6 +79,19 @@ class AppErrorTests(unittest.TestCase):
         self.assertIn("stack", payload)
         self.assertIsNone(kwargs["exc_info"])
 
+    def test_stack_is_formatted_lazily_on_first_use(self) -> None:
+        """Construction should not format the stack; stack_text should point at the creation site."""
+        def make_error() -> AppError:
+            return AppError("lazy")
+
+        err = make_error()
+        self.assertIsNone(err.call_stack)
+
+        stack = err.stack_text()
+        self.assertIn("make_error", stack)
+        self.assertIs(err.call_stack, stack)
+        self.assertEqual(AppError("given", call_stack="preset").stack_text(), "preset")
+
 
 class LoggingHelperTests(unittest.TestCase):
     """Validate helper-level behavior in app.core.logging."""
@@ -124,7 +149,7 @@ class LoggingHelperTests(unittest.TestCase):
         self.assertNotIsInstance(formatter, _JsonFormatter)
 
     def test_json_formatter_outputs_expected_shape(self) -> None:
-        """_JsonFormatter should emit parseable JSON with expected fields."""
+        """_JsonFormatter should emit parseable JSON with expected and extra fields."""
         formatter = _JsonFormatter()
         record = logging.LogRecord(
             name="test",
@@ -136,12 +161,99 @@ class LoggingHelperTests(unittest.TestCase):
             exc_info=None,
         )
 
+        record.dept_code = "571"
+
         payload = json.loads(formatter.format(record))
+        self.assertEqual(payload["dept_code"], "571")
         self.assertEqual(payload["level"], "INFO")
         self.assertEqual(payload["logger"], "test")
         self.assertEqual(payload["msg"], "hello")
         self.assertIn("ts", payload)
 
 
+class QueuedLoggingTests(unittest.TestCase):
+    """Validate queue-based handler wiring, overflow dropping, and mail batching."""
+
+    def setUp(self) -> None:
+        base_tmp = Path(__file__).resolve().parent / ".tmp"
+        base_tmp.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir = base_tmp / f"logging_{uuid.uuid4().hex}"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self) -> None:
+        shutdown_logging()
+        for name in (LOGGER_APP, LOGGER_SCRAPE):
+            logging.getLogger(name).handlers.clear()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    @patch("app.core.logging.log_dir")
+    @patch("app.core.logging.get_settings")
+    def test_setup_logging_routes_records_through_queue_listener(self, get_settings_mock: MagicMock, log_dir_mock: MagicMock) -> None:
+        """Loggers should only hold a queue handler; the listener writes each logger's own file."""
+        get_settings_mock.return_value = SimpleNamespace(
+            LOG_LEVEL="INFO",
+            LOG_JSON=False,
+            LOG_CONSOLE=False,
+            LOG_RETENTION_DAYS=1,
+            LOG_QUEUE_SIZE=100,
+            MAIL_ENABLED=False,
+        )
+        log_dir_mock.return_value = self.tmp_dir
+
+        setup_logging()
+        handlers = logging.getLogger(LOGGER_SCRAPE).handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], _DroppingQueueHandler)
+        trace_handlers = logging.getLogger(LOGGER_TRACE).handlers
+        error_handlers = logging.getLogger(LOGGER_ERROR).handlers
+        self.assertIsNot(trace_handlers[0].queue, error_handlers[0].queue)
+        self.assertIs(error_handlers[0], handlers[0])
+
+        log_item(LOGGER_APP, logging.INFO, "queued hello")
+        shutdown_logging()
+
+        self.assertIn("queued hello", (self.tmp_dir / LOG_FILE_APP).read_text(encoding="utf-8"))
+        self.assertEqual(logging.getLogger(LOGGER_SCRAPE).handlers, [])
+
+    def test_full_queue_drops_and_counts_records(self) -> None:
+        """Enqueueing into a full queue should not block and should count drops."""
+        handler = _DroppingQueueHandler(queue.Queue(maxsize=1))
+        for i in range(3):
+            handler.emit(logging.makeLogRecord({"msg": f"m{i}", "levelno": logging.INFO}))
+
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.take_dropped(), 2)
+        self.assertEqual(handler.take_dropped(), 0)
+
+    def test_smtp_handler_batches_and_rate_limits(self) -> None:
+        """Records should be mailed together; the next batch waits for the minimum interval."""
+        handler = _BatchingSMTPHandler(
+            mailhost=("localhost", 25),
+            fromaddr="a@example.com",
+            toaddrs=["b@example.com"],
+            subject="[test] error",
+            batch_seconds=60.0,
+            min_interval_seconds=300.0,
+            max_records=2,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        with patch.object(handler, "_send") as send_mock:
+            for i in range(3):
+                handler.emit(logging.makeLogRecord({"msg": f"err{i}", "levelno": logging.ERROR}))
+            handler.flush()
+
+            send_mock.assert_called_once()
+            subject, body = send_mock.call_args.args
+            self.assertEqual(subject, "[test] error (3)")
+            self.assertIn("err0", body)
+            self.assertIn("err1", body)
+            self.assertIn("1 more error record(s) omitted", body)
+
+            handler.emit(logging.makeLogRecord({"msg": "later", "levelno": logging.ERROR}))
+            self.assertGreater(handler._timer.interval, 200.0)
+            handler.close()
+            self.assertEqual(send_mock.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
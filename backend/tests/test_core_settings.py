@@ -14,10 +14,10 @@ class CoreSettingsTests(unittest.TestCase):
     """Validate Settings model and helper accessor behavior."""
 
     def setUp(self) -> None:
-        settings_module.get_settings.cache_clear()
+        settings_module.reload_settings()
 
     def tearDown(self) -> None:
-        settings_module.get_settings.cache_clear()
+        settings_module.reload_settings()
 
     def test_default_headers_factory_returns_expected_keys(self) -> None:
         """Default headers factory should return the expected outbound header keys."""
@@ -34,11 +34,28 @@ class CoreSettingsTests(unittest.TestCase):
         self.assertNotIn("X-Test", second)
 
     def test_get_settings_is_cached(self) -> None:
-        """get_settings should return the same cached object until cache_clear."""
+        """get_settings should return the same snapshot until reload_settings."""
         one = settings_module.get_settings()
         two = settings_module.get_settings()
         self.assertIs(one, two)
 
+    @patch.dict(os.environ, {"HTTP_TIMEOUT": "11"}, clear=False)
+    def test_pinned_snapshot_survives_reload_until_run_ends(self) -> None:
+        """A pinned run keeps its snapshot; reloads publish a new one for later callers."""
+        settings_module.reload_settings()
+        with settings_module.pinned_settings() as pinned:
+            owner_id = pinned.S3_LOCK_OWNER_ID
+            with patch.dict(os.environ, {"HTTP_TIMEOUT": "22"}):
+                published = settings_module.reload_settings()
+            self.assertIs(settings_module.get_settings(), pinned)
+            self.assertEqual(settings_module.get_settings().HTTP_TIMEOUT, 11)
+
+        self.assertIs(settings_module.get_settings(), published)
+        self.assertEqual(published.HTTP_TIMEOUT, 22)
+        self.assertEqual(published.S3_LOCK_OWNER_ID, owner_id)
+        with self.assertRaises(Exception):
+            published.HTTP_TIMEOUT = 5
+
     @patch.dict(
         os.environ,
         {
@@ -51,7 +68,7 @@ class CoreSettingsTests(unittest.TestCase):
     )
     def test_get_settings_fills_mail_sender_and_recipient_defaults(self) -> None:
         """Missing mail sender/recipient should be derived from username/admin email."""
-        settings_module.get_settings.cache_clear()
+        settings_module.reload_settings()
         s = settings_module.get_settings()
 
         self.assertEqual(s.MAIL_SENDER, "sender@example.com")
@@ -69,7 +86,7 @@ class CoreSettingsTests(unittest.TestCase):
     )
     def test_settings_parses_env_types(self) -> None:
         """Settings model should coerce env strings into typed fields."""
-        settings_module.get_settings.cache_clear()
+        settings_module.reload_settings()
         s = settings_module.get_settings()
 
         self.assertEqual(s.HTTP_TIMEOUT, 33)
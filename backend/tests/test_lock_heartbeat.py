@@ -0,0 +1,74 @@
+"""Unit tests for run lock lease heartbeat."""
+
+from __future__ import annotations
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.errors import AppError
+from app.services import lock_heartbeat
+from app.services.lock_heartbeat import LockHeartbeat
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll predicate until true or timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class LockHeartbeatTests(unittest.TestCase):
+    """Validate periodic renewal, lost-lease handling, and interval bounds."""
+
+    @patch("app.services.lock_heartbeat.log_item")
+    @patch("app.services.lock_heartbeat.renew_lock", return_value=True)
+    def test_renews_until_stopped(self, renew_lock, _log_item) -> None:
+        """Heartbeat should keep renewing until stop is called."""
+        heartbeat = LockHeartbeat(interval=0.01)
+        heartbeat.start()
+        self.assertTrue(_wait_for(lambda: renew_lock.call_count >= 3))
+        heartbeat.stop()
+
+        calls = renew_lock.call_count
+        time.sleep(0.05)
+        self.assertEqual(renew_lock.call_count, calls)
+        self.assertFalse(heartbeat.lost)
+
+    @patch("app.services.lock_heartbeat.log_item")
+    @patch("app.services.lock_heartbeat.renew_lock", return_value=False)
+    def test_stops_and_flags_when_lease_lost(self, renew_lock, log_item) -> None:
+        """A failed renewal should mark the lease lost and end the heartbeat."""
+        heartbeat = LockHeartbeat(interval=0.01)
+        heartbeat.start()
+        self.assertTrue(_wait_for(lambda: heartbeat.lost))
+        time.sleep(0.05)
+        heartbeat.stop()
+
+        self.assertEqual(renew_lock.call_count, 1)
+        self.assertEqual(log_item.call_args.args[2].code, "LOCK_LEASE_LOST")
+
+    @patch("app.services.lock_heartbeat.log_item")
+    @patch("app.services.lock_heartbeat.renew_lock")
+    def test_transient_errors_keep_heartbeat_alive(self, renew_lock, _log_item) -> None:
+        """Renewal exceptions should be logged without stopping the heartbeat."""
+        renew_lock.side_effect = [AppError("s3 down", "S3_WRITE_FAILED"), True, True]
+        heartbeat = LockHeartbeat(interval=0.01)
+        heartbeat.start()
+        self.assertTrue(_wait_for(lambda: renew_lock.call_count >= 3))
+        heartbeat.stop()
+        self.assertFalse(heartbeat.lost)
+
+    @patch("app.services.lock_heartbeat.get_settings")
+    def test_interval_capped_to_third_of_ttl(self, get_settings) -> None:
+        """Interval should never exceed a third of the lock TTL."""
+        get_settings.return_value = SimpleNamespace(S3_LOCK_HEARTBEAT_SECONDS=300, S3_LOCK_TIMEOUT_SECONDS=600)
+        self.assertEqual(lock_heartbeat._heartbeat_interval(), 200.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,11 +8,13 @@ from bs4 import BeautifulSoup
 
 from app.core.errors import AppError
 from app.nte.parse import (
+    build_availability_index,
     build_available_index,
     build_course_output,
     extract_courses,
     extract_department_links,
     extract_nte_courses,
+    select_courses,
 )
 
 
@@ -167,6 +169,50 @@ class NteParseTests(unittest.TestCase):
         self.assertEqual(output["sections"][0]["section_id"], "not found")
         self.assertEqual(output["sections"][0]["times"][0]["day"], "No Timestamp Added Yet")
 
+    def test_availability_index_is_reused_by_both_builders(self) -> None:
+        """Precomputed availability should give the same results as per-call filtering."""
+        courses_data = {
+            571101: {
+                "Course Name": "Intro",
+                "Sections": {
+                    "1": {"c": [{"d": "TÜM BÖLÜMLER"}], "t": [], "i": []},
+                    "2": {"c": [{"d": "ONLY EE"}], "t": [], "i": []},
+                    "3": {"c": [], "t": [], "i": []},
+                },
+            },
+            571102: {"Course Name": "Blocked", "Sections": {"1": {"c": [{"d": "ONLY EE"}], "t": [], "i": []}}},
+        }
+
+        availability = build_availability_index(courses_data)
+
+        self.assertEqual(availability, {"571101": ("1", "3")})
+        self.assertEqual(
+            build_available_index(courses_data, {"571": {"p": "CENG"}}, availability),
+            build_available_index(courses_data, {"571": {"p": "CENG"}}),
+        )
+        string_keyed = {str(code): node for code, node in courses_data.items()}
+        output = build_course_output("571101", "CENG101", "Intro", "4", string_keyed, availability)
+        self.assertEqual([section["section_id"] for section in output["sections"]], ["1", "3"])
+
+
+    def test_select_courses_decodes_only_matching_nodes(self) -> None:
+        """select_courses should map prefixed codes back to numeric data.json keys."""
+        class Tracking(dict):
+            def __init__(self, *args) -> None:
+                super().__init__(*args)
+                self.read: list[str] = []
+
+            def __getitem__(self, key):
+                self.read.append(key)
+                return super().__getitem__(key)
+
+        courses = Tracking({"5710101": {"n": 1}, "5711234": {"n": 2}, "1200140": {"n": 3}, "5710102": {"n": 4}})
+        dept_map = {"571": {"p": "CENG"}, "120": {"p": "ECON"}, "999": {"p": "-no course prefix-"}}
+
+        selected = select_courses(["CENG101", "CENG1234", "ECON140", "MATH101"], courses, dept_map)
+
+        self.assertEqual(selected, {"5710101": {"n": 1}, "5711234": {"n": 2}, "1200140": {"n": 3}})
+        self.assertNotIn("5710102", courses.read)
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,21 +1,43 @@
-"""Unit tests for musts and NTE pipeline orchestrators."""
+"""Unit tests for musts, NTE, and schedule artifact pipeline orchestrators."""
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import tempfile
 import unittest
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from app.core.constants import RequestType
 from app.core.errors import AppError
+from app.nte.io import load_dependencies
 from app.pipelines.musts import run_musts
 from app.pipelines.nte_available import run_nte_available
+from app.pipelines.nte_list import run_nte_list
+from app.pipelines.schedule_bundles import run_schedule_bundles
+from app.pipelines.section_conflicts import run_section_conflicts
+
+
+@contextmanager
+def _empty_mock_storage(root: Path) -> Iterator[None]:
+    """Point the mock storage backend and local mirror at empty directories under root."""
+    with (
+        patch("app.storage.s3.common.get_settings", return_value=SimpleNamespace(S3_BUCKET="")),
+        patch("app.storage.s3.common._mock_dir", return_value=root / "s3"),
+        patch("app.storage.s3.mirror._mirror_root", return_value=root / "mirror"),
+    ):
+        yield
 
 
 class MustsPipelineTests(unittest.TestCase):
     """Validate musts pipeline success and failure control flow."""
 
     @patch("app.pipelines.musts.run_nte_list", side_effect=AppError("nte fail", "NTE_LIST_FAIL"))
+    @patch("app.pipelines.musts.run_schedule_bundles", side_effect=AppError("no masks", "SECTION_MASKS_UNAVAILABLE"))
+    @patch("app.pipelines.musts.run_section_conflicts", side_effect=AppError("no masks", "SECTION_MASKS_UNAVAILABLE"))
     @patch("app.pipelines.musts.upload_file")
     @patch("app.pipelines.musts.move_file")
     @patch("app.pipelines.musts.write_json")
@@ -36,10 +58,12 @@ class MustsPipelineTests(unittest.TestCase):
         _write_json,
         _move_file,
         upload_file,
+        _run_section_conflicts,
+        _run_schedule_bundles,
         _run_nte_list,
     ) -> None:
-        """Musts should still succeed when best-effort NTE post-step fails."""
-        get_settings.return_value = SimpleNamespace(MUSTS_PARSER_VERSION="1.0.0")
+        """Musts should still succeed when best-effort conflicts/bundles/NTE post-steps fail."""
+        get_settings.return_value = SimpleNamespace(MUSTS_PARSER_VERSION="1.0.0", MUSTS_FETCH_WORKERS=4)
         cache = MagicMock()
         cache.get.return_value = None
         cache_store_cls.return_value = cache
@@ -77,10 +101,26 @@ class MustsPipelineTests(unittest.TestCase):
         self.assertEqual(model.status, "FAILED")
         self.assertEqual(model.message, "Departments data could not be loaded from S3.")
 
+    @patch("app.pipelines.musts.log_item")
+    @patch("app.pipelines.musts.CacheStore")
+    @patch("app.pipelines.musts.get_settings")
+    def test_run_musts_missing_departments_in_storage_returns_503(
+        self,
+        _get_settings,
+        _cache_store,
+        _log_item,
+    ) -> None:
+        """A departments.json missing from the mock backend should map to the 503 dependency response."""
+        with tempfile.TemporaryDirectory() as tmp, _empty_mock_storage(Path(tmp)):
+            model, status = run_musts()
+
+        self.assertEqual(status, 503)
+        self.assertEqual(model.message, "Departments data could not be loaded from S3.")
+
     @patch("app.pipelines.musts.log_item")
     @patch("app.pipelines.musts.load_departments", return_value={})
     @patch("app.pipelines.musts.CacheStore")
-    @patch("app.pipelines.musts.get_settings", return_value=SimpleNamespace(MUSTS_PARSER_VERSION="1.0.0"))
+    @patch("app.pipelines.musts.get_settings", return_value=SimpleNamespace(MUSTS_PARSER_VERSION="1.0.0", MUSTS_FETCH_WORKERS=4))
     def test_run_musts_no_output_returns_500(
         self,
         _get_settings,
@@ -183,6 +223,243 @@ class NteAvailablePipelineTests(unittest.TestCase):
             run_nte_available()
         self.assertEqual(exc.exception.code, "NTE_AVAILABLE_NO_NTE_COURSES")
 
+    @patch("app.nte.io.read_json", return_value={"CENG": []})
+    @patch("app.nte.io.mirror_file", side_effect=lambda key: f"/mirror/{key}")
+    def test_load_dependencies_downloads_only_missing_artifacts(
+        self,
+        mirror_file,
+        read_json,
+    ) -> None:
+        """Artifacts handed over in memory should not be checked or downloaded from S3."""
+        data = {"5710140": {"Sections": {}}}
+        departments = {"571": {"p": "CENG"}}
+
+        deps = load_dependencies(data=data, departments=departments)
+
+        self.assertIs(deps["data"], data)
+        self.assertIs(deps["departments"], departments)
+        self.assertEqual(deps["nte_list"], {"CENG": []})
+        mirror_file.assert_called_once_with("nteList.json")
+        read_json.assert_called_once_with("/mirror/nteList.json")
+
+    def test_load_dependencies_missing_in_storage_keeps_dependency_code(self) -> None:
+        """Artifacts missing from the mock backend should fail with the dependency download code."""
+        with tempfile.TemporaryDirectory() as tmp, _empty_mock_storage(Path(tmp)):
+            with self.assertRaises(AppError) as exc:
+                load_dependencies()
+
+        self.assertEqual(exc.exception.code, "DOWNLOAD_DEPENDENCIES_FAILED")
+
+    @patch("app.nte.io.open_json_lazy")
+    @patch("app.nte.io.read_json", return_value={})
+    @patch("app.nte.io.mirror_file", side_effect=lambda key: f"/mirror/{key}")
+    def test_load_dependencies_closes_lazy_data_when_validation_fails(
+        self,
+        _mirror_file,
+        _read_json,
+        open_json_lazy,
+    ) -> None:
+        """A lazily opened data.json should be closed when dependencies are rejected."""
+        lazy = MagicMock(spec=["close", "__len__", "__iter__", "__getitem__"])
+        open_json_lazy.return_value = lazy
+
+        with self.assertRaises(AppError) as exc:
+            load_dependencies()
+
+        self.assertEqual(exc.exception.code, "LOAD_DEPENDENCIES_FAILED")
+        lazy.close.assert_called_once_with()
+
+
+class NteListPipelineTests(unittest.TestCase):
+    """Validate concurrent NTE department crawl merging and per-link failures."""
+
+    @patch("app.pipelines.nte_list.upload_file")
+    @patch("app.pipelines.nte_list.move_file")
+    @patch("app.pipelines.nte_list.write_json")
+    @patch("app.pipelines.nte_list.extract_courses")
+    @patch("app.pipelines.nte_list.get_department_page")
+    @patch("app.pipelines.nte_list.get_nte_courses", return_value=("root", "h", SimpleNamespace(text="")))
+    @patch("app.pipelines.nte_list.CacheStore")
+    @patch("app.pipelines.nte_list.get_settings")
+    @patch("app.pipelines.nte_list.log_item")
+    def test_run_nte_list_skips_failed_links_and_sorts_output(
+        self,
+        log_item,
+        get_settings,
+        cache_store_cls,
+        _get_nte_courses,
+        get_department_page,
+        extract_courses,
+        write_json,
+        _move_file,
+        upload_file,
+    ) -> None:
+        """A failing department link should be logged and skipped; merged output is sorted."""
+        get_settings.return_value = SimpleNamespace(
+            NTE_LIST_PARSER_VERSION="1.0.0",
+            NTE_LIST_FETCH_WORKERS=3,
+            NTE_LIST_MAX_PER_HOST=2,
+            NTE_LIST_MAX_FAILED_RATIO=0.5,
+        )
+        cache = MagicMock()
+        cache.get.side_effect = lambda key, _hash: {"dept_links": ["http://h/a", "http://h/b", "http://h/c"]} if key == "root" else None
+        cache_store_cls.return_value = cache
+
+        def fetch_page(link: str):
+            if link.endswith("/b"):
+                raise AppError("down", "GET_NTE_DEPARTMENT_PAGE_FAILED")
+            return link, "h", SimpleNamespace(text=f"<p>{link}</p>")
+
+        def fill_courses(soup, courses):
+            name = "Zoology" if "/a" in soup.get_text() else "Art"
+            courses.extend([{"code": "X2", "name": "b", "credits": "3"}, {"code": "X1", "name": "a", "credits": "3"}])
+            return name
+
+        get_department_page.side_effect = fetch_page
+        extract_courses.side_effect = fill_courses
+
+        result = run_nte_list()
+
+        self.assertEqual(result.pages, 3)
+        self.assertEqual(result.failed_links, ("http://h/b",))
+        self.assertGreaterEqual(result.crawl_seconds, 0.0)
+        output = write_json.call_args.args[1]
+        self.assertEqual(list(output), ["Art", "Zoology"])
+        self.assertEqual([course["code"] for course in output["Art"]], ["X1", "X2"])
+        upload_file.assert_called_once()
+        warnings = [call.args[2] for call in log_item.call_args_list if call.args[1] == logging.WARNING]
+        self.assertEqual([err.code for err in warnings], ["GET_NTE_DEPARTMENT_PAGE_FAILED"])
+
+    @patch("app.pipelines.nte_list.upload_file")
+    @patch("app.pipelines.nte_list.get_department_page")
+    @patch("app.pipelines.nte_list.get_nte_courses", return_value=("root", "h", SimpleNamespace(text="")))
+    @patch("app.pipelines.nte_list.CacheStore")
+    @patch("app.pipelines.nte_list.get_settings")
+    @patch("app.pipelines.nte_list.log_item")
+    def test_run_nte_list_keeps_previous_artifact_when_too_many_links_fail(
+        self,
+        _log_item,
+        get_settings,
+        cache_store_cls,
+        _get_nte_courses,
+        get_department_page,
+        upload_file,
+    ) -> None:
+        """Failures above the allowed share should abort before nteList.json is overwritten."""
+        get_settings.return_value = SimpleNamespace(
+            NTE_LIST_PARSER_VERSION="1.0.0",
+            NTE_LIST_FETCH_WORKERS=2,
+            NTE_LIST_MAX_PER_HOST=2,
+            NTE_LIST_MAX_FAILED_RATIO=0.1,
+        )
+        cache = MagicMock()
+        cache.get.side_effect = lambda key, _hash: {"dept_links": ["http://h/a", "http://h/b"]} if key == "root" else None
+        cache_store_cls.return_value = cache
+
+        def fetch_page(link: str):
+            if link.endswith("/b"):
+                raise AppError("down", "GET_NTE_DEPARTMENT_PAGE_FAILED")
+            return link, "h", SimpleNamespace(text="<p/>")
+
+        get_department_page.side_effect = fetch_page
+
+        with self.assertRaises(AppError) as exc:
+            run_nte_list()
+
+        self.assertEqual(exc.exception.code, "NTE_LIST_TOO_MANY_FAILURES")
+        self.assertEqual(exc.exception.context["failed_links"], ["http://h/b"])
+        upload_file.assert_not_called()
+
+
+class SectionConflictsPipelineTests(unittest.TestCase):
+    """Validate section conflicts pipeline inputs and publishing."""
+
+    @patch("app.pipelines.section_conflicts.upload_file")
+    @patch("app.pipelines.section_conflicts.move_file")
+    @patch("app.pipelines.section_conflicts.write_json")
+    @patch("app.pipelines.section_conflicts.read_json_if_changed")
+    @patch("app.pipelines.section_conflicts.log_item")
+    def test_run_section_conflicts_publishes_index(
+        self,
+        _log_item,
+        read_json_if_changed,
+        write_json,
+        _move_file,
+        upload_file,
+    ) -> None:
+        """Passed-in masks should be combined with stored musts and published."""
+        read_json_if_changed.return_value = (True, {"CENG": {"1": ["5710140", "5710213"]}}, "e1")
+
+        output_path = run_section_conflicts({"5710140": {"1": 0b11}, "5710213": {"1": 0b10, "2": 0b100}})
+
+        self.assertTrue(output_path.endswith("sectionConflicts.json"))
+        self.assertEqual(write_json.call_args.args[1]["c"], {"CENG": {"1": [["5710140", "1", "5710213", "1"]]}})
+        read_json_if_changed.assert_called_once_with("musts.json", None)
+        upload_file.assert_called_once()
+
+    @patch("app.pipelines.section_conflicts.read_json_if_changed", return_value=(True, None, None))
+    def test_run_section_conflicts_without_masks_raises(self, _read_json_if_changed) -> None:
+        """Missing stored masks should raise an explicit error."""
+        with self.assertRaises(AppError) as exc:
+            run_section_conflicts()
+        self.assertEqual(exc.exception.code, "SECTION_MASKS_UNAVAILABLE")
+
+
+class ScheduleBundlesPipelineTests(unittest.TestCase):
+    """Validate schedule bundles pipeline change detection."""
+
+    @patch("app.pipelines.schedule_bundles.delete_local_file")
+    @patch("app.pipelines.schedule_bundles.delete_file")
+    @patch("app.pipelines.schedule_bundles.upload_file")
+    @patch("app.pipelines.schedule_bundles.move_file")
+    @patch("app.pipelines.schedule_bundles.hash_content", side_effect=lambda content: "h-" + str(len(content)))
+    @patch("app.pipelines.schedule_bundles.write_json", side_effect=lambda path, data, **_kw: __file__)
+    @patch("app.pipelines.schedule_bundles.read_json")
+    @patch("app.pipelines.schedule_bundles.read_json_if_changed")
+    @patch("app.pipelines.schedule_bundles.get_settings")
+    @patch("app.pipelines.schedule_bundles.log_item")
+    def test_run_schedule_bundles_uploads_only_changed(
+        self,
+        _log_item,
+        get_settings,
+        read_json_if_changed,
+        read_json,
+        write_json,
+        _hash_content,
+        _move_file,
+        upload_file,
+        delete_file,
+        delete_local_file,
+    ) -> None:
+        """Bundles unchanged against the stored index are not re-uploaded; removed cohorts are deleted."""
+        get_settings.return_value = SimpleNamespace(
+            SCHEDULE_BUNDLE_MAX_RESULTS=5,
+            SCHEDULE_BUNDLE_SEARCH_LIMIT=10,
+            SCHEDULE_BUNDLE_TIMEOUT_SECONDS=1.0,
+        )
+        with open(__file__, "rb") as f:
+            same_hash = "h-" + str(len(f.read()))
+        stored = {
+            "musts.json": {"CENG": {"1": ["5710140"]}, "EE": {"1": ["5670101"]}},
+            "scheduleBundlesIndex.json": {"d": {"CENG": {"h": same_hash}, "OLD": {"h": "x"}}},
+        }
+        read_json_if_changed.side_effect = lambda key, etag: (True, stored.get(key), "e1")
+
+        data = {
+            "5710140": {"Sections": {"1": {"c": [{"d": "CENG"}]}}},
+            "5670101": {"Sections": {"1": {"c": [{"d": "ALL"}]}}},
+        }
+
+        run_schedule_bundles({"5710140": {"1": 0b1}, "5670101": {"1": 0b1}}, data)
+
+        uploaded = [call.args[1] for call in upload_file.call_args_list]
+        self.assertEqual(uploaded, ["scheduleBundles/EE.json", "scheduleBundlesIndex.json"])
+        index = write_json.call_args_list[-1].args[1]
+        self.assertEqual(sorted(index["d"]), ["CENG", "EE"])
+        delete_file.assert_called_once_with("scheduleBundles/OLD.json")
+        delete_local_file.assert_called_once()
+        read_json.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+"""Unit tests for opt-in pipeline profiling."""
+
+from __future__ import annotations
+
+import pstats
+import shutil
+import time
+import unittest
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.errors import AppError
+from app.core.profiling import arm_profiling, disarm_profiling, profiled, profiling_status
+
+
+def _busy(seconds: float) -> int:
+    """Spin on the CPU so the sampler sees this frame."""
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+class ProfilingTests(unittest.TestCase):
+    """Validate arming, output files, and unprofiled passthrough."""
+
+    def setUp(self) -> None:
+        base_tmp = Path(__file__).resolve().parent / ".tmp"
+        base_tmp.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir = base_tmp / f"profiling_{uuid.uuid4().hex}"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        log_dir_patch = patch("app.core.profiling.log_dir", return_value=self.tmp_dir)
+        log_dir_patch.start()
+        self.addCleanup(log_dir_patch.stop)
+        settings_patch = patch(
+            "app.core.profiling.get_settings",
+            return_value=SimpleNamespace(PROFILE_SAMPLE_INTERVAL_SECONDS=0.001),
+        )
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+        log_patch = patch("app.core.profiling.log_item")
+        log_patch.start()
+        self.addCleanup(log_patch.stop)
+
+    def tearDown(self) -> None:
+        disarm_profiling()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_sampling_run_writes_folded_stacks_and_consumes_arm(self) -> None:
+        """An armed run should produce folded stacks; the next run should be unprofiled."""
+        @profiled("scrape")
+        def run() -> str:
+            _busy(0.05)
+            return "done"
+
+        arm_profiling(["scrape"], mode="sampling", runs=1)
+        self.assertEqual(run(), "done")
+        self.assertEqual(profiling_status()["armed"], {})
+
+        files = list((self.tmp_dir / "profiles").glob("scrape-*.folded"))
+        self.assertEqual(len(files), 1)
+        lines = files[0].read_text(encoding="utf-8").splitlines()
+        self.assertTrue(lines)
+        self.assertTrue(all(line.startswith("pipeline;") and line.rsplit(" ", 1)[1].isdigit() for line in lines))
+        self.assertTrue(any("_busy" in line for line in lines))
+
+        self.assertEqual(run(), "done")
+        self.assertEqual(len(list((self.tmp_dir / "profiles").iterdir())), 1)
+
+    def test_cprofile_run_and_nested_pipeline_share_one_profile(self) -> None:
+        """A nested armed pipeline inside a profiled run should not start a second profiler."""
+        @profiled("nte_available")
+        def inner() -> None:
+            _busy(0.001)
+
+        @profiled("musts")
+        def outer() -> None:
+            inner()
+
+        arm_profiling(["musts", "nte_available"], mode="cprofile", runs=1)
+        outer()
+
+        files = list((self.tmp_dir / "profiles").iterdir())
+        self.assertEqual([path.suffix for path in files], [".prof"])
+        self.assertTrue(any(func[2] == "inner" for func in pstats.Stats(str(files[0])).stats))
+        self.assertIn("nte_available", profiling_status()["armed"])
+
+    def test_arm_rejects_invalid_options(self) -> None:
+        """Unknown pipelines, modes, and run counts should raise AppError."""
+        for pipelines, mode, runs in ((["nope"], "sampling", 1), (["scrape"], "perf", 1), (["scrape"], "sampling", 0)):
+            with self.assertRaises(AppError):
+                arm_profiling(pipelines, mode=mode, runs=runs)
+
+
+if __name__ == "__main__":
+    unittest.main()
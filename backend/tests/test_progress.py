@@ -0,0 +1,140 @@
+"""Unit tests for the progress event bus and progress routes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.routes import progress, progress_stream
+from app.core.progress import ProgressBus, ProgressTracker
+
+
+def _response_json(response: object) -> dict:
+    """Decode JSON payload from Starlette JSONResponse."""
+    body = getattr(response, "body", b"{}")
+    return json.loads(body.decode("utf-8"))
+
+
+class ProgressBusTests(unittest.TestCase):
+    """Validate buffering, cursor reads, and blocking waits."""
+
+    def test_buffer_is_bounded_and_sequence_monotonic(self) -> None:
+        """Old events should be evicted while sequence numbers keep increasing."""
+        bus = ProgressBus(capacity=3)
+        for index in range(5):
+            bus.publish("scrape", "departments", index=index)
+
+        events = bus.events_since(0)
+        self.assertEqual([event.seq for event in events], [3, 4, 5])
+        self.assertEqual([event.seq for event in bus.events_since(4)], [5])
+        self.assertEqual(bus.last_seq, 5)
+
+    def test_wait_for_events_wakes_on_publish(self) -> None:
+        """Blocked readers should return as soon as a new event arrives."""
+        bus = ProgressBus()
+        timer = threading.Timer(0.05, lambda: bus.publish("musts", "done"))
+        timer.start()
+        started = time.monotonic()
+
+        events = bus.wait_for_events(0, timeout=2.0)
+
+        timer.join()
+        self.assertEqual([event.stage for event in events], ["done"])
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(bus.wait_for_events(1, timeout=0.01), [])
+
+    def test_async_wait_wakes_on_publish_from_another_thread(self) -> None:
+        """Async readers should be woken through their loop and leave no waiter behind."""
+        bus = ProgressBus()
+
+        async def _wait() -> list:
+            timer = threading.Timer(0.05, lambda: bus.publish("scrape", "done"))
+            timer.start()
+            try:
+                return await bus.wait_for_events_async(0, timeout=2.0)
+            finally:
+                timer.join()
+
+        started = time.monotonic()
+        events = asyncio.run(_wait())
+
+        self.assertEqual([event.stage for event in events], ["done"])
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(asyncio.run(bus.wait_for_events_async(1, timeout=0.01)), [])
+        self.assertEqual(bus._waiters, set())
+
+    def test_tracker_reports_rate_and_eta(self) -> None:
+        """Tracker should attach totals, rate, and ETA to loop events."""
+        bus = ProgressBus()
+        tracker = ProgressTracker("scrape", bus=bus)
+        tracker.stage("departments")
+        tracker.advance("departments", 0, 4)
+        tracker.advance("departments", 2, 4, done=30)
+
+        first, start, middle = bus.events_since(0)
+        self.assertEqual(first.to_dict()["stage"], "departments")
+        self.assertNotIn("eta_seconds", start.to_dict())
+        self.assertEqual((middle.index, middle.total, middle.done), (2, 4, 30))
+        self.assertGreater(middle.rate, 0)
+        self.assertGreaterEqual(middle.eta_seconds, 0)
+
+
+class ProgressRoutesTests(unittest.TestCase):
+    """Validate long-poll and SSE route output."""
+
+    def setUp(self) -> None:
+        self.bus = ProgressBus()
+        self._patches = [
+            patch("app.api.routes.get_progress_bus", return_value=self.bus),
+            patch("app.api.routes.get_settings", return_value=SimpleNamespace(PROGRESS_MAX_WAIT_SECONDS=0.05)),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+    def test_long_poll_returns_events_after_cursor(self) -> None:
+        """Long-poll should return newer events and the resume cursor."""
+        self.bus.publish("scrape", "departments", index=1, total=2)
+        self.bus.publish("scrape", "done")
+
+        payload = _response_json(asyncio.run(progress(after=1, timeout=0.0)))
+        self.assertEqual(payload["last_seq"], 2)
+        self.assertEqual([event["stage"] for event in payload["events"]], ["done"])
+
+        payload = _response_json(asyncio.run(progress(after=2, timeout=10.0)))
+        self.assertEqual(payload, {"last_seq": 2, "events": []})
+
+    def test_long_poll_resets_cursor_after_restart(self) -> None:
+        """A cursor beyond the newest event should restart from the beginning."""
+        self.bus.publish("musts", "done")
+
+        payload = _response_json(asyncio.run(progress(after=99, timeout=0.0)))
+        self.assertEqual(payload["last_seq"], 1)
+
+    def test_stream_emits_sse_frames(self) -> None:
+        """SSE stream should emit id/event/data frames and keep-alive comments."""
+        self.bus.publish("scrape", "departments", index=3, total=10)
+
+        async def _read_frames() -> list[str]:
+            response = await progress_stream(after=0, last_event_id=None)
+            iterator = response.body_iterator
+            frames = [await iterator.__anext__(), await iterator.__anext__()]
+            await iterator.aclose()
+            return frames
+
+        event_frame, keepalive = asyncio.run(_read_frames())
+        self.assertTrue(event_frame.startswith("id: 1\nevent: progress\ndata: "))
+        self.assertEqual(json.loads(event_frame.split("data: ", 1)[1])["index"], 3)
+        self.assertEqual(keepalive, ": keep-alive\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
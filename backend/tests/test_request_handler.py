@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from app.api.schemas import ResponseModel, RootResponse
-from app.core.constants import RequestType
+from app.context import service as context_service
+from app.core.constants import CONTEXT_KEY, RequestType
 from app.core.errors import AppError
 from app.services import request_handler
 
@@ -21,16 +24,40 @@ class RequestHandlerTests(unittest.TestCase):
 
     def setUp(self) -> None:
         request_handler._allow_context_modification = False
-        self._status_patcher = patch("app.services.request_handler.publish_status", return_value=None)
-        self._sync_patcher = patch("app.services.request_handler.sync_status_from_locks", return_value=None)
+        self._status_patcher = patch("app.services.request_handler.publish_status_async", return_value=None)
+        self._sync_patcher = patch("app.services.request_handler.sync_status_from_locks_async", return_value=None)
+        self._heartbeat_patcher = patch("app.services.request_handler.LockHeartbeat")
+        self._next_queued_patcher = patch("app.services.request_handler.next_queued_request", return_value=None)
         self._status_patcher.start()
         self._sync_patcher.start()
+        self.heartbeat_cls = self._heartbeat_patcher.start()
+        self.heartbeat_cls.return_value.lost = False
+        self.next_queued_request = self._next_queued_patcher.start()
 
     def tearDown(self) -> None:
         request_handler._allow_context_modification = False
+        request_handler._drain_worker = None
+        self._next_queued_patcher.stop()
+        self._heartbeat_patcher.stop()
         self._sync_patcher.stop()
         self._status_patcher.stop()
 
+    def _join_drain_worker(self) -> None:
+        """Wait for the background queue drain started by the last handled request."""
+        self.assertIsNotNone(request_handler._drain_worker)
+        self.assertTrue(request_handler.wait_for_queue_drain(timeout=5.0))
+
+    def test_wait_for_queue_drain_reports_running_worker(self) -> None:
+        """Shutdown wait should succeed without a drain and time out while one is still running."""
+        self.assertTrue(request_handler.wait_for_queue_drain(timeout=0.01))
+
+        release = threading.Event()
+        request_handler._drain_worker = threading.Thread(target=release.wait, daemon=True)
+        request_handler._drain_worker.start()
+        self.assertFalse(request_handler.wait_for_queue_drain(timeout=0.01))
+        release.set()
+        self.assertTrue(request_handler.wait_for_queue_drain(timeout=5.0))
+
     @patch("app.services.request_handler.acquire_lock")
     def test_root_short_circuits_without_lock(self, acquire_lock) -> None:
         """Root request should bypass lock and pipeline orchestration."""
@@ -92,11 +119,14 @@ class RequestHandlerTests(unittest.TestCase):
         run_scrape.return_value = (_response(RequestType.SCRAPE, "DONE", "ok"), 200)
 
         model, status = request_handler.handle_request(RequestType.SCRAPE)
+        self._join_drain_worker()
 
         self.assertEqual(status, 200)
         self.assertEqual(model.extra, {"from_queue": True})
         record_success.assert_called_once_with()
         record_failure.assert_not_called()
+        self.heartbeat_cls.return_value.start.assert_called_once_with()
+        self.heartbeat_cls.return_value.stop.assert_called_once_with()
 
     @patch("app.services.request_handler.release_lock", return_value=True)
     @patch("app.services.request_handler.clear_downloaded_dir", return_value=0)
@@ -123,6 +153,7 @@ class RequestHandlerTests(unittest.TestCase):
         run_musts.return_value = (_response(RequestType.MUSTS, "ERROR", "boom"), 500)
 
         model, status = request_handler.handle_request(RequestType.MUSTS)
+        self._join_drain_worker()
 
         self.assertEqual(status, 500)
         self.assertEqual(model.status, "ERROR")
@@ -158,6 +189,102 @@ class RequestHandlerTests(unittest.TestCase):
         record_failure.assert_not_called()
         record_success.assert_not_called()
 
+    @patch("app.services.request_handler.release_lock", return_value=True)
+    @patch("app.services.request_handler.clear_downloaded_dir", return_value=0)
+    @patch("app.services.request_handler.publish_context_state")
+    @patch("app.services.request_handler.record_success")
+    @patch("app.services.request_handler.record_failure")
+    @patch("app.services.request_handler.run_musts")
+    @patch("app.services.request_handler.run_scrape")
+    @patch("app.services.request_handler.resolve_request", return_value=(False, RequestType.SCRAPE))
+    @patch("app.services.request_handler.load_context_state")
+    @patch("app.services.request_handler.acquire_lock", return_value=True)
+    def test_queue_is_drained_after_run_while_lock_held(
+        self,
+        _acquire_lock,
+        _load_context_state,
+        _resolve_request,
+        run_scrape,
+        run_musts,
+        record_failure,
+        record_success,
+        _publish_context_state,
+        _clear_downloaded_dir,
+        release_lock,
+    ) -> None:
+        """Queued requests should run after the response is returned, before the lock is released."""
+        gate = threading.Event()
+        run_scrape.return_value = (_response(RequestType.SCRAPE, "DONE", "ok"), 200)
+        run_musts.side_effect = lambda: gate.wait(5.0) and (_response(RequestType.MUSTS, "ERROR", "boom"), 500)
+        self.next_queued_request.side_effect = [RequestType.MUSTS, None]
+        release_lock.side_effect = lambda: self.assertEqual(run_musts.call_count, 1) or True
+
+        with patch("app.services.request_handler.log_item"):
+            model, status = request_handler.handle_request(RequestType.SCRAPE)
+            record_success.assert_called_once_with()
+            release_lock.assert_not_called()
+            self.assertTrue(request_handler._allow_context_modification)
+            gate.set()
+            self._join_drain_worker()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(model.request_type, RequestType.SCRAPE)
+        run_musts.assert_called_once_with()
+        record_failure.assert_called_once_with()
+        release_lock.assert_called_once_with()
+        self.heartbeat_cls.return_value.stop.assert_called_once_with()
+        self.assertFalse(request_handler._allow_context_modification)
+
+    @patch("app.services.request_handler.release_lock", return_value=True)
+    @patch("app.services.request_handler.clear_downloaded_dir", return_value=0)
+    @patch("app.services.request_handler.run_musts")
+    @patch("app.services.request_handler.run_scrape")
+    @patch("app.services.request_handler.acquire_lock", return_value=True)
+    def test_context_suspended_while_draining_is_still_published(
+        self,
+        _acquire_lock,
+        run_scrape,
+        run_musts,
+        _clear_downloaded_dir,
+        _release_lock,
+    ) -> None:
+        """A queued job that suspends the context should not keep the context from being published."""
+        run_scrape.return_value = (_response(RequestType.SCRAPE, "ERROR", "boom"), 500)
+        run_musts.return_value = (_response(RequestType.MUSTS, "ERROR", "boom"), 500)
+        self.next_queued_request.side_effect = context_service.next_queued_request
+        context_service.detach_context()
+        self.addCleanup(context_service.detach_context)
+
+        with (
+            patch("app.context.service.download_json", return_value={"queue": ["scrape", "musts"], "error_count": 0}),
+            patch("app.context.service.upload_json") as upload_json,
+            patch("app.context.service.get_settings", return_value=SimpleNamespace(CONTEXT_MAX_ERRORS=2)),
+            patch("app.context.service.log_item"),
+            patch("app.services.request_handler.log_item"),
+        ):
+            model, status = request_handler.handle_request(RequestType.SCRAPE)
+            self._join_drain_worker()
+
+        self.assertEqual(status, 500)
+        self.assertEqual(model.extra, {"from_queue": True})
+        run_musts.assert_called_once_with()
+        upload_json.assert_called_once()
+        published, key = upload_json.call_args.args
+        self.assertEqual(key, CONTEXT_KEY)
+        self.assertEqual((published["queue"], published["suspended"]), ([], True))
+        self.assertFalse(context_service._RUN_STORE.loaded)
+
+    @patch("app.services.request_handler.run_scrape")
+    def test_drain_stops_when_lease_lost(self, run_scrape) -> None:
+        """Draining should not start new jobs once the lock lease is lost."""
+        heartbeat = self.heartbeat_cls.return_value
+        heartbeat.lost = True
+        self.next_queued_request.return_value = RequestType.SCRAPE
+
+        self.assertEqual(request_handler._drain_queue(heartbeat), 0)
+        run_scrape.assert_not_called()
+        self.next_queued_request.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
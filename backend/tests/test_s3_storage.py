@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import json
+import time
 import unittest
 import uuid
 import shutil
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
 
 from app.core.errors import AppError
-from app.core.constants import S3_ADMIN_LOCK_FILE, S3_ADMIN_OP_LOCK_FILE
+from app.core.constants import S3_ADMIN_LOCK_FILE, S3_ADMIN_OP_LOCK_FILE, S3_LOCK_FILE
 from app.storage import s3
+from app.storage.s3 import api as s3_api
+from app.storage.s3 import real_backend
+from app.storage.s3 import store as s3_store
 
 
 class S3StorageTests(unittest.TestCase):
@@ -27,16 +34,22 @@ class S3StorageTests(unittest.TestCase):
             S3_LOCK_OWNER_ID="test-owner",
             S3_LOCK_TIMEOUT_SECONDS=60 * 60,
             ADMIN_LOCK_TIMEOUT_SECONDS=3 * 60 * 60,
+            S3_LOCK_CACHE_SECONDS=0.0,
         )
 
         self._patch_mock_dir = patch("app.storage.s3.common._mock_dir", return_value=self.mock_dir)
         self._patch_settings = patch("app.storage.s3.common.get_settings", return_value=self.mock_settings)
+        self._patch_lock_settings = patch("app.storage.s3.locks.get_settings", return_value=self.mock_settings)
         self._patch_mock_dir.start()
         self._patch_settings.start()
+        self._patch_lock_settings.start()
         s3._set_run_lock_held_for_tests(False)
+        s3._reset_lock_cache_for_tests()
 
     def tearDown(self) -> None:
         s3._set_run_lock_held_for_tests(False)
+        s3._reset_lock_cache_for_tests()
+        self._patch_lock_settings.stop()
         self._patch_settings.stop()
         self._patch_mock_dir.stop()
         shutil.rmtree(self.mock_dir, ignore_errors=True)
@@ -52,6 +65,82 @@ class S3StorageTests(unittest.TestCase):
         self.assertTrue(s3.acquire_lock())
         self.assertFalse(s3.acquire_lock())
 
+    def test_run_lock_not_acquired_when_other_instance_holds_it(self) -> None:
+        """A live lock written by another owner should block acquisition."""
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() + 60})
+        self.assertFalse(s3.acquire_lock())
+
+    def test_run_lock_takes_over_expired_lock(self) -> None:
+        """An expired lock should be replaced with this instance as owner."""
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() - 1})
+        self.assertTrue(s3.acquire_lock())
+        payload = json.loads((self.mock_dir / S3_LOCK_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(payload["owner"], "test-owner")
+
+    def test_create_only_write_loses_race(self) -> None:
+        """Only the first create-only write to a key should succeed."""
+        self.assertTrue(s3_store.write_json_payload_if(S3_LOCK_FILE, {"owner": "a"}, etag=None))
+        self.assertFalse(s3_store.write_json_payload_if(S3_LOCK_FILE, {"owner": "b"}, etag=None))
+        payload = json.loads((self.mock_dir / S3_LOCK_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(payload["owner"], "a")
+
+    def test_etag_matched_write_rejects_stale_etag(self) -> None:
+        """If-Match style writes should fail once the object changed underneath."""
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "a"})
+        entry = s3_store.read_json_payload_entry(S3_LOCK_FILE)
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "b"})
+
+        self.assertFalse(s3_store.write_json_payload_if(S3_LOCK_FILE, {"owner": "c"}, etag=entry.etag))
+
+    def test_renew_lock_extends_expiry(self) -> None:
+        """Renewal should push expires_at forward while ownership is intact."""
+        self.assertTrue(s3.acquire_lock())
+        path = self.mock_dir / S3_LOCK_FILE
+        before = json.loads(path.read_text(encoding="utf-8"))["expires_at"]
+        time.sleep(0.01)
+
+        self.assertTrue(s3.renew_lock())
+
+        after = json.loads(path.read_text(encoding="utf-8"))
+        self.assertGreater(after["expires_at"], before)
+        self.assertEqual(after["owner"], "test-owner")
+
+    def test_renew_lock_fails_after_takeover(self) -> None:
+        """Renewal should drop local ownership when another owner holds the lock."""
+        self.assertTrue(s3.acquire_lock())
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() + 60})
+
+        self.assertFalse(s3.renew_lock())
+        self.assertTrue(s3.release_lock())
+        self.assertTrue(s3.run_lock_exists())
+
+    def test_mock_delete_honours_check_exists(self) -> None:
+        """Mock deletes should report missing keys unless the existence check is skipped."""
+        self.assertFalse(s3_store.delete_object("files/missing.txt"))
+        self.assertTrue(s3_store.delete_object("files/missing.txt", check_exists=False))
+
+        s3_store.write_object_bytes("files/present.txt", b"x")
+        self.assertTrue(s3_store.delete_object("files/present.txt", check_exists=False))
+        self.assertFalse((self.mock_dir / "files" / "present.txt").exists())
+
+    def test_uploads_stop_once_lease_is_lost_or_lapsed(self) -> None:
+        """Publishing should fail after a lost renewal or once the local lease has expired."""
+        src = self.mock_dir / "source.txt"
+        src.write_text("data", encoding="utf-8")
+        self.assertTrue(s3.acquire_lock())
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() + 60})
+        self.assertFalse(s3.renew_lock())
+        with self.assertRaises(AppError) as exc:
+            s3.upload_file(src, "files/out.txt")
+        self.assertEqual(exc.exception.code, "LOCK_NOT_ACQUIRED")
+
+        s3_store.delete_object(S3_LOCK_FILE)
+        self.mock_settings.S3_LOCK_TIMEOUT_SECONDS = 0
+        self.assertTrue(s3.acquire_lock())
+        with self.assertRaises(AppError) as exc:
+            s3.upload_file(src, "files/out.txt")
+        self.assertEqual(exc.exception.code, "LOCK_LEASE_LOST")
+
     def test_run_lock_blocked_while_admin_lock_active(self) -> None:
         acquired = s3.admin_acquire_lock()
         self.assertTrue(acquired.get("acquired"))
@@ -89,7 +178,29 @@ class S3StorageTests(unittest.TestCase):
         (self.mock_dir / S3_ADMIN_LOCK_FILE).unlink(missing_ok=True)
 
         self.assertFalse(s3.admin_op_lock_exists())
-        self.assertFalse((self.mock_dir / S3_ADMIN_OP_LOCK_FILE).exists())
+        self.assertTrue((self.mock_dir / S3_ADMIN_OP_LOCK_FILE).exists())
+
+        new_token = s3.admin_acquire_lock()["token"]
+        self.assertTrue(s3.admin_acquire_op_lock(new_token))
+        self.assertTrue(s3.admin_op_lock_exists())
+
+    def test_expired_lock_is_not_deleted_on_read(self) -> None:
+        """Existence checks must leave expired locks for an ETag-matched takeover."""
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() - 1})
+
+        self.assertFalse(s3.run_lock_exists())
+        self.assertTrue((self.mock_dir / S3_LOCK_FILE).exists())
+
+    def test_release_lock_keeps_lock_replaced_after_read(self) -> None:
+        """Release should not delete a lock that changed between its read and the delete."""
+        self.assertTrue(s3.acquire_lock())
+        entry = s3_store.read_json_payload_entry(S3_LOCK_FILE)
+        s3_store.write_json_payload(S3_LOCK_FILE, {"owner": "other", "expires_at": time.time() + 60})
+
+        with patch("app.storage.s3.locks.read_json_payload_entry", return_value=entry):
+            self.assertFalse(s3.release_lock())
+        payload = json.loads((self.mock_dir / S3_LOCK_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(payload["owner"], "other")
 
     def test_upload_requires_run_lock(self) -> None:
         src = self.mock_dir / "source.txt"
@@ -107,6 +218,17 @@ class S3StorageTests(unittest.TestCase):
         self.assertTrue(Path(out).exists())
         self.assertEqual((self.mock_dir / "files" / "out.txt").read_text(encoding="utf-8"), "data")
 
+    def test_upload_json_is_guarded_and_round_trips(self) -> None:
+        with self.assertRaises(AppError) as exc:
+            s3.upload_json({"a": 1}, "context.json")
+        self.assertEqual(exc.exception.code, "LOCK_NOT_ACQUIRED")
+        self.assertIsNone(s3.download_json("context.json"))
+
+        self.assertTrue(s3.acquire_lock())
+        s3.upload_json({"a": 1}, "context.json")
+        self.assertEqual(s3.download_json("context.json"), {"a": 1})
+        self.assertTrue((self.mock_dir / "context.json").exists())
+
     def test_upload_run_blocked_by_admin_lock(self) -> None:
         src = self.mock_dir / "source.txt"
         src.write_text("data", encoding="utf-8")
@@ -143,11 +265,122 @@ class S3StorageTests(unittest.TestCase):
     def test_s3_file_exists_invalid_key_returns_false(self) -> None:
         self.assertFalse(s3.s3_file_exists("../escape.txt"))
 
+    def test_shard_keys_upload_as_public(self) -> None:
+        """Department shard keys should be uploaded as publicly readable objects."""
+        self.assertTrue(s3_api._should_upload_public("dataShards/571.json"))
+        self.assertTrue(s3_api._should_upload_public("dataIndex.json"))
+        self.assertFalse(s3_api._should_upload_public("context.json"))
+
+    def test_lock_checks_reuse_cached_reads_within_window(self) -> None:
+        """Repeated guarded uploads should not re-read lock objects inside the cache window."""
+        self.mock_settings.S3_LOCK_CACHE_SECONDS = 60.0
+        src = self.mock_dir / "source.txt"
+        src.write_text("data", encoding="utf-8")
+        self.assertTrue(s3.acquire_lock())
+
+        with patch("app.storage.s3.store.read_object_if_changed_mock", wraps=s3_store.read_object_if_changed_mock) as reads:
+            for index in range(10):
+                s3.upload_file(src, f"files/out_{index}.txt")
+        self.assertLessEqual(reads.call_count, 1)
+
+    def test_conditional_read_reuses_payload_when_unchanged(self) -> None:
+        """Lock reads past the window should reuse the cached payload when ETag matches."""
+        s3.admin_acquire_lock()
+        first = s3_store.read_json_payload(S3_ADMIN_LOCK_FILE)
+        with patch("app.storage.s3.store._decode_json_payload") as decode:
+            second = s3_store.read_json_payload(S3_ADMIN_LOCK_FILE)
+        decode.assert_not_called()
+        self.assertEqual(first, second)
+
     def test_delete_requires_lock(self) -> None:
         with self.assertRaises(AppError) as exc:
             s3.delete_file("files/any.txt")
         self.assertEqual(exc.exception.code, "LOCK_NOT_ACQUIRED")
 
+    def test_mirror_serves_unchanged_objects_from_disk(self) -> None:
+        """Mirror should re-download only when the object ETag changes, and drop deleted keys."""
+        key = "files/data.json"
+        (self.mock_dir / "files").mkdir(parents=True, exist_ok=True)
+        (self.mock_dir / key).write_text('{"v": 1}', encoding="utf-8")
+        mirror_root = self.mock_dir / "mirror"
+
+        with patch("app.storage.s3.mirror._mirror_root", return_value=mirror_root):
+            local = s3.mirror_file(key)
+            self.assertEqual(local.read_text(encoding="utf-8"), '{"v": 1}')
+
+            with patch("app.storage.s3.mirror.read_object_if_changed", wraps=s3_store.read_object_if_changed) as reads:
+                self.assertEqual(s3.mirror_file(key), local)
+            self.assertEqual(reads.call_args.args[1], json.loads((mirror_root / "index.json").read_text())[key]["etag"])
+            self.assertIsNotNone(reads.call_args.args[1])
+
+            (self.mock_dir / key).write_text('{"v": 2}', encoding="utf-8")
+            self.assertEqual(s3.mirror_file(key).read_text(encoding="utf-8"), '{"v": 2}')
+
+            (self.mock_dir / key).unlink()
+            with self.assertRaises(AppError) as exc:
+                s3.mirror_file(key)
+            self.assertEqual(exc.exception.code, "DOWNLOAD_FILE_FAILED")
+            self.assertFalse(local.exists())
+
+
+class RealBackendConditionalTests(unittest.TestCase):
+    """Validate ETag-based reads and HEAD-free deletes against a stub S3 client."""
+
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self._patches = [
+            patch("app.storage.s3.real_backend._get_s3_client", return_value=self.client),
+            patch("app.storage.s3.real_backend._s3_bucket", return_value="bucket"),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+    def test_read_object_if_changed_sends_if_none_match(self) -> None:
+        """A matching ETag should surface as not-modified without a body."""
+        self.client.get_object.side_effect = ClientError({"Error": {"Code": "304"}}, "GetObject")
+
+        modified, content, etag = real_backend.read_object_if_changed("lockfile.lock", '"abc"')
+
+        self.assertFalse(modified)
+        self.assertIsNone(content)
+        self.assertEqual(etag, '"abc"')
+        self.assertEqual(self.client.get_object.call_args.kwargs["IfNoneMatch"], '"abc"')
+
+    def test_conditional_put_uses_if_none_match_for_create(self) -> None:
+        """Create-only writes should send If-None-Match and map 412 to None."""
+        self.client.put_object.side_effect = ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+
+        result = real_backend.write_object_bytes_if("lockfile.lock", b"{}", etag=None)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.client.put_object.call_args.kwargs["IfNoneMatch"], "*")
+
+    def test_conditional_put_uses_if_match_for_replace(self) -> None:
+        """Replacing writes should send If-Match and return the new ETag."""
+        self.client.put_object.return_value = {"ETag": '"new"'}
+
+        result = real_backend.write_object_bytes_if("lockfile.lock", b"{}", etag='"old"')
+
+        self.assertEqual(result, '"new"')
+        self.assertEqual(self.client.put_object.call_args.kwargs["IfMatch"], '"old"')
+
+    def test_delete_without_exists_check_skips_head(self) -> None:
+        """check_exists=False should issue a single delete_object call."""
+        self.assertTrue(real_backend.delete_object("lockfile.lock", check_exists=False))
+        self.client.head_object.assert_not_called()
+        self.client.delete_object.assert_called_once()
+
+    def test_conditional_delete_uses_if_match(self) -> None:
+        """ETag-matched deletes should send If-Match and map 412 to False."""
+        self.client.delete_object.side_effect = ClientError({"Error": {"Code": "PreconditionFailed"}}, "DeleteObject")
+
+        self.assertFalse(real_backend.delete_object_if("lockfile.lock", etag='"old"'))
+        self.assertEqual(self.client.delete_object.call_args.kwargs["IfMatch"], '"old"')
+
 
 if __name__ == "__main__":
     unittest.main()
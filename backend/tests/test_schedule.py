@@ -0,0 +1,284 @@
+"""Unit tests for section occupancy masks, the schedule search engine, and the schedule route."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.routes import catalog_schedules
+from app.api.schemas import ScheduleRequest
+from app.catalog import service as catalog_service
+from app.catalog.index import CatalogIndex
+from app.schedule import service
+from app.schedule.bundles import build_cohort_bundle, build_department_bundles, schedule_rank
+from app.schedule.conflicts import build_conflict_index
+from app.schedule.engine import CourseChoice, generate_schedules
+from app.schedule.occupancy import (
+    SLOTS_PER_DAY,
+    build_section_masks,
+    decode_section_masks,
+    encode_section_masks,
+    interval_mask,
+    section_mask,
+)
+
+
+def _response_json(response: object) -> dict:
+    """Decode JSON payload from Starlette JSONResponse."""
+    body = getattr(response, "body", b"{}")
+    return json.loads(body.decode("utf-8"))
+
+
+def _lecture(day: int, start: str, end: str) -> dict:
+    """Build one data.json lecture time entry."""
+    return {"p": "", "s": start, "e": end, "d": day}
+
+
+def _data() -> dict:
+    """Build data.json-shaped sample catalog with lecture times and criteria."""
+    return {
+        "5710140": {
+            "Course Code": "5710140",
+            "Course Name": "CENG140 - C Programming",
+            "Sections": {
+                "1": {"i": [], "c": [{"d": "CENG", "s": "AA", "e": "KZ"}], "t": [_lecture(0, "9:40", "11:30")]},
+                "2": {"i": [], "c": [{"d": "CENG", "s": "LA", "e": "ZZ"}], "t": [_lecture(1, "9:40", "11:30")]},
+            },
+        },
+        "5710213": {
+            "Course Code": "5710213",
+            "Course Name": "CENG213 - Data Structures",
+            "Sections": {
+                "1": {"i": [], "c": [{"d": "ALL", "s": "AA", "e": "ZZ"}], "t": [_lecture(0, "10:40", "12:30")]},
+                "2": {"i": [], "c": [{"d": "ALL", "s": "AA", "e": "ZZ"}], "t": [_lecture(2, "13:40", "15:30")]},
+            },
+        },
+    }
+
+
+class OccupancyMaskTests(unittest.TestCase):
+    """Validate slot layout and mask encoding."""
+
+    def test_intervals_are_half_open(self) -> None:
+        """Back-to-back lectures should not clash; overlapping ones should."""
+        first = interval_mask(0, 9 * 60 + 40, 10 * 60 + 30)
+        adjacent = interval_mask(0, 10 * 60 + 30, 11 * 60 + 20)
+        overlapping = interval_mask(0, 10 * 60 + 25, 11 * 60)
+        other_day = interval_mask(1, 9 * 60 + 40, 10 * 60 + 30)
+
+        self.assertEqual(first & adjacent, 0)
+        self.assertNotEqual(first & overlapping, 0)
+        self.assertEqual(first & other_day, 0)
+        self.assertEqual(other_day >> SLOTS_PER_DAY, first)
+        self.assertEqual(interval_mask(7, 0, 60), 0)
+
+    def test_section_masks_round_trip(self) -> None:
+        """Encoded masks should decode to the same values; malformed times are skipped."""
+        masks = build_section_masks(_data())
+        self.assertEqual(masks["5710140"]["1"], section_mask(_data()["5710140"]["Sections"]["1"]))
+        self.assertEqual(section_mask({"t": [_lecture(0, "", "10:30")]}), 0)
+
+        payload = json.loads(json.dumps(encode_section_masks(masks)))
+        self.assertEqual(decode_section_masks(payload), masks)
+        self.assertIsNone(decode_section_masks({**payload, "v": 0}))
+        self.assertIsNone(decode_section_masks(None))
+
+    def test_conflict_index_lists_clashing_cohort_pairs(self) -> None:
+        """Only clashing pairs within one musts semester should be listed, once each."""
+        masks = build_section_masks(_data())
+        musts = {"CENG": {"1": ["5710213", "5710140", "9999999"], "2": ["5710140"]}, "EE": {"1": []}}
+
+        index = build_conflict_index(masks, musts)
+
+        self.assertEqual(index["c"], {"CENG": {"1": [["5710140", "1", "5710213", "1"]]}})
+
+
+class ScheduleEngineTests(unittest.TestCase):
+    """Validate pruned search results, limits and deadlines."""
+
+    def test_conflicting_sections_are_excluded(self) -> None:
+        """Only clash-free combinations should be returned."""
+        masks = build_section_masks(_data())
+        courses = [CourseChoice("5710140", masks["5710140"]), CourseChoice("5710213", masks["5710213"])]
+
+        result = generate_schedules(courses)
+
+        self.assertTrue(result.exhausted)
+        self.assertEqual(
+            sorted(result.schedules),
+            [[("5710140", "1"), ("5710213", "2")], [("5710140", "2"), ("5710213", "1")], [("5710140", "2"), ("5710213", "2")]],
+        )
+
+    def test_blocked_slots_collision_toggle_and_grouping(self) -> None:
+        """Blocked slots prune sections; check_collision=False ignores clashes; equal masks expand."""
+        mask = interval_mask(0, 600, 660)
+        blocked = generate_schedules([CourseChoice("A", {"1": mask, "2": interval_mask(1, 600, 660)})], blocked_mask=mask)
+        self.assertEqual(blocked.schedules, [[("A", "2")]])
+
+        free = generate_schedules([CourseChoice("A", {"1": mask}), CourseChoice("B", {"1": mask}, check_collision=False)])
+        self.assertEqual(free.schedules, [[("A", "1"), ("B", "1")]])
+
+        grouped = generate_schedules([CourseChoice("A", {"1": mask, "2": mask, "3": mask})])
+        self.assertEqual(sorted(grouped.schedules), [[("A", "1")], [("A", "2")], [("A", "3")]])
+        self.assertEqual(grouped.visited, 2)
+
+    def test_limit_and_timeout_stop_search(self) -> None:
+        """Searches should stop at the result limit and report timeouts."""
+        courses = [CourseChoice(str(i), {str(s): 0 if s == 0 else 1 << (i * 10 + s) for s in range(6)}) for i in range(8)]
+
+        limited = generate_schedules(courses, limit=5)
+        self.assertEqual(len(limited.schedules), 5)
+        self.assertFalse(limited.exhausted)
+        self.assertFalse(limited.timed_out)
+
+        timed = generate_schedules(courses, limit=10**9, timeout=0.0)
+        self.assertTrue(timed.timed_out)
+        self.assertFalse(timed.exhausted)
+
+
+class ScheduleBundleTests(unittest.TestCase):
+    """Validate cohort bundle ranking and capping."""
+
+    def test_rank_prefers_fewer_days_then_fewer_gaps(self) -> None:
+        """Compact single-day schedules should rank before spread-out ones."""
+        morning = interval_mask(0, 540, 600)
+        compact = morning | interval_mask(0, 600, 660)
+        gapped = morning | interval_mask(0, 720, 780)
+        two_days = morning | interval_mask(1, 540, 600)
+
+        self.assertEqual(schedule_rank(compact), (1, 0))
+        self.assertEqual(schedule_rank(gapped), (1, 24))
+        self.assertLess(schedule_rank(gapped), schedule_rank(two_days))
+        self.assertEqual(schedule_rank(0), (0, 0))
+
+    def test_cohort_bundle_is_ranked_and_capped(self) -> None:
+        """Bundles should list clash-free section choices best-first, up to the limit."""
+        masks = build_section_masks(_data())
+
+        bundle = build_cohort_bundle(["5710213", "5710140", "9999999"], masks, limit=2, search_limit=100, timeout=1.0)
+
+        self.assertEqual(bundle["c"], ["5710213", "5710140"])
+        self.assertEqual(bundle["s"], [["1", "2"], ["2", "1"]])
+        self.assertTrue(bundle["x"])
+        self.assertIsNone(build_cohort_bundle(["9999999"], masks, limit=2, search_limit=100, timeout=1.0))
+
+    def test_department_bundles_skip_sections_closed_to_the_cohort(self) -> None:
+        """Sections whose criteria exclude the cohort's department should not appear in its bundle."""
+        masks = build_section_masks(_data())
+        musts = {"CENG": {"2": ["5710140", "5710213"]}, "EE": {"2": ["5710140", "5710213"]}}
+
+        bundles = build_department_bundles(masks, musts, _data(), limit=10, search_limit=100, timeout=1.0)
+
+        self.assertEqual(sorted(bundles["CENG"]["2"]["s"]), [["1", "2"], ["2", "1"], ["2", "2"]])
+        self.assertNotIn("5710140", bundles["EE"]["2"]["c"])
+        self.assertEqual(bundles["EE"]["2"]["s"], [["1"], ["2"]])
+
+    def test_department_bundles_accept_integer_keyed_data(self) -> None:
+        """In-memory scrape output keyed by integer codes should yield the same bundles."""
+        masks = build_section_masks(_data())
+        musts = {"CENG": {"2": ["5710140", "5710213"]}}
+        data = {int(code): node for code, node in _data().items()}
+
+        bundles = build_department_bundles(masks, musts, data, limit=10, search_limit=100, timeout=1.0)
+
+        self.assertEqual(sorted(bundles["CENG"]["2"]["s"]), [["1", "2"], ["2", "1"], ["2", "2"]])
+
+
+class ScheduleServiceTests(unittest.TestCase):
+    """Validate criteria filtering, caching and the schedule route."""
+
+    def setUp(self) -> None:
+        service.clear_schedule_cache()
+        self.index = CatalogIndex(_data(), {"571": {"n": "Computer Engineering", "p": "CENG"}}, None)
+        self.settings = SimpleNamespace(
+            CATALOG_REFRESH_SECONDS=60.0,
+            SCHEDULE_MAX_RESULTS=500,
+            SCHEDULE_MAX_COURSES=12,
+            SCHEDULE_TIMEOUT_SECONDS=2.0,
+            SCHEDULE_CACHE_SIZE=4,
+        )
+        self.mask_reads = 0
+        self.masks_etag = "m1"
+        self._patches = [
+            patch("app.schedule.service._MASKS", service._MaskTable()),
+            patch("app.schedule.service.get_settings", return_value=self.settings),
+            patch("app.api.routes.get_settings", return_value=self.settings),
+            patch("app.schedule.service.get_catalog_index", return_value=self.index),
+            patch("app.schedule.service.read_json_if_changed", side_effect=self._masks_read),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        service.clear_schedule_cache()
+
+    def _masks_read(self, key: str, etag: str | None) -> tuple[bool, dict | None, str]:
+        """Answer conditional reads with precomputed masks for the sample catalog."""
+        self.mask_reads += 1
+        if etag == self.masks_etag:
+            return False, None, etag
+        return True, encode_section_masks(build_section_masks(_data())), self.masks_etag
+
+    def test_route_filters_by_criteria_and_caches(self) -> None:
+        """Department/surname criteria should restrict sections and repeated queries hit the cache."""
+        body = ScheduleRequest(
+            courses=[{"code": "CENG140"}, {"code": "5710213"}],
+            surname="Çelik",
+            department="CENG",
+        )
+        response = catalog_schedules(body)
+        payload = _response_json(response)["data"]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(payload["exhausted"])
+        self.assertEqual(
+            payload["schedules"],
+            [[{"code": "5710140", "section": "1"}, {"code": "5710213", "section": "2"}]],
+        )
+
+        catalog_schedules(body)
+        self.assertEqual(self.mask_reads, 1)
+
+    def test_cached_results_are_dropped_when_catalog_or_masks_change(self) -> None:
+        """A rebuilt catalog index or republished masks should not be served earlier results."""
+        query = service.ScheduleQuery(courses=(service.CourseRequest(code="5710140"),))
+        with patch("app.schedule.service.generate_schedules", wraps=generate_schedules) as search:
+            service.find_schedules(query)
+            service.find_schedules(query)
+            self.assertEqual(search.call_count, 1)
+
+            catalog_service.reset_catalog_index()
+            service.find_schedules(query)
+            self.assertEqual(search.call_count, 2)
+
+            self.masks_etag, service._MASKS.checked_at = "m2", None
+            service.find_schedules(query)
+            self.assertEqual(search.call_count, 3)
+
+    def test_route_maps_errors(self) -> None:
+        """Unknown courses map to 404; invalid blocks and too many courses to 400."""
+        self.assertEqual(catalog_schedules(ScheduleRequest(courses=[{"code": "CENG999"}])).status_code, 404)
+
+        bad_block = ScheduleRequest(courses=[{"code": "CENG140"}], dont_fill=[{"d": 0, "s": "x", "e": "10:00"}])
+        self.assertEqual(catalog_schedules(bad_block).status_code, 400)
+
+        self.settings.SCHEDULE_MAX_COURSES = 1
+        too_many = ScheduleRequest(courses=[{"code": "CENG140"}, {"code": "CENG213"}])
+        self.assertEqual(catalog_schedules(too_many).status_code, 400)
+
+    def test_surname_ranges_use_turkish_alphabet(self) -> None:
+        """Turkish letters should sort between their Latin neighbours."""
+        section = {"c": [{"d": "ALL", "s": "CA", "e": "CZ"}]}
+        course = service.CourseRequest(code="5710140")
+
+        self.assertTrue(service.section_allowed(section, course, surname="cevik", department=None))
+        self.assertFalse(service.section_allowed(section, course, surname="Çelik", department=None))
+        self.assertTrue(service.section_allowed(section, service.CourseRequest(code="x", check_surname=False), surname="Çelik", department=None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Unit tests for the in-process refresh scheduler."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.schemas import ResponseModel
+from app.core.constants import RequestType
+from app.core.errors import AppError
+from app.services.scheduler import CronSchedule, RefreshScheduler, in_registration_window
+
+
+def _settings(**overrides) -> SimpleNamespace:
+    """Build scheduler settings stub."""
+    values = {
+        "SCHEDULER_CRON": {"scrape": "0 */6 * * *", "musts": "30 4 * * 1"},
+        "SCHEDULER_REGISTRATION_CRON": {"scrape": "*/20 * * * *"},
+        "SCHEDULER_REGISTRATION_WINDOWS": [],
+        "SCHEDULER_JITTER_SECONDS": 0,
+        "TIMEZONE": "Europe/Istanbul",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class CronScheduleTests(unittest.TestCase):
+    """Validate cron parsing and next-fire computation."""
+
+    def test_next_after_steps_and_ranges(self) -> None:
+        """Step and range fields should produce the next matching minute."""
+        schedule = CronSchedule("*/20 9-17 * * *")
+        self.assertEqual(schedule.next_after(datetime(2026, 3, 2, 9, 5)), datetime(2026, 3, 2, 9, 20))
+        self.assertEqual(schedule.next_after(datetime(2026, 3, 2, 17, 40)), datetime(2026, 3, 3, 9, 0))
+
+    def test_weekday_and_month_rollover(self) -> None:
+        """Weekday fields use Sunday=0 and month rollover crosses year boundaries."""
+        monday = CronSchedule("30 4 * * 1")
+        self.assertEqual(monday.next_after(datetime(2026, 3, 4, 0, 0)), datetime(2026, 3, 9, 4, 30))
+
+        january = CronSchedule("0 0 1 1 *")
+        self.assertEqual(january.next_after(datetime(2026, 6, 1)), datetime(2027, 1, 1, 0, 0))
+
+    def test_restricted_day_fields_match_either(self) -> None:
+        """With both day fields restricted, either one matching is enough."""
+        schedule = CronSchedule("0 12 15 * 0")
+        self.assertEqual(schedule.next_after(datetime(2026, 3, 2)), datetime(2026, 3, 8, 12, 0))
+        self.assertEqual(schedule.next_after(datetime(2026, 3, 14, 13, 0)), datetime(2026, 3, 15, 12, 0))
+
+    def test_invalid_expression_raises_app_error(self) -> None:
+        """Malformed expressions should raise SCHEDULER_CRON_INVALID."""
+        for expression in ("* * * *", "61 * * * *", "*/0 * * * *", "a * * * *"):
+            with self.assertRaises(AppError) as ctx:
+                CronSchedule(expression)
+            self.assertEqual(ctx.exception.code, "SCHEDULER_CRON_INVALID")
+
+    def test_registration_window_is_inclusive(self) -> None:
+        """Window bounds should be inclusive and malformed entries ignored."""
+        windows = ["bad", "2026-02-09/2026-02-20"]
+        self.assertTrue(in_registration_window(date(2026, 2, 9), windows))
+        self.assertTrue(in_registration_window(date(2026, 2, 20), windows))
+        self.assertFalse(in_registration_window(date(2026, 2, 21), windows))
+
+
+class RefreshSchedulerTests(unittest.TestCase):
+    """Validate planning, registration overrides, and lock-aware ticks."""
+
+    def setUp(self) -> None:
+        self._settings_patcher = patch("app.services.scheduler.get_settings", return_value=_settings())
+        self.get_settings = self._settings_patcher.start()
+        self._log_patcher = patch("app.services.scheduler.log_item")
+        self.log_item = self._log_patcher.start()
+
+    def tearDown(self) -> None:
+        self._log_patcher.stop()
+        self._settings_patcher.stop()
+
+    def test_plan_uses_registration_cron_inside_window(self) -> None:
+        """Registration windows should switch to the faster override schedule."""
+        now = datetime(2026, 2, 10, 8, 5)
+        scheduler = RefreshScheduler()
+        self.assertEqual(scheduler.plan(now)[RequestType.SCRAPE].scheduled_for, datetime(2026, 2, 10, 12, 0))
+
+        self.get_settings.return_value = _settings(SCHEDULER_REGISTRATION_WINDOWS=["2026-02-09/2026-02-20"])
+        planned = scheduler.plan(now)
+        self.assertEqual(planned[RequestType.SCRAPE].scheduled_for, datetime(2026, 2, 10, 8, 20))
+        self.assertEqual(planned[RequestType.MUSTS].expression, "30 4 * * 1")
+
+    def test_plan_applies_jitter_and_drops_disabled_types(self) -> None:
+        """Fire time should be delayed by at most the jitter; empty expressions disable a type."""
+        self.get_settings.return_value = _settings(
+            SCHEDULER_CRON={"scrape": "0 * * * *", "musts": "", "root": "* * * * *"},
+            SCHEDULER_JITTER_SECONDS=90,
+        )
+        planned = RefreshScheduler().plan(datetime(2026, 2, 10, 8, 5))
+
+        self.assertEqual(set(planned), {RequestType.SCRAPE})
+        run = planned[RequestType.SCRAPE]
+        self.assertGreaterEqual(run.fire_at, run.scheduled_for)
+        self.assertLessEqual(run.fire_at, run.scheduled_for + timedelta(seconds=90))
+
+    def test_invalid_expression_logged_once(self) -> None:
+        """Invalid expressions should be skipped and logged only once."""
+        self.get_settings.return_value = _settings(SCHEDULER_CRON={"scrape": "bad"})
+        scheduler = RefreshScheduler()
+        scheduler.plan(datetime(2026, 2, 10))
+        scheduler.plan(datetime(2026, 2, 10))
+
+        self.assertEqual(scheduler.plan(datetime(2026, 2, 10)), {})
+        self.assertEqual(self.log_item.call_count, 1)
+
+    @patch("app.services.scheduler.handle_request")
+    @patch("app.services.scheduler.admin_lock_exists", return_value=False)
+    @patch("app.services.scheduler.run_lock_exists", return_value=True)
+    def test_tick_skips_when_run_lock_held(self, _run_lock_exists, _admin_lock_exists, handle_request) -> None:
+        """A held run lock should skip the tick without calling the handler."""
+        self.assertFalse(RefreshScheduler().tick(RequestType.SCRAPE))
+        handle_request.assert_not_called()
+
+    @patch("app.services.scheduler.handle_request")
+    @patch("app.services.scheduler.admin_lock_exists", return_value=False)
+    @patch("app.services.scheduler.run_lock_exists", return_value=False)
+    def test_tick_runs_request_when_idle(self, _run_lock_exists, _admin_lock_exists, handle_request) -> None:
+        """With no locks held the request should be dispatched."""
+        handle_request.return_value = (
+            ResponseModel(request_type=RequestType.MUSTS, status="SUCCESS", message="ok"),
+            200,
+        )
+        self.assertTrue(RefreshScheduler().tick(RequestType.MUSTS))
+        handle_request.assert_called_once_with(RequestType.MUSTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Unit tests for the compact columnar catalog encoding."""
+
+from __future__ import annotations
+
+import json
+import unittest
+
+from app.core.errors import AppError
+from app.scrape.compact import decode_compact_catalog, encode_compact_catalog
+
+
+def _sample_data() -> dict[int, dict]:
+    """Build a small data.json-shaped catalog with repeated strings."""
+    return {
+        5710140: {
+            "Course Code": "5710140",
+            "Course Name": "CENG140 - C Programming",
+            "Sections": {
+                "1": {
+                    "i": ["JOHN DOE", ""],
+                    "c": [{"d": "ALL", "s": "AA", "e": "ZZ"}],
+                    "t": [
+                        {"p": "BMB1", "s": "08:40", "e": "10:30", "d": 0},
+                        {"p": "BMB1", "s": "13:40", "e": "15:30", "d": 2},
+                    ],
+                },
+                "2": {
+                    "i": ["JOHN DOE", "JANE ROE"],
+                    "c": [],
+                    "t": [{"p": "", "s": "9:40", "e": "", "d": 4}],
+                },
+            },
+        },
+        2360201: {
+            "Course Code": "2360201",
+            "Course Name": "2360201 - No Prefix",
+            "Sections": {},
+        },
+    }
+
+
+class CompactCatalogTests(unittest.TestCase):
+    """Validate compact encoding round-trip and layout properties."""
+
+    def test_round_trip_matches_json_artifact(self) -> None:
+        """Decoding the compact payload should reproduce data.json exactly."""
+        data = _sample_data()
+        expected = json.loads(json.dumps(data, ensure_ascii=False))
+
+        encoded = json.loads(json.dumps(encode_compact_catalog(data), separators=(",", ":")))
+        decoded = decode_compact_catalog(encoded)
+
+        self.assertEqual(decoded, expected)
+
+    def test_strings_are_interned_and_times_packed(self) -> None:
+        """Repeated strings should be stored once and canonical times as minutes."""
+        encoded = encode_compact_catalog(_sample_data())
+
+        self.assertEqual(encoded["strings"].count("JOHN DOE"), 1)
+        self.assertEqual(encoded["strings"].count("BMB1"), 1)
+        self.assertEqual(encoded["times"]["s"][:2], [8 * 60 + 40, 13 * 60 + 40])
+        self.assertLess(encoded["times"]["s"][2], 0)
+        self.assertEqual(encoded["courses"]["k"], [2360201, 5710140])
+        self.assertEqual(encoded["courses"]["so"], [0, 0, 2])
+
+    def test_decode_rejects_unknown_version(self) -> None:
+        """Unknown layout versions should raise a decode AppError."""
+        encoded = encode_compact_catalog(_sample_data())
+        encoded["v"] = 99
+
+        with self.assertRaises(AppError) as ctx:
+            decode_compact_catalog(encoded)
+        self.assertEqual(ctx.exception.code, "DECODE_COMPACT_CATALOG_FAILED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Unit tests for per-department data shard helpers."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.pipelines import scrape
+from app.scrape.shards import build_department_shards, build_shard_index, changed_shards, removed_shards, shard_key
+
+
+def _course(code: str) -> dict:
+    """Build a minimal course node for shard tests."""
+    return {"Course Code": code, "Course Name": f"{code} - Test", "Sections": {}}
+
+
+class ScrapeShardTests(unittest.TestCase):
+    """Validate shard splitting, index versioning, and change detection."""
+
+    def test_build_department_shards_groups_by_prefix(self) -> None:
+        """Courses should be grouped by the first three digits of their numeric code."""
+        data = {
+            5710140: _course("5710140"),
+            2360201: _course("2360201"),
+            5710111: _course("5710111"),
+        }
+
+        shards = build_department_shards(data)
+
+        self.assertEqual(set(shards), {"571", "236"})
+        self.assertEqual(list(shards["571"]), [5710111, 5710140])
+        self.assertEqual(list(shards["236"]), [2360201])
+
+    def test_build_shard_index_bumps_version_only_on_hash_change(self) -> None:
+        """Unchanged shards keep their version; changed ones increment; new ones start at 1."""
+        previous = {
+            "d": {
+                "571": {"k": shard_key("571"), "h": "aaa", "v": 3, "n": 2},
+                "236": {"k": shard_key("236"), "h": "bbb", "v": 1, "n": 1},
+            }
+        }
+
+        entries = build_shard_index(
+            {"571": "aaa", "236": "ccc", "120": "ddd"},
+            {"571": 2, "236": 1, "120": 5},
+            previous,
+        )
+
+        self.assertEqual(entries["571"]["v"], 3)
+        self.assertEqual(entries["236"]["v"], 2)
+        self.assertEqual(entries["120"]["v"], 1)
+        self.assertEqual(entries["120"]["k"], "dataShards/120.json")
+        self.assertEqual(entries["120"]["n"], 5)
+        self.assertEqual(sorted(changed_shards(entries, previous)), ["120", "236"])
+
+    def test_build_shard_index_without_previous_index(self) -> None:
+        """Missing previous index should mark every shard as new."""
+        entries = build_shard_index({"571": "aaa"}, {"571": 1}, {})
+
+        self.assertEqual(entries["571"]["v"], 1)
+        self.assertEqual(changed_shards(entries, {}), ["571"])
+
+    def test_removed_shards_lists_departments_missing_from_new_index(self) -> None:
+        """Departments only in the previous index should be reported as removed."""
+        previous = {"d": {"571": {"h": "aaa"}, "236": {"h": "bbb"}}}
+
+        self.assertEqual(removed_shards({"571": {"h": "aaa"}}, previous), ["236"])
+        self.assertEqual(removed_shards({"571": {"h": "aaa"}}, {}), [])
+
+
+class PublishDepartmentShardsTests(unittest.TestCase):
+    """Validate shard publishing inside the scrape pipeline."""
+
+    def setUp(self) -> None:
+        base_tmp = Path(__file__).resolve().parent / ".tmp"
+        base_tmp.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir = base_tmp / f"shards_{uuid.uuid4().hex}"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.stored_index: dict | None = None
+        self.delete_file = MagicMock(return_value=True)
+        self._patches = [
+            patch("app.pipelines.scrape.read_json_if_changed", side_effect=lambda key, etag: (True, self.stored_index, None)),
+            patch("app.pipelines.scrape.delete_file", self.delete_file),
+            patch("app.pipelines.scrape.staged_path", side_effect=lambda name: self.tmp_dir / "staged" / name),
+            patch("app.pipelines.scrape.published_path", side_effect=lambda name: self.tmp_dir / "published" / name),
+            patch("app.pipelines.scrape.log_item"),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_second_publish_uploads_only_changed_shards(self) -> None:
+        """Re-publishing identical shards should only upload the index."""
+        data = {5710140: _course("5710140"), 2360201: _course("2360201")}
+        info = {"t": "20251:2025-2026 Fall", "u": "01.10.2025, 10.00"}
+
+        with patch("app.pipelines.scrape.upload_file") as upload_file:
+            scrape._publish_department_shards(data, info)
+        first_keys = sorted(call.args[1] for call in upload_file.call_args_list)
+        self.assertEqual(first_keys, ["dataIndex.json", "dataShards/236.json", "dataShards/571.json"])
+
+        index = json.loads((self.tmp_dir / "published" / "dataIndex.json").read_text(encoding="utf-8"))
+        self.assertEqual(index["t"], info["t"])
+        self.assertEqual(set(index["d"]), {"571", "236"})
+        self.assertTrue((self.tmp_dir / "published" / "dataShards" / "571.json").exists())
+
+        data[5710140]["Course Name"] = "5710140 - Changed"
+        with patch("app.pipelines.scrape.upload_file") as upload_file:
+            scrape._publish_department_shards(data, info)
+        second_keys = sorted(call.args[1] for call in upload_file.call_args_list)
+        self.assertEqual(second_keys, ["dataIndex.json", "dataShards/571.json"])
+
+        index = json.loads((self.tmp_dir / "published" / "dataIndex.json").read_text(encoding="utf-8"))
+        self.assertEqual(index["d"]["571"]["v"], 2)
+        self.assertEqual(index["d"]["236"]["v"], 1)
+        self.delete_file.assert_not_called()
+
+    def test_publish_continues_stored_versions_and_deletes_removed_shards(self) -> None:
+        """The stored index should drive versions on a fresh machine; dropped departments are deleted."""
+        self.stored_index = {
+            "d": {
+                "571": {"k": shard_key("571"), "h": "old", "v": 4, "n": 1},
+                "999": {"k": shard_key("999"), "h": "gone", "v": 2, "n": 1},
+            },
+        }
+        stale_local = self.tmp_dir / "published" / shard_key("999")
+        stale_local.parent.mkdir(parents=True, exist_ok=True)
+        stale_local.write_text("{}", encoding="utf-8")
+        info = {"t": "20251:2025-2026 Fall", "u": "01.10.2025, 10.00"}
+
+        with patch("app.pipelines.scrape.upload_file"):
+            scrape._publish_department_shards({5710140: _course("5710140")}, info)
+
+        index = json.loads((self.tmp_dir / "published" / "dataIndex.json").read_text(encoding="utf-8"))
+        self.assertEqual(index["d"]["571"]["v"], 5)
+        self.assertNotIn("999", index["d"])
+        self.delete_file.assert_called_once_with(shard_key("999"))
+        self.assertFalse(stale_local.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -77,18 +77,16 @@ class SettingsAdminTests(unittest.TestCase):
         self.assertIn("LOG_LEVEL=DEBUG", content)
 
     @patch("app.services.settings_admin._settings_env_path")
-    @patch("app.services.settings_admin.get_settings")
+    @patch("app.services.settings_admin.reload_settings")
     def test_apply_settings_updates_reports_per_key_results_and_counts(
         self,
-        get_settings_mock: MagicMock,
+        reload_settings_mock: MagicMock,
         settings_env_path_mock: MagicMock,
     ) -> None:
         """Updater should report key-level outcomes and update .env for valid keys."""
         settings_env_path_mock.return_value = self.env_path
         self.env_path.write_text("# base\nHTTP_TIMEOUT=10\n", encoding="utf-8")
 
-        get_settings_mock.return_value = SimpleNamespace()
-
         updates = {
             "HTTP_TIMEOUT": 25,       # valid
             "LOG_LEVEL": "DEBUG",     # valid known key, appended if missing
@@ -113,14 +111,13 @@ class SettingsAdminTests(unittest.TestCase):
         self.assertIn("LOG_LEVEL=DEBUG", content)
         self.assertIn("# base", content)
 
-        get_settings_mock.cache_clear.assert_called_once_with()
-        self.assertGreaterEqual(get_settings_mock.call_count, 1)
+        reload_settings_mock.assert_called_once_with()
 
     @patch("app.services.settings_admin._settings_env_path")
-    @patch("app.services.settings_admin.get_settings")
+    @patch("app.services.settings_admin.reload_settings")
     def test_apply_settings_updates_skips_reload_when_nothing_applied(
         self,
-        get_settings_mock: MagicMock,
+        reload_settings_mock: MagicMock,
         settings_env_path_mock: MagicMock,
     ) -> None:
         """Updater should not touch cache reload path when all updates fail."""
@@ -140,7 +137,7 @@ class SettingsAdminTests(unittest.TestCase):
         self.assertFalse(results["ADMIN_SECRET"]["ok"])
         self.assertFalse(results["S3_LOCK_TIMEOUT_SECONDS"]["ok"])
 
-        get_settings_mock.cache_clear.assert_not_called()
+        reload_settings_mock.assert_not_called()
 
 
 if __name__ == "__main__":
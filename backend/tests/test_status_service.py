@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import time
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from app.services.status_service import compute_status_from_locks, publish_status, sync_status_from_locks
+from app.services import status_service
+from app.services.status_service import (
+    compute_status_from_locks,
+    flush_status_publisher,
+    publish_status,
+    publish_status_async,
+    publish_status_if_changed,
+    sync_status_from_locks,
+    sync_status_from_locks_async,
+)
 
 
 class StatusServiceTests(unittest.TestCase):
@@ -53,6 +64,75 @@ class StatusServiceTests(unittest.TestCase):
         sync_status_from_locks()
         publish_status_mock.assert_called_once_with("idle")
 
+    @patch("app.services.status_service.get_settings", return_value=SimpleNamespace(STATUS_REFRESH_SECONDS=300.0))
+    @patch("app.services.status_service.publish_status")
+    @patch("app.services.status_service.read_json_payload")
+    def test_publish_if_changed_skips_identical_status(self, read_json_payload, publish_status_mock, _get_settings) -> None:
+        """A recent identical status should skip the write; a different or stale one should publish."""
+        read_json_payload.return_value = {"status": "busy", "updated_at": status_service._utc_now_iso()}
+        self.assertFalse(publish_status_if_changed("busy"))
+        publish_status_mock.assert_not_called()
+
+        self.assertTrue(publish_status_if_changed("idle"))
+        publish_status_mock.assert_called_once_with("idle")
+
+        read_json_payload.return_value = {"status": "busy", "updated_at": "2020-01-01T00:00:00Z"}
+        self.assertTrue(publish_status_if_changed("busy"))
+        self.assertEqual(publish_status_mock.call_count, 2)
+
+
+class StatusPublisherTests(unittest.TestCase):
+    """Validate background status coalescing and retries."""
+
+    def setUp(self) -> None:
+        self._patches = [
+            patch(
+                "app.services.status_service.get_settings",
+                return_value=SimpleNamespace(STATUS_PUBLISH_COALESCE_SECONDS=0.05, GLOBAL_RETRIES=2, RETRY_BASE_DELAY=0.01),
+            ),
+            patch("app.services.status_service.log_item"),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+        status_service._PUBLISHER = status_service._StatusPublisher()
+
+    def tearDown(self) -> None:
+        flush_status_publisher(timeout=1.0)
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+    @patch("app.services.status_service.compute_status_from_locks", return_value="idle")
+    @patch("app.services.status_service.publish_status_if_changed", return_value=True)
+    def test_rapid_transitions_coalesce_to_latest(self, publish_if_changed, _compute) -> None:
+        """Busy followed quickly by a lock-derived sync should produce a single idle write."""
+        publish_status_async("busy")
+        sync_status_from_locks_async()
+
+        self.assertTrue(flush_status_publisher(timeout=2.0))
+        publish_if_changed.assert_called_once_with("idle")
+
+    @patch("app.services.status_service.publish_status_if_changed", return_value=True)
+    def test_submits_inside_window_do_not_end_it_early(self, publish_if_changed) -> None:
+        """Busy/idle/busy flips inside one debounce window should produce one write of the latest value."""
+        publish_status_async("busy")
+        time.sleep(0.01)
+        publish_status_async("idle")
+        time.sleep(0.01)
+        publish_status_async("busy")
+
+        self.assertTrue(flush_status_publisher(timeout=2.0))
+        publish_if_changed.assert_called_once_with("busy")
+
+    @patch("app.services.status_service.publish_status_if_changed")
+    def test_failed_write_is_retried(self, publish_if_changed) -> None:
+        """A failing write should be retried in the background until it succeeds."""
+        publish_if_changed.side_effect = [RuntimeError("s3 down"), True]
+        publish_status_async("busy")
+
+        self.assertTrue(flush_status_publisher(timeout=2.0))
+        self.assertEqual(publish_if_changed.call_count, 2)
+        self.assertEqual(publish_if_changed.call_args.args, ("busy",))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 from app.core.errors import AppError
 from app.storage import local
+from app.storage.lazy_json import open_json_lazy
 
 
 class LocalStorageTests(unittest.TestCase):
@@ -123,6 +124,39 @@ class LocalStorageTests(unittest.TestCase):
 
         self.assertEqual(removed, 0)
 
+    def test_open_json_lazy_matches_json_loads_for_indented_and_compact_files(self) -> None:
+        """Lazy reader should expose the same keys/values as json.loads for any layout."""
+        payload = {
+            "5710140": {"Course Name": "A, \"quoted\" {x}", "Sections": {"1": [1, 2.5, None]}},
+            "k\u00fc": "value: with \n newline",
+            "n": -1.5e3,
+            "t": True,
+            "e": {},
+            "l": [],
+        }
+        indented = self.tmp_dir / "indented.json"
+        local.write_json(indented, payload)
+        compact = self.tmp_dir / "compact.json"
+        compact.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+        for path in (indented, compact):
+            with open_json_lazy(path) as lazy:
+                self.assertEqual(list(lazy), list(payload))
+                self.assertEqual(dict(lazy), payload)
+                self.assertIn("5710140", lazy)
+                self.assertNotIn("missing", lazy)
+
+    def test_open_json_lazy_empty_object_and_closed_reader(self) -> None:
+        """Empty objects index to no keys; reads after close should raise AppError."""
+        path = self.tmp_dir / "empty.json"
+        path.write_text("{}", encoding="utf-8")
+        self.assertEqual(len(open_json_lazy(path)), 0)
+
+        local.write_json(path, {"a": 1})
+        lazy = open_json_lazy(path)
+        lazy.close()
+        with self.assertRaises(AppError):
+            lazy["a"]
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,110 @@
+"""Unit tests for trace spans."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.constants import LOGGER_TRACE
+from app.core.errors import AppError
+from app.core.tracing import current_span, span, traced
+from app.utils.concurrency import fetch_ordered
+
+
+class _Collect(logging.Handler):
+    """Collect exported span payloads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.spans: list[dict] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.spans.append(json.loads(record.getMessage()))
+
+
+class TracingTests(unittest.TestCase):
+    """Validate span nesting, export shape, and context propagation."""
+
+    def setUp(self) -> None:
+        self.collector = _Collect()
+        self.logger = logging.getLogger(LOGGER_TRACE)
+        self.saved = (self.logger.handlers[:], self.logger.level, self.logger.propagate)
+        self.logger.handlers = [self.collector]
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        settings_patch = patch("app.core.tracing.get_settings", return_value=SimpleNamespace(TRACE_ENABLED=True))
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+
+    def tearDown(self) -> None:
+        self.logger.handlers, level, self.logger.propagate = self.saved[0], self.saved[1], self.saved[2]
+        self.logger.setLevel(level)
+
+    def _by_name(self) -> dict[str, dict]:
+        return {item["name"]: item for item in self.collector.spans}
+
+    def test_nested_spans_link_parents_and_record_errors(self) -> None:
+        """Children should share the trace id, point at their parent, and mark failures."""
+
+        @traced("pipeline", pipeline="demo")
+        def run() -> None:
+            with span("department", dept_code="571") as dept:
+                dept.set(courses=2)
+                with self.assertRaises(AppError):
+                    with span("course"):
+                        raise AppError("boom", "COURSE_FAILED")
+
+        run()
+        spans = self._by_name()
+
+        self.assertEqual(len(spans), 3)
+        self.assertIsNone(spans["pipeline"]["parent"])
+        self.assertEqual(spans["department"]["parent"], spans["pipeline"]["span"])
+        self.assertEqual(spans["course"]["parent"], spans["department"]["span"])
+        self.assertEqual({item["trace"] for item in spans.values()}, {spans["pipeline"]["trace"]})
+        self.assertEqual(spans["department"]["attrs"], {"dept_code": "571", "courses": 2})
+        self.assertEqual(spans["course"]["status"], "error")
+        self.assertEqual(spans["course"]["error"], "COURSE_FAILED")
+        self.assertEqual(spans["pipeline"]["status"], "ok")
+        self.assertGreaterEqual(spans["pipeline"]["ms"], spans["course"]["ms"])
+        self.assertIsNone(current_span())
+
+    def test_context_propagates_to_worker_threads_and_async_tasks(self) -> None:
+        """Spans opened in fetch_ordered workers and asyncio tasks should nest under the caller."""
+
+        def fetch(key: int) -> int:
+            with span("fetch", key=key):
+                return key
+
+        async def child() -> None:
+            with span("task"):
+                await asyncio.sleep(0)
+
+        async def main() -> None:
+            await asyncio.gather(asyncio.create_task(child()), asyncio.create_task(child()))
+
+        with span("root") as root:
+            list(fetch_ordered(fetch, range(4), max_workers=2))
+            asyncio.run(main())
+
+        children = [item for item in self.collector.spans if item["name"] in ("fetch", "task")]
+        self.assertEqual(len(children), 6)
+        self.assertTrue(all(item["parent"] == root.span_id for item in children))
+        self.assertTrue(any(item["thread"].startswith("fetch") for item in children))
+
+    def test_disabled_tracing_exports_nothing(self) -> None:
+        """With TRACE_ENABLED false spans should be no-ops."""
+        with patch("app.core.tracing.get_settings", return_value=SimpleNamespace(TRACE_ENABLED=False)):
+            with span("pipeline") as current:
+                current.set(ignored=True)
+                self.assertIsNone(current_span())
+
+        self.assertEqual(self.collector.spans, [])
+
+
+if __name__ == "__main__":
+    unittest.main()